@@ -2,38 +2,29 @@ import sys
 import time
 import random
 import json
+import importlib.util
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
 
-import pandas as pd
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.markdown import Markdown
 from rich.prompt import Confirm, Prompt
 from rich.align import Align
 from rich.text import Text
+from rich.highlighter import ReprHighlighter
 from rich.theme import Theme
 from rich import box
 
-try:
-    from databridge_core import (
-        fuzzy_match_columns,
-        compare_hashes,
-        get_orphan_details,
-        get_conflict_details
-    )
-except ImportError:
+# pandas, rich.markdown and the databridge_core API are imported where they
+# are first used, so loading this module stays cheap until the tour runs.
+if importlib.util.find_spec("databridge_core") is None:
     # Fallback for running directly from examples/ without pip install
     _core_src = Path(__file__).resolve().parent.parent / "src"
     sys.path.insert(0, str(_core_src))
-    from databridge_core import (
-        fuzzy_match_columns,
-        compare_hashes,
-        get_orphan_details,
-        get_conflict_details
-    )
 
 # ---------------------------------------------------------------------------
 # Themes
@@ -68,6 +59,43 @@ TRON_THEME = Theme({
     "grid": "dim cyan",
 })
 
+# ---------------------------------------------------------------------------
+# Per-version constants (looked up once instead of re-branching per call)
+# ---------------------------------------------------------------------------
+VERSION_BOX = {"TRON": box.DOUBLE, "1985": box.ASCII, "Modern": box.ROUNDED}
+
+VERSION_HEADER_STYLE = {"TRON": "bright_cyan", "1985": "green", "Modern": "bold magenta"}
+
+VERSION_TEXT = {
+    "TRON": {
+        "no_data": "[bright_cyan]GRID ERROR: NO DATA FRAGMENTS FOUND[/bright_cyan]",
+        "s1_title": "[bright_cyan]+--- GRID SECTOR 1: DATA CORRUPTION DETECTED ---+[/bright_cyan]",
+        "s1_problem": "\nGRID ANOMALY DETECTED: DEREZZED DATA FRAGMENTS IN SAP SECTOR. METADATA CORRUPTION PRESENT.",
+        "s1_raw_title": "CORRUPTED GRID DATA",
+        "s1_read_error": "[bright_red]GRID READ FAILURE. DATA SECTOR UNREACHABLE.[/bright_red]",
+        "s1_clean_prompt": "[bright_cyan]INITIATE RECTIFICATION SEQUENCE? (Y/N)[/bright_cyan]",
+        "s2_results_title": "IDENTITY DISC CROSS-REFERENCE",
+    },
+    "1985": {
+        "no_data": "[green]ERROR: NO DATA[/green]",
+        "s1_title": "[green]*** PHASE 1: DATA INGESTION ***[/green]",
+        "s1_problem": "\nPROBLEM: A FINANCE USER EXPORTED A GLOBAL SAP COA. IT HAS 5 LINES OF HUMAN-ADDED 'GARBAGE' METADATA AT THE TOP.",
+        "s1_raw_title": "BUFFER PREVIEW",
+        "s1_read_error": "[green]READ ERROR.[/green]",
+        "s1_clean_prompt": "[green]CLEAN DATA BUFFER? (Y/N)[/green]",
+        "s2_results_title": "MAPPING RESULTS",
+    },
+    "Modern": {
+        "no_data": "[red]No data to display.[/red]",
+        "s1_title": "[bold cyan]SCENARIO 1: THE MESSY EXPORT[/bold cyan]",
+        "s1_problem": "\nPROBLEM: A finance user exported a global SAP COA. It has 5 lines of human-added 'garbage' metadata at the top.",
+        "s1_raw_title": "Raw File Content (First 8 Lines)",
+        "s1_read_error": "[red]Error reading raw file.[/red]",
+        "s1_clean_prompt": "[yellow]Can you see the '#' comment lines and inconsistent fields? Ready to clean?[/yellow]",
+        "s2_results_title": "AI-Generated Cross-Walk",
+    },
+}
+
 # ---------------------------------------------------------------------------
 # Retro 80s Easter Eggs
 # ---------------------------------------------------------------------------
@@ -86,48 +114,103 @@ RETRO_QUOTES = [
 # ---------------------------------------------------------------------------
 # Helpers — Shared
 # ---------------------------------------------------------------------------
+def _read_commented_csv(path):
+    """Read a CSV whose metadata lines start with '#', via pyarrow when available."""
+    import pandas as pd
+
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return pd.read_csv(path, comment='#')
+
+    with open(path, encoding="utf-8") as f:
+        skip = 0
+        for line in f:
+            if not line.startswith("#"):
+                break
+            skip += 1
+    try:
+        tbl = pacsv.read_csv(
+            path,
+            read_options=pacsv.ReadOptions(skip_rows=skip),
+            parse_options=pacsv.ParseOptions(ignore_empty_lines=True),
+        )
+    except pa.ArrowInvalid:
+        return pd.read_csv(path, comment='#')
+    # Drop any stray comment rows further down the file
+    is_comment = pc.fill_null(pc.starts_with(tbl.column(0).cast(pa.string()), "#"), False)
+    return tbl.filter(pc.invert(is_comment)).to_pandas()
+
+
+def _write_json(path, data):
+    """Write ``data`` as indented JSON, via orjson when it is installed.
+
+    Without orjson the document is streamed through ``json.dump`` into a
+    1 MiB write buffer rather than built as one string first.
+    """
+    try:
+        import orjson
+    except ImportError:
+        with path.open("w", buffering=1 << 20) as f:
+            json.dump(data, f, indent=2, default=str)
+        return
+    options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+    path.write_bytes(orjson.dumps(data, default=str, option=options))
+
+
+def _paced(items, interval):
+    """Yield ``items`` one per ``interval`` seconds on a monotonic schedule.
+
+    Each step sleeps until its own deadline rather than for a fixed time, so
+    render cost and sleep overshoot don't accumulate over an animation.
+    """
+    start = time.monotonic()
+    for i, item in enumerate(items, 1):
+        yield item
+        remaining = start + i * interval - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+
 def slow_type(console, text, version, delay=0.02):
-    """Simulates typing effect."""
+    """Simulates typing effect.
+
+    The styled line is built once and emitted in four chunks, sleeping for
+    each chunk's share of ``len(text) * delay``, instead of one render per
+    character.
+    """
     if version == "TRON":
-        for i, char in enumerate(text):
-            style = "bold bright_white" if i == len(text) - 1 else "bright_cyan"
-            console.print(char, end="", style=style)
-            time.sleep(delay)
-        console.print(style="bright_cyan")
+        styled = Text(text[:-1], style="bright_cyan")
+        styled.append(text[-1:], style="bold bright_white")
     else:
-        style = "green" if version == "1985" else "dim"
-        for char in text:
-            console.print(char, end="", style=style)
-            time.sleep(delay)
-        console.print()
+        styled = Text(text, style="green" if version == "1985" else "dim")
+    step = max(1, -(-len(styled) // 4))
+    for start in _paced(range(0, len(styled), step), delay * step):
+        # soft_wrap: let the terminal wrap, as the per-character output did
+        console.print(styled[start:start + step], end="", soft_wrap=True)
+    console.print()
 
 
 def show_data_sample(console, df, title, version, rows=5):
     """Renders a beautiful table of the data."""
-    if version == "TRON":
-        style, box_type = "bright_cyan", box.DOUBLE
-    elif version == "1985":
-        style, box_type = "green", box.ASCII
-    else:
-        style, box_type = "bold magenta", box.ROUNDED
-
-    table = Table(title=title, show_header=True, header_style=style, box=box_type)
+    table = Table(
+        title=title, show_header=True,
+        header_style=VERSION_HEADER_STYLE[version], box=VERSION_BOX[version],
+    )
 
     if df.empty:
-        if version == "TRON":
-            console.print("[bright_cyan]GRID ERROR: NO DATA FRAGMENTS FOUND[/bright_cyan]")
-        elif version == "Modern":
-            console.print("[red]No data to display.[/red]")
-        else:
-            console.print("[green]ERROR: NO DATA[/green]")
+        console.print(VERSION_TEXT[version]["no_data"])
         return
 
     col_style = "dim cyan" if version == "TRON" else None
     for col in df.columns[:6]:
         table.add_column(str(col), style=col_style)
 
-    for _, row in df.head(rows).iterrows():
-        table.add_row(*[str(val) for val in row.values[:6]])
+    # itertuples yields plain tuples without boxing each row into a Series
+    for row in df.iloc[:rows, :6].itertuples(index=False, name=None):
+        table.add_row(*map(str, row))
 
     console.print(table)
 
@@ -149,9 +232,8 @@ def thinking_animation(console, label, version, duration=2):
         transient=True,
     ) as progress:
         task = progress.add_task(f"[cyan]{label}...", total=100)
-        while not progress.finished:
-            progress.update(task, advance=random.randint(5, 15))
-            time.sleep(duration / 10)
+        for _ in _paced(range(10), duration / 10):
+            progress.update(task, advance=10)
 
 
 # ---------------------------------------------------------------------------
@@ -183,9 +265,8 @@ def retro_boot_sequence(console):
         "",
         "C:\\DATABRIDGE> _",
     ]
-    for line in boot_lines:
+    for line in _paced(boot_lines, 0.3):
         console.print(f"[green]{line}[/green]")
-        time.sleep(0.3)
     console.print()
 
 
@@ -197,16 +278,18 @@ def retro_wargames_prompt(console, question):
 
 
 def retro_pacman_progress(console, label, width=30):
-    """Pac-Man style progress bar."""
-    dots = "." * width
+    """Pac-Man style progress bar.
+
+    When output is not a terminal (piped or captured), ``\\r`` cannot redraw
+    the line, so only the finished bar is written and nothing is waited on.
+    """
     console.print(f"[green]{label}[/green]")
-    for i in range(width + 1):
-        eaten = "=" * i
-        pac = "C" if i < width else "O"
-        remaining = dots[i + 1:] if i < width else ""
-        bar = f"  [{eaten}{pac}{remaining}]"
-        console.print(f"[green]{bar}[/green]", end="\r")
-        time.sleep(0.06)
+    frames = _pacman_frames(width)
+    if not console.is_terminal:
+        console.print(frames[-1])
+        return
+    for frame in _paced(frames, 0.06):
+        console.print(frame, end="\r")
     console.print()
 
 
@@ -229,25 +312,25 @@ def get_tron_header():
 [/bright_cyan]"""
 
 
+TRON_GRID_WIDTH = 60
+TRON_GRID_FRAMES = [
+    "| . . . | . . . | . . . | . . . | . . . | . . . | . . . |",
+    "| - - . | . . . | . . . | . . . | . . . | . . . | . . . |",
+    "| - - - - - . . | . . . | . . . | . . . | . . . | . . . |",
+    "| . . . | - - - - - . . | . . . | . . . | . . . | . . . |",
+    "| . . . | . . . | - - - - - . . | . . . | . . . | . . . |",
+    "| . . . | . . . | . . . | - - - - - . . | . . . | . . . |",
+    "| . . . | . . . | . . . | . . . | - - - - - . . | . . . |",
+    "| . . . | . . . | . . . | . . . | . . . | - - - - - . . |",
+    "| . . . | . . . | . . . | . . . | . . . | . . . | - - - -",
+]
+
+
 def tron_grid_animation(console, duration=1.5):
     """Animated grid scan effect."""
-    grid_width = 60
-    frames = [
-        "| . . . | . . . | . . . | . . . | . . . | . . . | . . . |",
-        "| - - . | . . . | . . . | . . . | . . . | . . . | . . . |",
-        "| - - - - - . . | . . . | . . . | . . . | . . . | . . . |",
-        "| . . . | - - - - - . . | . . . | . . . | . . . | . . . |",
-        "| . . . | . . . | - - - - - . . | . . . | . . . | . . . |",
-        "| . . . | . . . | . . . | - - - - - . . | . . . | . . . |",
-        "| . . . | . . . | . . . | . . . | - - - - - . . | . . . |",
-        "| . . . | . . . | . . . | . . . | . . . | - - - - - . . |",
-        "| . . . | . . . | . . . | . . . | . . . | . . . | - - - -",
-    ]
-    delay = duration / len(frames)
-    for frame in frames:
-        console.print(f"[dim cyan]{frame}[/dim cyan]", end="\r")
-        time.sleep(delay)
-    console.print(f"[bright_cyan]{'-' * grid_width}[/bright_cyan]")
+    for frame in _paced(_TRON_GRID_FRAMES, duration / len(_TRON_GRID_FRAMES)):
+        console.print(frame, end="\r")
+    console.print(_TRON_GRID_RULE)
 
 
 def tron_disc_animation(console, label):
@@ -255,7 +338,7 @@ def tron_disc_animation(console, label):
     phases = ["SCANNING", "MATCHING", "ENCODING", "RESOLVED"]
     markers = ["*", ".", "*", "."]
     console.print(f"\n[bright_cyan]  DISC ENGAGED: {label.upper()}[/bright_cyan]")
-    for phase, marker in zip(phases, markers):
+    for phase, marker in _paced(zip(phases, markers), 0.4):
         disc = (
             f"    /--------\\\n"
             f"   /  {marker}    {marker}  \\\n"
@@ -264,7 +347,6 @@ def tron_disc_animation(console, label):
             f"    \\--------/"
         )
         console.print(f"[bright_cyan]{disc}[/bright_cyan]")
-        time.sleep(0.4)
     console.print()
 
 
@@ -282,6 +364,99 @@ def get_tron_end_of_line():
 [/bright_cyan]"""
 
 
+# ---------------------------------------------------------------------------
+# Pre-built renderables (markup parsed once at import, not per scenario)
+# ---------------------------------------------------------------------------
+_highlight = ReprHighlighter()
+
+
+def _highlighted(text):
+    """Apply the default highlighter beneath a Text's own styles, as console.print(str) does."""
+    highlighted = _highlight(text.plain)
+    highlighted.copy_styles(text)
+    return highlighted
+
+
+def _prerender(markup):
+    """Parse markup and apply the default highlighter, as console.print(str) would."""
+    return _highlighted(Text.from_markup(markup))
+
+
+def _styled(*parts):
+    """Build a Text from plain strings and (string, style) pairs, skipping markup parsing."""
+    text = Text()
+    for part in parts:
+        if isinstance(part, tuple):
+            text.append(*part)
+        else:
+            text.append(part)
+    return text
+
+
+@lru_cache(maxsize=None)
+def _pacman_frames(width):
+    dots = "." * width
+    frames = []
+    for i in range(width + 1):
+        eaten = "=" * i
+        pac = "C" if i < width else "O"
+        remaining = dots[i + 1:] if i < width else ""
+        frames.append(_prerender(f"[green]  [{eaten}{pac}{remaining}][/green]"))
+    return tuple(frames)
+
+
+_TRON_GRID_FRAMES = tuple(_prerender(f"[dim cyan]{frame}[/dim cyan]") for frame in TRON_GRID_FRAMES)
+_TRON_GRID_RULE = _prerender(f"[bright_cyan]{'-' * TRON_GRID_WIDTH}[/bright_cyan]")
+_RETRO_HEADER = _prerender(get_retro_header())
+_TRON_HEADER = _prerender(get_tron_header())
+_TRON_END_OF_LINE = _prerender(get_tron_end_of_line())
+_RETRO_QUOTE_TEXTS = [_prerender(f"[green]  {quote}[/green]\n") for quote in RETRO_QUOTES]
+
+_WELCOME_MARKDOWN = """
+# DataBridge AI: The Invisible Architect
+## Interactive Guided Tour (Large Dataset Edition)
+
+Welcome! You are about to see how DataBridge Core automates the most
+tedious manual data tasks in Finance and Operations.
+
+**Objective:** Reduce Human API time from hours to seconds.
+        """
+
+_FINISH_MARKDOWN = """
+# TOUR COMPLETE
+## Total Time: ~45 Seconds
+## Human Effort Saved: ~8 Hours
+
+DataBridge Core is now ready to be your **Invisible Architect**.
+        """
+
+
+@lru_cache(maxsize=None)
+def _markdown_panel(markdown):
+    """Centered panel for the Modern welcome/finish screens, built on first use."""
+    from rich.markdown import Markdown
+
+    return Align.center(Panel(Markdown(markdown), border_style="bold green", expand=False))
+
+_RETRO_MISSION_COMPLETE = _prerender(
+    "[green]"
+    "\n************************************************************\n"
+    "*                                                          *\n"
+    "*           M I S S I O N   C O M P L E T E               *\n"
+    "*                                                          *\n"
+    '*   "Shall we play a game?"  -- WOPR, WarGames (1983)     *\n'
+    "*                                                          *\n"
+    "*   ANALYSIS COMPLETE. ALL PHASES PASSED.                  *\n"
+    "*   TOTAL TIME: ~45 SEC  |  HUMAN HOURS SAVED: ~8         *\n"
+    "*                                                          *\n"
+    "*   THE INVISIBLE ARCHITECT IS READY.                      *\n"
+    "*   INSERT NEXT DISK OR PRESS ANY KEY TO EXIT.             *\n"
+    "*                                                          *\n"
+    "************************************************************\n"
+    "[/green]"
+)
+
+
 # ---------------------------------------------------------------------------
 # Main Tour
 # ---------------------------------------------------------------------------
@@ -300,16 +475,18 @@ def run_tour():
 
     if choice == "2":
         version = "1985"
+        # The 8-colour palette is fixed when a Console is created, so the
+        # retro mode still needs its own instance.
         console = Console(theme=RETRO_THEME, color_system="standard")
         console.clear()
-        console.print(get_retro_header())
+        console.print(_RETRO_HEADER)
         retro_boot_sequence(console)
         time.sleep(0.5)
     elif choice == "3":
         version = "TRON"
-        console = Console(theme=TRON_THEME)
+        console.push_theme(TRON_THEME)
         console.clear()
-        console.print(get_tron_header())
+        console.print(_TRON_HEADER)
         tron_grid_animation(console)
         time.sleep(0.5)
 
@@ -325,18 +502,10 @@ def run_tour():
         slow_type(console, "\nWELCOME TO THE DATABRIDGE FINANCIAL EXPERT SYSTEM.", version)
         slow_type(console, "LOADING KNOWLEDGE BASE...", version)
         slow_type(console, "OBJECTIVE: AUTOMATED DATA RECONCILIATION.", version)
-        console.print(f"\n[green]  {random.choice(RETRO_QUOTES)}[/green]\n")
+        console.print()
+        console.print(random.choice(_RETRO_QUOTE_TEXTS))
     elif version == "Modern":
-        welcome_msg = """
-# DataBridge AI: The Invisible Architect
-## Interactive Guided Tour (Large Dataset Edition)
-
-Welcome! You are about to see how DataBridge Core automates the most
-tedious manual data tasks in Finance and Operations.
-
-**Objective:** Reduce Human API time from hours to seconds.
-        """
-        console.print(Align.center(Panel(Markdown(welcome_msg), border_style="bold green", expand=False)))
+        console.print(_markdown_panel(_WELCOME_MARKDOWN))
 
     time.sleep(1)
 
@@ -363,67 +532,50 @@ tedious manual data tasks in Finance and Operations.
         console.print("Install with: [bold]pip install databridge-core[/bold]")
         return
 
+    text = VERSION_TEXT[version]
+
     # ===================================================================
     # SCENARIO 1: THE MESSY EXPORT
     # ===================================================================
-    if version == "TRON":
-        title = "[bright_cyan]+--- GRID SECTOR 1: DATA CORRUPTION DETECTED ---+[/bright_cyan]"
-    elif version == "Modern":
-        title = "[bold cyan]SCENARIO 1: THE MESSY EXPORT[/bold cyan]"
-    else:
-        title = "[green]*** PHASE 1: DATA INGESTION ***[/green]"
-    console.rule(title)
+    console.rule(text["s1_title"])
 
     if version == "TRON":
         tron_grid_animation(console, duration=1.0)
-        msg = "\nGRID ANOMALY DETECTED: DEREZZED DATA FRAGMENTS IN SAP SECTOR. METADATA CORRUPTION PRESENT."
-    elif version == "1985":
-        msg = "\nPROBLEM: A FINANCE USER EXPORTED A GLOBAL SAP COA. IT HAS 5 LINES OF HUMAN-ADDED 'GARBAGE' METADATA AT THE TOP."
-    else:
-        msg = "\nPROBLEM: A finance user exported a global SAP COA. It has 5 lines of human-added 'garbage' metadata at the top."
-    slow_type(console, msg, version)
+    slow_type(console, text["s1_problem"], version)
 
     coa_path = data_dir / "sap_coa_messy.csv"
 
     try:
-        raw_lines = coa_path.read_text().splitlines()[:8]
-        if version == "TRON":
-            view_title, raw_box = "CORRUPTED GRID DATA", box.DOUBLE
-        elif version == "1985":
-            view_title, raw_box = "BUFFER PREVIEW", box.ASCII
-        else:
-            view_title, raw_box = "Raw File Content (First 8 Lines)", box.ROUNDED
-        raw_view_table = Table(title=view_title, show_header=False, box=raw_box)
+        # Stop after the preview lines instead of decoding the whole export
+        with coa_path.open(encoding="utf-8") as f:
+            raw_lines = [line.rstrip("\r\n") for line in islice(f, 8)]
+        raw_view_table = Table(
+            title=text["s1_raw_title"], show_header=False, box=VERSION_BOX[version]
+        )
         for line in raw_lines:
             raw_view_table.add_row(line)
         console.print(raw_view_table)
     except Exception:
-        if version == "TRON":
-            console.print("[bright_red]GRID READ FAILURE. DATA SECTOR UNREACHABLE.[/bright_red]")
-        elif version == "Modern":
-            console.print("[red]Error reading raw file.[/red]")
-        else:
-            console.print("[green]READ ERROR.[/green]")
+        console.print(text["s1_read_error"])
 
-    if version == "TRON":
-        clean_prompt = "[bright_cyan]INITIATE RECTIFICATION SEQUENCE? (Y/N)[/bright_cyan]"
-    elif version == "Modern":
-        clean_prompt = "[yellow]Can you see the '#' comment lines and inconsistent fields? Ready to clean?[/yellow]"
-    else:
-        clean_prompt = "[green]CLEAN DATA BUFFER? (Y/N)[/green]"
-
-    if Confirm.ask(clean_prompt):
+    if Confirm.ask(text["s1_clean_prompt"]):
         thinking_animation(console, "Detecting Anchor Cell & Skipping Metadata", version)
-        df_clean = pd.read_csv(coa_path, comment='#')
+        df_clean = _read_commented_csv(coa_path)
 
         if version == "TRON":
-            success_msg = f"RECTIFIED: [bright_cyan]{len(df_clean)}[/bright_cyan] PROGRAMS RECOVERED FROM CORRUPTION."
+            success_msg = _styled(
+                "RECTIFIED: ", (str(len(df_clean)), "bright_cyan"),
+                " PROGRAMS RECOVERED FROM CORRUPTION.",
+            )
             panel_title, border = "GRID RECTIFICATION COMPLETE", "bright_cyan"
         elif version == "1985":
-            success_msg = f"OK. {len(df_clean)} RECORDS IDENTIFIED. NOISE REMOVED."
+            success_msg = _styled(f"OK. {len(df_clean)} RECORDS IDENTIFIED. NOISE REMOVED.")
             panel_title, border = "SYSTEM STATUS", "green"
         else:
-            success_msg = f"SUCCESS: Identified [bold green]{len(df_clean)}[/bold green] valid accounts. Metadata stripped."
+            success_msg = _styled(
+                "SUCCESS: Identified ", (str(len(df_clean)), "bold green"),
+                " valid accounts. Metadata stripped.",
+            )
             panel_title, border = "Invisible Architect Action", "green"
         console.print(Panel(success_msg, title=panel_title, border_style=border))
         show_data_sample(
@@ -437,7 +589,7 @@ tedious manual data tasks in Finance and Operations.
 
     console.print("\n")
     if version == "1985":
-        console.print(f"[green]  {random.choice(RETRO_QUOTES)}[/green]\n")
+        console.print(random.choice(_RETRO_QUOTE_TEXTS))
 
     # ===================================================================
     # SCENARIO 2: FUZZY VENDOR MAPPING
@@ -458,8 +610,12 @@ tedious manual data tasks in Finance and Operations.
         msg = "\nPROBLEM: We need to map 600 vendors from a legacy system to new targets. Names don't match exactly."
     slow_type(console, msg, version)
 
-    legacy_df = pd.read_csv(data_dir / "legacy_vendors.csv")
-    new_erp_df = pd.read_csv(data_dir / "new_erp_vendors.csv")
+    # The package reader memoizes frames on file mtime and size. Only the name
+    # columns are shown and matched, so only those are parsed.
+    from databridge_core._io import read_csv
+
+    legacy_df = read_csv(str(data_dir / "legacy_vendors.csv"), usecols=("vendor_name",))
+    new_erp_df = read_csv(str(data_dir / "new_erp_vendors.csv"), usecols=("legal_name",))
 
     if version == "TRON":
         leg_title, erp_title = "SECTOR A PROGRAMS", "SECTOR B PROGRAMS"
@@ -470,12 +626,12 @@ tedious manual data tasks in Finance and Operations.
 
     leg_table = Table(title=leg_title, box=None)
     leg_table.add_column("Vendor Name", style="dim cyan" if version == "TRON" else None)
-    for v in legacy_df['vendor_name'].head(3):
+    for v in legacy_df['vendor_name'].head(3).tolist():
         leg_table.add_row(v)
 
     erp_table = Table(title=erp_title, box=None)
     erp_table.add_column("Legal Name", style="dim cyan" if version == "TRON" else None)
-    for v in new_erp_df['legal_name'].head(3):
+    for v in new_erp_df['legal_name'].head(3).tolist():
         erp_table.add_row(v)
 
     console.print(leg_table, justify="center")
@@ -498,9 +654,11 @@ tedious manual data tasks in Finance and Operations.
         thinking_animation(console, "Calculating Levenshtein Distance & Token Ratios", version)
 
         try:
-            mapping = fuzzy_match_columns(
-                str(data_dir / "legacy_vendors.csv"),
-                str(data_dir / "new_erp_vendors.csv"),
+            from databridge_core import fuzzy_match_columns_df
+
+            mapping = fuzzy_match_columns_df(
+                legacy_df,
+                new_erp_df,
                 column_a="vendor_name",
                 column_b="legal_name",
                 threshold=70
@@ -514,13 +672,7 @@ tedious manual data tasks in Finance and Operations.
             mapping = None
 
         if mapping:
-            if version == "TRON":
-                res_title, res_box = "IDENTITY DISC CROSS-REFERENCE", box.DOUBLE
-            elif version == "1985":
-                res_title, res_box = "MAPPING RESULTS", box.ASCII
-            else:
-                res_title, res_box = "AI-Generated Cross-Walk", box.ROUNDED
-            results_table = Table(title=res_title, box=res_box)
+            results_table = Table(title=text["s2_results_title"], box=VERSION_BOX[version])
             if version == "TRON":
                 results_table.add_column("Source Program", style="dim cyan")
                 results_table.add_column("Target Program", style="bright_cyan")
@@ -548,7 +700,7 @@ tedious manual data tasks in Finance and Operations.
 
     console.print("\n")
     if version == "1985":
-        console.print(f"[green]  {random.choice(RETRO_QUOTES)}[/green]\n")
+        console.print(random.choice(_RETRO_QUOTE_TEXTS))
 
     # ===================================================================
     # SCENARIO 3: TRANSACTION AUDIT
@@ -582,10 +734,17 @@ tedious manual data tasks in Finance and Operations.
     if Confirm.ask(hash_prompt):
         thinking_animation(console, "Generating Row-Level Digital Fingerprints", version)
 
-        recon = compare_hashes(str(gl_path), str(bank_path), key_columns="amount", compare_columns="amount")
+        from databridge_core import compare_hashes_df, get_orphan_details_df
+
+        gl_df, bank_df = read_csv(str(gl_path)), read_csv(str(bank_path))
+        recon = compare_hashes_df(
+            gl_df, bank_df, key_columns="amount", compare_columns="amount"
+        )
 
         if recon['statistics']['orphans_only_in_source_a'] > 0:
-            orphans = get_orphan_details(str(gl_path), str(bank_path), key_columns="amount", orphan_source="a", limit=3)
+            orphans = get_orphan_details_df(
+                gl_df, bank_df, key_columns="amount", orphan_source="a", limit=3
+            )
 
             if version == "TRON":
                 alert_msg = "\n+--- GRID BREACH: MISSING LIGHTCYCLE TRACES ---+"
@@ -625,7 +784,7 @@ tedious manual data tasks in Finance and Operations.
 
     console.print("\n")
     if version == "1985":
-        console.print(f"[green]  {random.choice(RETRO_QUOTES)}[/green]\n")
+        console.print(random.choice(_RETRO_QUOTE_TEXTS))
 
     # ===================================================================
     # SCENARIO 4: REVENUE INTEGRITY
@@ -659,43 +818,48 @@ tedious manual data tasks in Finance and Operations.
     if Confirm.ask(audit_prompt):
         thinking_animation(console, "Scanning for Value Conflicts", version)
 
-        conflicts = get_conflict_details(
-            str(crm_path), str(erp_path),
+        from databridge_core import get_conflict_details_df
+
+        conflicts = get_conflict_details_df(
+            read_csv(str(crm_path)), read_csv(str(erp_path)),
             key_columns="opportunity_id",
             compare_columns="amount",
             limit=3
         )
 
+        total_conflicts = str(conflicts['total_conflicts'])
         if version == "TRON":
-            conflict_title = f"GRID INTEGRITY BREACH: [bright_red]{conflicts['total_conflicts']}[/bright_red] DEREZZED VALUES FOUND."
+            conflict_title = _styled(
+                "GRID INTEGRITY BREACH: ", (total_conflicts, "bright_red"), " DEREZZED VALUES FOUND."
+            )
             panel_border = "bright_cyan"
         elif version == "Modern":
-            conflict_title = f"FOUND [bold red]{conflicts['total_conflicts']}[/bold red] PRICE DISCREPANCIES."
+            conflict_title = _styled(
+                "FOUND ", (total_conflicts, "bold red"), " PRICE DISCREPANCIES."
+            )
             panel_border = "yellow"
         else:
-            conflict_title = f"{conflicts['total_conflicts']} CONFLICTS LOCATED."
+            conflict_title = _styled(f"{total_conflicts} CONFLICTS LOCATED.")
             panel_border = "green"
         console.print(Panel(conflict_title, border_style=panel_border))
 
         for c in conflicts['conflicts']:
+            opp_id = str(c['key']['opportunity_id'])
+            value_a, value_b = c['differences'][0]['value_a'], c['differences'][0]['value_b']
             if version == "TRON":
-                details = (
-                    f"[dim cyan]NODE:[/dim cyan] [bright_cyan]{c['key']['opportunity_id']}[/bright_cyan]"
-                    f" [dim cyan]|[/dim cyan] CRM: [bright_cyan]${c['differences'][0]['value_a']}[/bright_cyan]"
-                    f" [dim cyan]vs[/dim cyan] ERP: [bright_red]${c['differences'][0]['value_b']}[/bright_red]"
+                details = _styled(
+                    ("NODE:", "dim cyan"), " ", (opp_id, "bright_cyan"),
+                    " ", ("|", "dim cyan"), " CRM: ", (f"${value_a}", "bright_cyan"),
+                    " ", ("vs", "dim cyan"), " ERP: ", (f"${value_b}", "bright_red"),
                 )
             elif version == "1985":
-                details = (
-                    f"ID: {c['key']['opportunity_id']}"
-                    f" - VAR: {c['differences'][0]['value_a']} / {c['differences'][0]['value_b']}"
-                )
+                details = _styled(f"ID: {opp_id} - VAR: {value_a} / {value_b}")
             else:
-                details = (
-                    f"Opp: {c['key']['opportunity_id']}"
-                    f" | CRM: [green]${c['differences'][0]['value_a']}[/green]"
-                    f" vs ERP: [red]${c['differences'][0]['value_b']}[/red]"
+                details = _styled(
+                    f"Opp: {opp_id} | CRM: ", (f"${value_a}", "green"),
+                    " vs ERP: ", (f"${value_b}", "red"),
                 )
-            console.print(details)
+            console.print(_highlighted(details))
 
         kb_results["scenarios"]["revenue_integrity"] = {
             "total_conflicts": conflicts['total_conflicts'],
@@ -716,7 +880,7 @@ tedious manual data tasks in Finance and Operations.
     # CONCLUSION
     # ===================================================================
     if version == "TRON":
-        console.print(get_tron_end_of_line())
+        console.print(_TRON_END_OF_LINE)
         tron_grid_animation(console, duration=2.0)
         console.print()
         scenarios_done = len(kb_results.get("scenarios", {}))
@@ -731,34 +895,13 @@ tedious manual data tasks in Finance and Operations.
             box=box.DOUBLE,
         ))
     elif version == "Modern":
-        finish_msg = """
-# TOUR COMPLETE
-## Total Time: ~45 Seconds
-## Human Effort Saved: ~8 Hours
-
-DataBridge Core is now ready to be your **Invisible Architect**.
-        """
         console.print("\n")
-        console.print(Align.center(Panel(Markdown(finish_msg), border_style="bold green", expand=False)))
+        console.print(_markdown_panel(_FINISH_MARKDOWN))
     else:
-        retro_end = (
-            "\n************************************************************\n"
-            "*                                                          *\n"
-            "*           M I S S I O N   C O M P L E T E               *\n"
-            "*                                                          *\n"
-            '*   "Shall we play a game?"  -- WOPR, WarGames (1983)     *\n'
-            "*                                                          *\n"
-            "*   ANALYSIS COMPLETE. ALL PHASES PASSED.                  *\n"
-            "*   TOTAL TIME: ~45 SEC  |  HUMAN HOURS SAVED: ~8         *\n"
-            "*                                                          *\n"
-            "*   THE INVISIBLE ARCHITECT IS READY.                      *\n"
-            "*   INSERT NEXT DISK OR PRESS ANY KEY TO EXIT.             *\n"
-            "*                                                          *\n"
-            "************************************************************\n"
-        )
-        console.print(f"[green]{retro_end}[/green]")
+        console.print(_RETRO_MISSION_COMPLETE)
         retro_pacman_progress(console, "SAVING TO SECTOR 7")
-        console.print(f"\n[green]  {random.choice(RETRO_QUOTES)}[/green]\n")
+        console.print()
+        console.print(random.choice(_RETRO_QUOTE_TEXTS))
 
     if version == "TRON":
         kb_prompt = "\n[bright_cyan]EXPORT GRID DATA TO KNOWLEDGE BASE? (Y/N)[/bright_cyan]"
@@ -771,7 +914,7 @@ DataBridge Core is now ready to be your **Invisible Architect**.
         thinking_animation(console, "Generating Graph-Ready Knowledge JSON", version)
         kb_results["exported_at"] = datetime.now().isoformat()
         output_path = Path.cwd() / "knowledge_export.json"
-        output_path.write_text(json.dumps(kb_results, indent=2, default=str))
+        _write_json(output_path, kb_results)
         if version == "TRON":
             console.print(f"[bright_cyan]GRID DATA EXPORTED TO {output_path.name}. END OF LINE.[/bright_cyan]")
         elif version == "Modern":
@@ -16,50 +16,75 @@ Quick start::
 
 __version__ = "1.5.0"
 
-# Reconciler
-from .reconciler import (
-    compare_hashes,
-    get_orphan_details,
-    get_conflict_details,
-    fuzzy_match_columns,
-    fuzzy_deduplicate,
-    merge_sources,
-    compute_similarity,
-    diff_lists,
-    diff_dicts,
-    explain_diff,
-    find_close_matches,
-    find_similar_strings,
-    transform_column,
-)
-
-# Profiler
-from .profiler import (
-    profile_data,
-    detect_schema_drift,
-    generate_expectation_suite,
-    list_expectation_suites,
-    validate,
-    get_validation_results,
-)
+# Public names are loaded from their submodule on first attribute access
+# (PEP 562). Reconciler and Profiler pull in pandas, Templates pull in
+# pydantic, and Integrations pull in urllib -- none of which the CLI's
+# --help, a CSV preview or a single detector needs.
+_LAZY_ATTRS = {
+    # Ingestion
+    "load_csv": "ingestion",
+    "load_json": "ingestion",
+    "extract_pdf_text": "ingestion",
+    "parse_table_from_text": "ingestion",
+    # Files
+    "find_files": "files",
+    "stage_file": "files",
+    # Templates
+    "TemplateService": "templates",
+    "FinancialTemplate": "templates",
+    # Integrations
+    "BaseClient": "integrations",
+    "SlackClient": "integrations",
+    # Detection modules (always available — stdlib only)
+    "detect_erp": "erp_detect",
+    "detect_erp_batch": "erp_detect",
+    "detect_fraud": "fraud_detect",
+    "detect_fraud_batch": "fraud_detect",
+    "validate_fx": "fx_validate",
+    "validate_fx_batch": "fx_validate",
+    "check_standards": "standards_check",
+    "check_standards_batch": "standards_check",
+    # Reconciler
+    "compare_hashes": "reconciler",
+    "compare_hashes_df": "reconciler",
+    "get_orphan_details": "reconciler",
+    "get_orphan_details_df": "reconciler",
+    "get_conflict_details": "reconciler",
+    "get_conflict_details_df": "reconciler",
+    "fuzzy_match_columns": "reconciler",
+    "fuzzy_match_columns_df": "reconciler",
+    "fuzzy_deduplicate": "reconciler",
+    "merge_sources": "reconciler",
+    "compute_similarity": "reconciler",
+    "diff_lists": "reconciler",
+    "diff_dicts": "reconciler",
+    "explain_diff": "reconciler",
+    "find_close_matches": "reconciler",
+    "find_similar_strings": "reconciler",
+    "transform_column": "reconciler",
+    # Profiler
+    "profile_data": "profiler",
+    "detect_schema_drift": "profiler",
+    "generate_expectation_suite": "profiler",
+    "list_expectation_suites": "profiler",
+    "validate": "profiler",
+    "get_validation_results": "profiler",
+}
 
-# Ingestion
-from .ingestion import load_csv, load_json, extract_pdf_text, parse_table_from_text
 
-# Files
-from .files import find_files, stage_file
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
 
-# Templates (always available)
-from .templates import TemplateService, FinancialTemplate
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
 
-# Integrations (always available — stdlib only)
-from .integrations import BaseClient, SlackClient
 
-# Detection modules (always available — stdlib only)
-from .erp_detect import detect_erp, detect_erp_batch
-from .fraud_detect import detect_fraud, detect_fraud_batch
-from .fx_validate import validate_fx, validate_fx_batch
-from .standards_check import check_standards, check_standards_batch
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 # Grounded Detection (lazy — optional langgraph for AI pipeline)
 def detect_grounded(*args, **kwargs):
@@ -110,13 +135,17 @@ def export_to_parquet(*args, **kwargs):
     from .connectors import export_to_parquet as _export
     return _export(*args, **kwargs)
 
-__all__ = [
+__all__ = (
     "__version__",
     # Reconciler
     "compare_hashes",
+    "compare_hashes_df",
     "get_orphan_details",
+    "get_orphan_details_df",
     "get_conflict_details",
+    "get_conflict_details_df",
     "fuzzy_match_columns",
+    "fuzzy_match_columns_df",
     "fuzzy_deduplicate",
     "merge_sources",
     "compute_similarity",
@@ -169,4 +198,4 @@ __all__ = [
     # Connectors
     "query_local",
     "export_to_parquet",
-]
+)
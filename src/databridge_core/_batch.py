@@ -0,0 +1,121 @@
+"""Shared driver for the per-file batch detectors and triage scans (stdlib only)."""
+
+import fnmatch
+import logging
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Below this many files, worker-process start-up costs more than it saves
+PROCESS_MIN_FILES = 8
+
+
+def default_workers() -> int:
+    """Half the available CPUs, and at least one."""
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+@lru_cache(maxsize=32)
+def name_matcher(pattern: str) -> Callable[[str], Any]:
+    """Compile a filename glob once and return its ``match`` function.
+
+    Names must be passed through :func:`os.path.normcase` first, so matching
+    is case-insensitive exactly where the filesystem is.
+    """
+    return re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+
+
+def list_files(directory: str, pattern: str) -> List[str]:
+    """Return the sorted paths of entries in ``directory`` matching ``pattern``.
+
+    A single :func:`os.scandir` pass replaces ``sorted(Path.glob(pattern))``
+    for plain filename patterns; patterns naming subdirectories still go
+    through :meth:`pathlib.Path.glob`.
+    """
+    if "/" in pattern or os.sep in pattern:
+        return sorted(str(p) for p in Path(directory).glob(pattern))
+    match = name_matcher(pattern)
+    normcase = os.path.normcase
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(e.path for e in entries if match(normcase(e.name)))
+    except OSError:
+        return []
+
+
+def _mp_context() -> Any:
+    """Return the forkserver context where available, else the default.
+
+    Workers then start from a clean server process instead of forking a
+    parent that may be running other threads (e.g. a CLI progress spinner).
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return None
+
+
+def map_files(
+    func: Callable[[str], Any],
+    file_paths: Sequence[str],
+    workers: Optional[int] = 1,
+    progress: Optional[Callable[[int, str], None]] = None,
+) -> List[Any]:
+    """Apply ``func`` to each path and return the results in input order.
+
+    With ``workers`` above 1, batches of at least :data:`PROCESS_MIN_FILES`
+    are spread over a process pool. ``func`` must be picklable (a
+    module-level function or a ``functools.partial`` of one), and scripts
+    must guard their entry point with ``if __name__ == "__main__"`` as
+    workers re-import the main module. Smaller batches, ``workers=1`` and
+    platforms that cannot start worker processes run in-process; if the
+    pool breaks mid-run, the remaining files are processed in-process.
+
+    Args:
+        func: Per-file function, called with the path as a string.
+        file_paths: Files to process.
+        workers: Worker process count (default 1; ``None`` means
+            :func:`default_workers`).
+        progress: Optional ``progress(done, path)`` callback, called in
+            input order as each result is collected.
+    """
+    if workers is None:
+        workers = default_workers()
+    workers = min(workers, len(file_paths))
+    results: List[Any] = []
+
+    def collect(path: str, result: Any) -> None:
+        results.append(result)
+        if progress:
+            progress(len(results), path)
+
+    if workers > 1 and len(file_paths) >= PROCESS_MIN_FILES:
+        try:
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=_mp_context())
+        except (NotImplementedError, OSError):
+            pool = None
+        if pool is not None:
+            with pool:
+                chunksize = max(1, len(file_paths) // (4 * workers))
+                try:
+                    for path, result in zip(
+                        file_paths, pool.map(func, file_paths, chunksize=chunksize)
+                    ):
+                        collect(path, result)
+                except BrokenProcessPool as exc:
+                    logger.warning(
+                        "Worker processes failed (%s); processing the remaining %d "
+                        "files in-process",
+                        exc,
+                        len(file_paths) - len(results),
+                    )
+
+    for path in file_paths[len(results):]:
+        collect(path, func(path))
+    return results
@@ -1,8 +1,248 @@
 """Shared I/O helpers."""
 
+import csv
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, List, Sequence, Tuple
+
+import numpy as np
 import pandas as pd
 
+# Below this size the pandas C parser wins; Arrow's thread pool only pays off
+# once there are several blocks to parse in parallel.
+ARROW_MIN_BYTES = 1 << 20
+
+# Reader options the Arrow path knows how to honour.
+_ARROW_OPTIONS = frozenset({"usecols"})
+
+# pandas' default missing-value markers; Arrow's list lacks "None" and "<NA>"
+_PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+]
+
+# Parsed frames are kept for re-reads only for files up to this size, so at
+# most _MEMO_ENTRIES * MEMO_MAX_BYTES of CSV is held; larger reads are parsed
+# fresh and handed over without a defensive copy.
+MEMO_MAX_BYTES = 8 << 20
+_MEMO_ENTRIES = 8
+
+# Set to 1 to keep an LZ4 Feather copy next to each CSV that was read
+# without options; later runs load the copy while it is newer than the CSV.
+CACHE_ENV_VAR = "DATABRIDGE_CACHE"
+
+
+def _read_csv_arrow(file_path: str, usecols: Any = None) -> pd.DataFrame:
+    """Parse a CSV with Arrow's multithreaded reader, matching pandas values.
+
+    Arrow is configured to treat the same cells as missing and boolean as
+    :func:`pandas.read_csv` does. Columns Arrow would parse as dates, times
+    or timestamps are read as the original text, and all-null columns come
+    back as floats, so the result is interchangeable with pandas output.
+    Files with blank or repeated header names, selections pandas would
+    reject, and files Arrow cannot type consistently are handed to pandas
+    instead.
+    """
+    import pyarrow as pa
+    from pyarrow import csv as pac
+
+    read_options = pac.ReadOptions(use_threads=True, block_size=8 << 20)
+    convert_options = pac.ConvertOptions(
+        null_values=_PANDAS_NA_VALUES,
+        true_values=["True", "TRUE", "true"],
+        false_values=["False", "FALSE", "false"],
+        strings_can_be_null=True,
+    )
+    try:
+        # Types are inferred from the first block; reading just that block
+        # finds the temporal columns, which are then kept as text.
+        with pac.open_csv(
+            file_path, read_options=read_options, convert_options=convert_options
+        ) as reader:
+            schema = reader.schema
+        names = schema.names
+        if "" in names or len(set(names)) != len(names):
+            # pandas renames blank and repeated headers ("Unnamed: 3", "a.1")
+            return pd.read_csv(file_path, usecols=usecols)
+        if usecols is not None:
+            wanted = set(usecols)
+            if not wanted.issubset(schema.names):
+                return pd.read_csv(file_path, usecols=usecols)
+            # pandas keeps file order regardless of the order asked for
+            convert_options.include_columns = [n for n in schema.names if n in wanted]
+        convert_options.column_types = {
+            field.name: pa.string() for field in schema if pa.types.is_temporal(field.type)
+        }
+        table = pac.read_csv(
+            file_path, read_options=read_options, convert_options=convert_options
+        )
+    except (pa.ArrowInvalid, TypeError):
+        return pd.read_csv(file_path, usecols=usecols)
+
+    columns = [
+        column.cast(pa.float64()) if pa.types.is_null(column.type) else column
+        for column in table.columns
+    ]
+    table = pa.table(columns, names=table.column_names)
+    return table.to_pandas(self_destruct=True, split_blocks=True)
+
+
+def _use_arrow(size: int, options: dict) -> bool:
+    """Return True when the Arrow reader is installed and suits this read."""
+    if size < ARROW_MIN_BYTES or not _ARROW_OPTIONS.issuperset(options):
+        return False
+    try:
+        import pyarrow.csv  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _sidecar_path(real_path: str) -> str:
+    """Return where the Feather copy of a CSV is kept."""
+    return real_path + ".feather"
+
+
+# Schema metadata key recording which CSV version a Feather copy was made from
+_SIDECAR_SOURCE_KEY = b"databridge.source"
+
+
+def _source_stamp(mtime_ns: int, size: int) -> bytes:
+    """Encode a CSV's mtime and size for the Feather copy's metadata."""
+    return f"{mtime_ns}:{size}".encode()
+
+
+def _read_sidecar(real_path: str, mtime_ns: int, size: int) -> Any:
+    """Return the Feather copy of a CSV if it was made from this version, else None.
+
+    The copy records the CSV's mtime and size when written; both must match
+    exactly, so a CSV replaced by a file with an older mtime (``cp -p``,
+    ``tar``, ``rsync -t``) is not served stale data.
+    """
+    sidecar = _sidecar_path(real_path)
+    try:
+        import pyarrow as pa
+
+        with pa.memory_map(sidecar) as source:
+            metadata = pa.ipc.open_file(source).schema.metadata or {}
+        if metadata.get(_SIDECAR_SOURCE_KEY) != _source_stamp(mtime_ns, size):
+            return None
+        return pd.read_feather(sidecar)
+    except (ImportError, OSError, ValueError):
+        return None
+
+
+def _write_sidecar(real_path: str, df: pd.DataFrame, mtime_ns: int, size: int) -> None:
+    """Best-effort write of a Feather copy; unwritable directories are skipped."""
+    try:
+        import pyarrow as pa
+        from pyarrow import feather
+
+        table = pa.Table.from_pandas(df)
+        metadata = dict(table.schema.metadata or {})
+        metadata[_SIDECAR_SOURCE_KEY] = _source_stamp(mtime_ns, size)
+        feather.write_feather(
+            table.replace_schema_metadata(metadata),
+            _sidecar_path(real_path),
+            compression="lz4",
+        )
+    except (ImportError, OSError, ValueError):
+        pass
+
+
+def _parse_csv(real_path: str, mtime_ns: int, size: int, options: tuple) -> pd.DataFrame:
+    """Parse a CSV identified by its (path, mtime, size, options) fingerprint."""
+    kwargs = dict(options)
+    sidecar = not kwargs and os.environ.get(CACHE_ENV_VAR) == "1"
+    if sidecar:
+        df = _read_sidecar(real_path, mtime_ns, size)
+        if df is not None:
+            return df
+    if _use_arrow(size, kwargs):
+        df = _read_csv_arrow(real_path, **kwargs)
+    else:
+        df = pd.read_csv(real_path, **kwargs)
+    if sidecar:
+        _write_sidecar(real_path, df, mtime_ns, size)
+    return df
+
+
+# Memoized parse, one entry per fingerprint. Only files of at most
+# MEMO_MAX_BYTES go through it, which bounds the CSV bytes held in memory.
+_read_csv_cached = lru_cache(maxsize=_MEMO_ENTRIES)(_parse_csv)
+
+
+def read_csv(file_path: str, **kwargs: Any) -> pd.DataFrame:
+    """Read a CSV file into a DataFrame.
+
+    Every CSV read in the package goes through this helper so parser
+    tuning lives in one place. Extra keyword arguments are forwarded to
+    :func:`pandas.read_csv`.
+
+    Frames parsed from files of at most :data:`MEMO_MAX_BYTES` are memoized
+    on the file's real path, modification time and size, so a profile
+    followed by a compare of the same file parses it only once. Larger
+    files are parsed on every call. Callers always receive a frame they may
+    mutate.
+
+    Files of at least :data:`ARROW_MIN_BYTES` are parsed with PyArrow's
+    multithreaded reader when it is installed (``pip install
+    'databridge-core[arrow]'``) and no pandas-only options are given.
+
+    With ``DATABRIDGE_CACHE=1`` in the environment, option-free reads also
+    keep a ``<file>.feather`` copy beside the CSV and reuse it across
+    processes while the CSV's mtime and size are unchanged (requires
+    PyArrow).
+    """
+    try:
+        options = tuple(sorted(kwargs.items()))
+        hash(options)
+        st = os.stat(file_path)
+    except (TypeError, OSError):
+        return pd.read_csv(file_path, **kwargs)
+
+    key = (os.path.realpath(file_path), st.st_mtime_ns, st.st_size, options)
+    if st.st_size > MEMO_MAX_BYTES:
+        return _parse_csv(*key)
+    return _read_csv_cached(*key).copy()
+
+
+def map_concurrent(func: Callable[[str], Any], file_paths: Sequence[str]) -> List[Any]:
+    """Apply ``func`` to each path on a small thread pool, preserving order.
+
+    Parsing and hashing in pandas/NumPy release the GIL, so independent
+    sources (e.g. the two sides of a comparison) overlap their disk and
+    CPU time.
+    """
+    if len(file_paths) < 2:
+        return [func(p) for p in file_paths]
+    with ThreadPoolExecutor(max_workers=len(file_paths)) as pool:
+        return list(pool.map(func, file_paths))
+
+
+def read_csvs(*file_paths: str, **kwargs: Any) -> List[pd.DataFrame]:
+    """Read several CSV files concurrently, returning frames in input order."""
+    return map_concurrent(lambda p: read_csv(p, **kwargs), file_paths)
+
+
+def scan_csv(file_path: str) -> Tuple[List[str], int]:
+    """Return a CSV's header and data row count without parsing the body.
 
-def read_csv(file_path: str) -> pd.DataFrame:
-    """Read a CSV file into a DataFrame."""
-    return pd.read_csv(file_path)
+    Rows are counted as newlines over a memory-mapped view of the file, so
+    quoted fields containing embedded newlines are over-counted.
+    """
+    with open(file_path, "rb") as f:
+        header = f.readline()
+        if not header:
+            return [], 0
+        columns = next(csv.reader([header.decode("utf-8-sig")]), [])
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            buf = np.frombuffer(mm, dtype=np.uint8)
+            lines = int(np.count_nonzero(buf == 0x0A))
+            if buf[-1] != 0x0A:
+                lines += 1
+            del buf
+    return columns, lines - 1
@@ -0,0 +1,47 @@
+"""Rich objects shared by the CLI, imported on first use.
+
+``import databridge_core.cli`` does not load Rich, so ``databridge --help``
+and argument errors never pay for it; the first command that prints does.
+"""
+
+from functools import lru_cache
+
+# Attribute name -> Rich module providing it (PEP 562).
+_LAZY_ATTRS = {
+    "Column": "rich.table",
+    "Panel": "rich.panel",
+    "Syntax": "rich.syntax",
+    "Table": "rich.table",
+    "Text": "rich.text",
+}
+
+
+@lru_cache(maxsize=1)
+def get_console():
+    """Return the process-wide Rich console.
+
+    When output carries no styling at all (piped, redirected or a dumb
+    terminal), the repr highlighter is switched off: its regexes would scan
+    every printed string only to produce styles that are then dropped.
+    """
+    from rich.console import Console
+
+    console = Console()
+    if console.color_system is None:
+        console = Console(highlight=False)
+    return console
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -1,16 +1,28 @@
 """Shared result types for the databridge-core library.
 
 All library functions return Python objects (dicts, dataclasses, Pydantic models).
+The result types below are plain slotted dataclasses: they are cheap to build
+in batch loops and carry no validation. Wrap them in
+``pydantic.TypeAdapter`` at an API boundary when validation is wanted.
 """
 
+from dataclasses import asdict, dataclass
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+
+class _Result:
+    """Mixin giving result dataclasses the ``model_dump()`` of the old models."""
+
+    __slots__ = ()
+
+    def model_dump(self) -> Dict[str, Any]:
+        return asdict(self)
 
 
 # -- Profiler types --
 
-class ProfileResult(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ProfileResult(_Result):
     """Result of profiling a data source."""
     file: str
     rows: int
@@ -24,7 +36,8 @@ class ProfileResult(BaseModel):
     statistics: Dict[str, Any]
 
 
-class DriftResult(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DriftResult(_Result):
     """Result of schema drift detection."""
     source_a: str
     source_b: str
@@ -37,7 +50,8 @@ class DriftResult(BaseModel):
 
 # -- Reconciler types --
 
-class CompareHashesResult(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CompareHashesResult(_Result):
     """Result of hash-based row comparison."""
     source_a: Dict[str, Any]
     source_b: Dict[str, Any]
@@ -46,21 +60,24 @@ class CompareHashesResult(BaseModel):
     statistics: Dict[str, Any]
 
 
-class OrphanResult(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class OrphanResult(_Result):
     """Result of orphan record retrieval."""
     orphan_source: str
     orphans_in_a: Optional[Dict[str, Any]] = None
     orphans_in_b: Optional[Dict[str, Any]] = None
 
 
-class ConflictResult(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ConflictResult(_Result):
     """Result of conflict detail retrieval."""
     total_conflicts: int
     showing: int
     conflicts: List[Dict[str, Any]]
 
 
-class FuzzyMatchResult(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FuzzyMatchResult(_Result):
     """Result of fuzzy column matching."""
     column_a: str
     column_b: str
@@ -69,7 +86,8 @@ class FuzzyMatchResult(BaseModel):
     top_matches: List[Dict[str, Any]]
 
 
-class MergeResult(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class MergeResult(_Result):
     """Result of merging two sources."""
     source_a_rows: int
     source_b_rows: int
@@ -81,7 +99,8 @@ class MergeResult(BaseModel):
 
 # -- Ingestion types --
 
-class LoadResult(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class LoadResult(_Result):
     """Result of loading a file."""
     file: str
     rows: int
@@ -91,7 +110,8 @@ class LoadResult(BaseModel):
     null_counts: Optional[Dict[str, int]] = None
 
 
-class PdfExtractResult(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PdfExtractResult(_Result):
     """Result of PDF text extraction."""
     file: str
     total_pages: int
@@ -99,7 +119,8 @@ class PdfExtractResult(BaseModel):
     content: List[Dict[str, Any]]
 
 
-class OcrResult(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class OcrResult(_Result):
     """Result of OCR text extraction."""
     file: str
     language: str
@@ -107,7 +128,8 @@ class OcrResult(BaseModel):
     character_count: int
 
 
-class TableParseResult(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TableParseResult(_Result):
     """Result of parsing tabular data from text."""
     columns: Optional[List[str]] = None
     row_count: Optional[int] = None
@@ -115,7 +137,8 @@ class TableParseResult(BaseModel):
     raw_row: Optional[List[str]] = None
 
 
-class QueryResult(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class QueryResult(_Result):
     """Result of a database query."""
     rows_returned: int
     columns: List[str]
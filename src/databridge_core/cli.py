@@ -1,15 +1,149 @@
 """DataBridge Core CLI -- Rich-formatted data reconciliation from the terminal."""
 
-import json
+import mmap
+import os
 import sys
+from bisect import bisect_right
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
 import click
 
+from ._rich import get_console
+
+# Choice values for the options below, kept as module-level tuples so Click
+# validates against one shared sequence. transform's ops mirror
+# reconciler.transform._OPERATIONS, which is not imported here to keep pandas
+# off the CLI startup path.
+_TRANSFORM_OPS = ("upper", "lower", "strip", "trim_spaces", "remove_special")
+_MERGE_TYPES = ("inner", "left", "right", "outer")
+_STANDARDS = ("US_GAAP", "IFRS", "JGAAP", "DUAL")
+
+# Files at least this large are decoded straight from a memory map instead of
+# being copied into a bytes object first.
+_MMAP_MIN_BYTES = 4 << 20
+
+
+def _read_text(path):
+    """Read a UTF-8 text file with one bulk read and a single decode.
+
+    Undecodable bytes become U+FFFD and line endings are normalized to
+    ``\\n``, as text-mode reads would. Large files are decoded from a
+    memory map, so only the decoded text is held in memory.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                text = str(mm, "utf-8", "replace")
+        else:
+            text = f.read().decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+# Styles for values below, between and above a pair of ascending thresholds.
+_RED_TO_GREEN = ("red", "yellow", "green")
+_GREEN_TO_RED = ("green", "yellow", "red")
+
+
+def _bucket_style(value, thresholds, styles):
+    """Return the style for ``value``: ``styles[i]`` where ``i`` thresholds are met."""
+    return styles[bisect_right(thresholds, value)]
+
+
+@lru_cache(maxsize=None)
+def _styled_cell(text, style):
+    """Return a table cell showing ``text`` in ``style``, built once per pair."""
+    from ._rich import Text
+
+    return Text.assemble((text, style))
+
+
+def _severity_cell(severity):
+    """Return the styled severity cell for finding tables."""
+    style = "red" if severity == "CRITICAL" else ("yellow" if severity == "HIGH" else "dim")
+    return _styled_cell(severity, style)
+
+
+def _batch_workers(workers):
+    """Resolve a batch command's --workers, defaulting to half the CPUs.
+
+    The library functions default to running in-process; only the CLI,
+    whose entry point is import-safe for worker processes, opts in.
+    """
+    from ._batch import default_workers
+
+    return default_workers() if workers is None else workers
+
+
+def _by_count(counts):
+    """Return ``counts`` items from most to least frequent, ties in insertion order."""
+    return sorted(counts.items(), key=itemgetter(1), reverse=True)
+
+
+def _json_default(value):
+    """Convert the NumPy, pandas and result objects ``json`` cannot encode."""
+    for name in ("model_dump", "tolist", "isoformat"):
+        method = getattr(value, name, None)
+        if method is not None:
+            return method()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def _print_json(result):
+    """Print ``result`` as one JSON document when ``--json`` was given.
+
+    Returns True if it did, so the command can skip building Rich output.
+    """
+    if not click.get_current_context().find_root().params.get("as_json"):
+        return False
+    import json
+
+    click.echo(json.dumps(result, default=_json_default, ensure_ascii=False))
+    return True
+
+
+def _preview_cells(records, columns):
+    """Yield each preview record's values for ``columns`` as display strings.
+
+    Records missing a column (ragged pasted tables) show an empty cell.
+    """
+    if not columns:
+        for _ in records:
+            yield ()
+        return
+    get = itemgetter(*columns)
+    single = len(columns) == 1
+    for row in records:
+        try:
+            values = get(row)
+        except KeyError:
+            values = tuple(row.get(c, "") for c in columns)
+        else:
+            if single:
+                values = (values,)
+        yield tuple(map(str, values))
+
+
+def _preview_table(records, columns, title=None, **column_options):
+    """Build a Rich table of preview records with every column declared up front."""
+    from ._rich import Column, Table
+
+    table = Table(*(Column(c, **column_options) for c in columns), title=title)
+    for cells in _preview_cells(records, columns):
+        table.add_row(*cells)
+    return table
+
 
 @click.group()
 @click.version_option(package_name="databridge-core")
-def cli():
+@click.option("--json", "as_json", is_flag=True,
+              help="Print each command's result as JSON instead of tables.")
+def cli(as_json):
     """DataBridge Core -- Data reconciliation, profiling, and ingestion toolkit."""
     pass
 
@@ -18,49 +152,55 @@ def cli():
 @click.argument("file", type=click.Path(exists=True))
 def profile(file):
     """Profile a CSV file: structure, quality, cardinality."""
-    from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
-
+    from ._rich import Panel, Table
     from .profiler import profile_data
 
-    console = Console()
+    console = get_console()
 
     with console.status("Profiling..."):
         result = profile_data(file)
 
-    console.print(Panel(
-        f"[bold]{result['file']}[/bold]\n"
-        f"Rows: {result['rows']:,}  |  Columns: {result['columns']}  |  "
-        f"Type: {result['structure_type']}",
-        title="Profile Summary",
-    ))
+    if _print_json(result):
+        return
 
-    # Column types table
-    table = Table(title="Columns")
-    table.add_column("Column", style="cyan")
-    table.add_column("Type", style="green")
-    table.add_column("Nulls %", style="yellow")
-    table.add_column("Cardinality", style="magenta")
-
-    null_pct = result["data_quality"]["null_percentage"]
-    for col, dtype in result["column_types"].items():
-        card = "KEY" if col in result["potential_key_columns"] else (
-            "HIGH" if col in result["high_cardinality_cols"] else (
-                "LOW" if col in result["low_cardinality_cols"] else "-"
-            )
-        )
-        table.add_row(col, dtype, f"{null_pct.get(col, 0):.1f}%", card)
+    # Buffer the report and write it to the terminal in one go
+    with console:
+        console.print(Panel(
+            f"[bold]{result['file']}[/bold]\n"
+            f"Rows: {result['rows']:,}  |  Columns: {result['columns']}  |  "
+            f"Type: {result['structure_type']}",
+            title="Profile Summary",
+        ))
 
-    console.print(table)
+        # Column types table
+        table = Table(title="Columns")
+        table.add_column("Column", style="cyan")
+        table.add_column("Type", style="green")
+        table.add_column("Nulls %", style="yellow")
+        table.add_column("Cardinality", style="magenta")
+
+        null_pct = result["data_quality"]["null_percentage"]
+        # Later labels win: a key column is reported as KEY even when it is
+        # also high-cardinality.
+        card_map = {
+            **dict.fromkeys(result["low_cardinality_cols"], "LOW"),
+            **dict.fromkeys(result["high_cardinality_cols"], "HIGH"),
+            **dict.fromkeys(result["potential_key_columns"], "KEY"),
+        }
+        for col, dtype in result["column_types"].items():
+            card = card_map.get(col, "-")
+            table.add_row(col, dtype, f"{null_pct.get(col, 0):.1f}%", card)
 
-    dq = result["data_quality"]
-    console.print(f"\nDuplicate rows: {dq['duplicate_rows']} ({dq['duplicate_percentage']}%)")
+        console.print(table)
 
-    if result["potential_key_columns"]:
-        console.print(
-            f"Potential key columns: [bold cyan]{', '.join(result['potential_key_columns'])}[/bold cyan]"
-        )
+        dq = result["data_quality"]
+        console.print(f"\nDuplicate rows: {dq['duplicate_rows']} ({dq['duplicate_percentage']}%)")
+
+        if result["potential_key_columns"]:
+            console.print(
+                "Potential key columns: "
+                f"[bold cyan]{', '.join(result['potential_key_columns'])}[/bold cyan]"
+            )
 
 
 @cli.command()
@@ -70,45 +210,46 @@ def profile(file):
 @click.option("--compare", default="", help="Comma-separated compare columns (default: all non-key).")
 def compare(source_a, source_b, keys, compare):
     """Compare two CSV files by hashing rows."""
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
-
+    from ._rich import Panel, Table
     from .reconciler import compare_hashes
 
-    console = Console()
+    console = get_console()
 
     with console.status("Comparing..."):
         result = compare_hashes(source_a, source_b, keys, compare)
 
-    stats = result["statistics"]
+    if _print_json(result):
+        return
 
-    console.print(Panel(
-        f"Source A: {result['source_a']['total_rows']:,} rows  |  "
-        f"Source B: {result['source_b']['total_rows']:,} rows\n"
-        f"Keys: {', '.join(result['key_columns'])}  |  "
-        f"Compare: {len(result['compare_columns'])} columns",
-        title="Comparison",
-    ))
+    with console:
+        stats = result["statistics"]
 
-    table = Table(title="Results")
-    table.add_column("Metric", style="cyan")
-    table.add_column("Count", style="bold", justify="right")
+        console.print(Panel(
+            f"Source A: {result['source_a']['total_rows']:,} rows  |  "
+            f"Source B: {result['source_b']['total_rows']:,} rows\n"
+            f"Keys: {', '.join(result['key_columns'])}  |  "
+            f"Compare: {len(result['compare_columns'])} columns",
+            title="Comparison",
+        ))
 
-    match_style = "green" if stats["match_rate_percent"] >= 90 else (
-        "yellow" if stats["match_rate_percent"] >= 70 else "red"
-    )
+        table = Table(title="Results")
+        table.add_column("Metric", style="cyan")
+        table.add_column("Count", style="bold", justify="right")
 
-    table.add_row("Exact matches", str(stats["exact_matches"]))
-    table.add_row("Conflicts", f"[red]{stats['conflicts']}[/red]" if stats["conflicts"] else "0")
-    table.add_row("Orphans in A only", str(stats["orphans_only_in_source_a"]))
-    table.add_row("Orphans in B only", str(stats["orphans_only_in_source_b"]))
-    table.add_row(
-        "Match rate",
-        f"[{match_style}]{stats['match_rate_percent']}%[/{match_style}]",
-    )
+        match_style = _bucket_style(stats["match_rate_percent"], (70, 90), _RED_TO_GREEN)
 
-    console.print(table)
+        table.add_row("Exact matches", str(stats["exact_matches"]))
+        table.add_row(
+            "Conflicts", f"[red]{stats['conflicts']}[/red]" if stats["conflicts"] else "0"
+        )
+        table.add_row("Orphans in A only", str(stats["orphans_only_in_source_a"]))
+        table.add_row("Orphans in B only", str(stats["orphans_only_in_source_b"]))
+        table.add_row(
+            "Match rate",
+            f"[{match_style}]{stats['match_rate_percent']}%[/{match_style}]",
+        )
+
+        console.print(table)
 
 
 @cli.command()
@@ -118,33 +259,38 @@ def compare(source_a, source_b, keys, compare):
 @click.option("--column-b", default="", help="Column name in source B (default: same as --column).")
 @click.option("--threshold", "-t", default=80, help="Minimum similarity (0-100).")
 @click.option("--limit", "-n", default=10, help="Maximum matches to show.")
-def fuzzy(source_a, source_b, column, column_b, threshold, limit):
+@click.option("--preprocess", is_flag=True, help="Ignore case, punctuation and padding.")
+def fuzzy(source_a, source_b, column, column_b, threshold, limit, preprocess):
     """Find fuzzy matches between two CSV columns."""
-    from rich.console import Console
-    from rich.table import Table
-
+    from ._rich import Table
     from .reconciler import fuzzy_match_columns
 
-    console = Console()
+    console = get_console()
     col_b = column_b or column
 
     with console.status("Fuzzy matching..."):
-        result = fuzzy_match_columns(source_a, source_b, column, col_b, threshold, limit)
+        result = fuzzy_match_columns(
+            source_a, source_b, column, col_b, threshold, limit, preprocess=preprocess
+        )
 
-    console.print(f"\n[bold]Found {result['total_matches']} matches[/bold] "
-                  f"(threshold: {threshold}%)\n")
+    if _print_json(result):
+        return
+
+    with console:
+        console.print(f"\n[bold]Found {result['total_matches']} matches[/bold] "
+                      f"(threshold: {threshold}%)\n")
 
-    table = Table(title="Top Matches")
-    table.add_column("Value A", style="cyan")
-    table.add_column("Value B", style="green")
-    table.add_column("Score", justify="right", style="bold")
+        table = Table(title="Top Matches")
+        table.add_column("Value A", style="cyan")
+        table.add_column("Value B", style="green")
+        table.add_column("Score", justify="right", style="bold")
 
-    for m in result["top_matches"]:
-        score = m["similarity"]
-        style = "green" if score >= 90 else ("yellow" if score >= 80 else "red")
-        table.add_row(m["value_a"], m["value_b"], f"[{style}]{score:.0f}%[/{style}]")
+        for m in result["top_matches"]:
+            score = m["similarity"]
+            style = _bucket_style(score, (80, 90), _RED_TO_GREEN)
+            table.add_row(m["value_a"], m["value_b"], _styled_cell(f"{score:.0f}%", style))
 
-    console.print(table)
+        console.print(table)
 
 
 @cli.command()
@@ -152,19 +298,22 @@ def fuzzy(source_a, source_b, column, column_b, threshold, limit):
 @click.argument("file_b", type=click.Path(exists=True))
 def diff(file_a, file_b):
     """Show text diff between two files."""
-    from rich.console import Console
-    from rich.syntax import Syntax
-
     from .reconciler import unified_diff
 
-    console = Console()
+    console = get_console()
 
-    text_a = Path(file_a).read_text()
-    text_b = Path(file_b).read_text()
+    text_a = _read_text(file_a)
+    text_b = _read_text(file_b)
 
     result = unified_diff(text_a, text_b, from_label=file_a, to_label=file_b)
 
+    if _print_json({"identical": not result, "diff": result}):
+        return
+
     if result:
+        # Syntax pulls in Pygments; identical files never need it
+        from ._rich import Syntax
+
         console.print(Syntax(result, "diff", theme="monokai"))
     else:
         console.print("[green]Files are identical.[/green]")
@@ -175,76 +324,78 @@ def diff(file_a, file_b):
 @click.argument("new_file", type=click.Path(exists=True))
 def drift(old_file, new_file):
     """Detect schema drift between two CSV files."""
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
-
+    from ._rich import Panel, Table
     from .profiler import detect_schema_drift
 
-    console = Console()
+    console = get_console()
 
     with console.status("Detecting drift..."):
         result = detect_schema_drift(old_file, new_file)
 
-    if not result["has_drift"]:
-        console.print("[green]No schema drift detected.[/green]")
+    if _print_json(result):
         return
 
-    console.print(Panel("[bold red]Schema drift detected[/bold red]", title="Drift Report"))
-
-    if result["columns_added"]:
-        console.print(f"[green]+ Added:[/green] {', '.join(result['columns_added'])}")
-    if result["columns_removed"]:
-        console.print(f"[red]- Removed:[/red] {', '.join(result['columns_removed'])}")
-
-    if result["type_changes"]:
-        table = Table(title="Type Changes")
-        table.add_column("Column", style="cyan")
-        table.add_column("From", style="red")
-        table.add_column("To", style="green")
-        table.add_column("Safe?", justify="center")
-
-        for col, info in result["type_changes"].items():
-            safe = info.get("safe_conversion")
-            safe_str = "[green]Yes[/green]" if safe else (
-                "[red]No[/red]" if safe is False else "-"
-            )
-            table.add_row(col, info["from"], info["to"], safe_str)
+    with console:
+        if not result["has_drift"]:
+            console.print("[green]No schema drift detected.[/green]")
+            return
+
+        console.print(Panel("[bold red]Schema drift detected[/bold red]", title="Drift Report"))
+
+        if result["columns_added"]:
+            console.print(f"[green]+ Added:[/green] {', '.join(result['columns_added'])}")
+        if result["columns_removed"]:
+            console.print(f"[red]- Removed:[/red] {', '.join(result['columns_removed'])}")
+
+        if result["type_changes"]:
+            table = Table(title="Type Changes")
+            table.add_column("Column", style="cyan")
+            table.add_column("From", style="red")
+            table.add_column("To", style="green")
+            table.add_column("Safe?", justify="center")
+
+            for col, info in result["type_changes"].items():
+                safe = info.get("safe_conversion")
+                safe_str = "[green]Yes[/green]" if safe else (
+                    "[red]No[/red]" if safe is False else "-"
+                )
+                table.add_row(col, info["from"], info["to"], safe_str)
 
-        console.print(table)
+            console.print(table)
 
 
 @cli.command()
 @click.argument("file", type=click.Path(exists=True))
 @click.option("--column", "-c", required=True, help="Column to transform.")
-@click.option("--op", required=True, type=click.Choice(
-    ["upper", "lower", "strip", "trim_spaces", "remove_special"]
-), help="Transformation operation.")
+@click.option("--op", required=True, type=click.Choice(_TRANSFORM_OPS),
+              help="Transformation operation.")
 @click.option("--output", "-o", default="", help="Output file path (default: preview only).")
 def transform(file, column, op, output):
     """Apply a string transformation to a CSV column."""
-    from rich.console import Console
-    from rich.table import Table
-
+    from ._rich import Table
     from .reconciler import transform_column
 
-    console = Console()
+    console = get_console()
 
     result = transform_column(file, column, op, output)
 
-    table = Table(title=f"Transform: {op}({column})")
-    table.add_column("Before", style="red")
-    table.add_column("After", style="green")
+    if _print_json(result):
+        return
+
+    with console:
+        table = Table(title=f"Transform: {op}({column})")
+        table.add_column("Before", style="red")
+        table.add_column("After", style="green")
 
-    for before, after in zip(result["preview"]["before"], result["preview"]["after"]):
-        table.add_row(str(before), str(after))
+        for before, after in zip(result["preview"]["before"], result["preview"]["after"]):
+            table.add_row(str(before), str(after))
 
-    console.print(table)
+        console.print(table)
 
-    if "saved_to" in result:
-        console.print(f"\nSaved to: [bold]{result['saved_to']}[/bold]")
-    else:
-        console.print(f"\n[dim]{result.get('note', '')}[/dim]")
+        if "saved_to" in result:
+            console.print(f"\nSaved to: [bold]{result['saved_to']}[/bold]")
+        else:
+            console.print(f"\n[dim]{result.get('note', '')}[/dim]")
 
 
 @cli.command()
@@ -252,38 +403,35 @@ def transform(file, column, op, output):
 @click.argument("source_b", type=click.Path(exists=True))
 @click.option("--keys", required=True, help="Comma-separated key columns.")
 @click.option("--type", "merge_type", default="inner",
-              type=click.Choice(["inner", "left", "right", "outer"]),
+              type=click.Choice(_MERGE_TYPES),
               help="Merge type (default: inner).")
 @click.option("--output", "-o", default="", help="Output file path.")
 def merge(source_a, source_b, keys, merge_type, output):
     """Merge two CSV files on key columns."""
-    from rich.console import Console
-    from rich.table import Table
-
     from .reconciler import merge_sources
 
-    console = Console()
+    console = get_console()
 
     with console.status("Merging..."):
         result = merge_sources(source_a, source_b, keys, merge_type, output)
 
-    console.print(
-        f"\n[bold]Merged:[/bold] {result['source_a_rows']:,} + {result['source_b_rows']:,} "
-        f"-> {result['merged_rows']:,} rows ({merge_type})"
-    )
+    if _print_json(result):
+        return
 
-    if result["preview"]:
-        table = Table(title="Preview (first rows)")
-        for col in result["columns"][:10]:
-            table.add_column(col, style="cyan", overflow="fold")
+    with console:
+        console.print(
+            f"\n[bold]Merged:[/bold] {result['source_a_rows']:,} + {result['source_b_rows']:,} "
+            f"-> {result['merged_rows']:,} rows ({merge_type})"
+        )
 
-        for row in result["preview"][:5]:
-            table.add_row(*[str(row.get(c, "")) for c in result["columns"][:10]])
+        if result["preview"]:
+            console.print(_preview_table(
+                result["preview"][:5], result["columns"][:10],
+                title="Preview (first rows)", style="cyan", overflow="fold",
+            ))
 
-        console.print(table)
-
-    if "saved_to" in result:
-        console.print(f"\nSaved to: [bold]{result['saved_to']}[/bold]")
+        if "saved_to" in result:
+            console.print(f"\nSaved to: [bold]{result['saved_to']}[/bold]")
 
 
 @cli.command()
@@ -291,29 +439,31 @@ def merge(source_a, source_b, keys, merge_type, output):
 @click.option("--name", "-n", default="", help="Filename substring filter.")
 def find(pattern, name):
     """Find files matching a glob pattern."""
-    from rich.console import Console
-    from rich.table import Table
-
+    from ._rich import Table
     from .files import find_files
 
-    console = Console()
+    console = get_console()
 
     with console.status("Searching..."):
         result = find_files(pattern, name)
 
-    console.print(f"\n[bold]Found {result['files_found']} files[/bold]\n")
+    if _print_json(result):
+        return
 
-    if result["files"]:
-        table = Table()
-        table.add_column("Name", style="cyan")
-        table.add_column("Size", justify="right")
-        table.add_column("Modified", style="dim")
-        table.add_column("Directory", style="dim", overflow="fold")
+    with console:
+        console.print(f"\n[bold]Found {result['files_found']} files[/bold]\n")
 
-        for f in result["files"]:
-            table.add_row(f["name"], f"{f['size_kb']:.1f} KB", f["modified"][:16], f["directory"])
+        if result["files"]:
+            table = Table()
+            table.add_column("Name", style="cyan")
+            table.add_column("Size", justify="right")
+            table.add_column("Modified", style="dim")
+            table.add_column("Directory", style="dim", overflow="fold")
 
-        console.print(table)
+            for f in result["files"]:
+                table.add_row(f["name"], f"{f['size_kb']:.1f} KB", f["modified"][:16], f["directory"])
+
+            console.print(table)
 
 
 @cli.command()
@@ -322,45 +472,58 @@ def find(pattern, name):
 @click.option("--workers", "-w", default=4, help="Number of parallel workers.")
 def triage(directory, output, workers):
     """Scan a directory of Excel files and classify by archetype."""
-    from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
+    from ._rich import Panel, Table
 
-    console = Console()
+    console = get_console()
 
+    # The triage package itself imports without openpyxl and would report
+    # every workbook as a scan error, so check for the dependency up front.
     try:
-        from .triage import scan_and_classify
+        import openpyxl  # noqa: F401
     except ImportError:
         console.print("[red]Triage requires openpyxl. Install with:[/red]")
-        console.print("  pip install 'databridge-core[triage]'")
+        console.print("  pip install 'databridge-core\\[triage]'")
         raise SystemExit(1)
 
-    with console.status("Scanning Excel files..."):
+    from .triage import scan_and_classify
+
+    with console.status("Scanning Excel files...") as status:
         result = scan_and_classify(
             directory=directory,
             output_dir=output,
             max_workers=workers,
+            progress_callback=lambda done, total, _name: status.update(
+                f"Scanning Excel files... {done}/{total}"
+            ),
+            # The CLI entry point is import-safe for worker processes
+            use_processes=True,
         )
 
-    summary = result["summary"]
-    console.print(Panel(
-        f"[bold]Scanned {summary['total_files']} files[/bold] in {summary['duration_seconds']:.1f}s "
-        f"({summary['files_per_second']:.1f} files/sec)\n"
-        f"OK: {summary['scanned']}  |  Errors: {summary['errors']}  |  Skipped: {summary['skipped']}",
-        title="Triage Summary",
-    ))
+    if _print_json(result):
+        return
+
+    with console:
+        summary = result["summary"]
+        console.print(Panel(
+            f"[bold]Scanned {summary['total_files']} files[/bold] "
+            f"in {summary['duration_seconds']:.1f}s "
+            f"({summary['files_per_second']:.1f} files/sec)\n"
+            f"OK: {summary['scanned']}  |  Errors: {summary['errors']}  |  "
+            f"Skipped: {summary['skipped']}",
+            title="Triage Summary",
+        ))
 
-    if summary.get("archetype_counts"):
-        table = Table(title="Archetype Distribution")
-        table.add_column("Archetype", style="cyan")
-        table.add_column("Count", justify="right", style="bold")
+        if summary.get("archetype_counts"):
+            table = Table(title="Archetype Distribution")
+            table.add_column("Archetype", style="cyan")
+            table.add_column("Count", justify="right", style="bold")
 
-        for archetype, count in sorted(summary["archetype_counts"].items(), key=lambda x: -x[1]):
-            table.add_row(archetype, str(count))
+            for archetype, count in _by_count(summary["archetype_counts"]):
+                table.add_row(archetype, str(count))
 
-        console.print(table)
+            console.print(table)
 
-    console.print(f"\nReports saved to: [bold]{output}[/bold]")
+        console.print(f"\nReports saved to: [bold]{output}[/bold]")
 
 
 @cli.command()
@@ -369,15 +532,12 @@ def triage(directory, output, workers):
 @click.option("--delimiter", "-d", default="auto", help="Column delimiter.")
 def parse(text, file, delimiter):
     """Parse tabular data from text or a file."""
-    from rich.console import Console
-    from rich.table import Table
-
     from .ingestion import parse_table_from_text
 
-    console = Console()
+    console = get_console()
 
     if file:
-        text = Path(file).read_text()
+        text = _read_text(file)
     elif not text:
         text = click.get_text_stream("stdin").read()
 
@@ -387,20 +547,19 @@ def parse(text, file, delimiter):
 
     result = parse_table_from_text(text, delimiter)
 
-    if "raw_row" in result and result["raw_row"]:
-        console.print(f"Single row: {result['raw_row']}")
+    if _print_json(result):
         return
 
-    console.print(f"\n[bold]Parsed {result['row_count']} rows[/bold]\n")
-
-    table = Table(title="Parsed Table")
-    for col in result["columns"]:
-        table.add_column(col, style="cyan")
+    with console:
+        if "raw_row" in result and result["raw_row"]:
+            console.print(f"Single row: {result['raw_row']}")
+            return
 
-    for row in result["preview"]:
-        table.add_row(*[str(row.get(c, "")) for c in result["columns"]])
+        console.print(f"\n[bold]Parsed {result['row_count']} rows[/bold]\n")
 
-    console.print(table)
+        console.print(_preview_table(
+            result["preview"], result["columns"], title="Parsed Table", style="cyan",
+        ))
 
 
 # ---------------------------------------------------------------------------
@@ -412,16 +571,15 @@ def parse(text, file, delimiter):
 @click.argument("file_or_dir", type=click.Path(exists=True))
 @click.option("--pattern", "-p", default="*.csv", help="Glob pattern for batch mode.")
 @click.option("--limit", "-n", default=0, help="Max files for batch mode (0 = unlimited).")
+@click.option("--workers", "-w", default=None, type=int,
+              help="Worker processes for batch mode (default: half the CPUs).")
 @click.option("--all-scores", is_flag=True, help="Show scores for all ERP systems.")
-def erp_detect(file_or_dir, pattern, limit, all_scores):
+def erp_detect(file_or_dir, pattern, limit, workers, all_scores):
     """Detect source ERP system from COA file fingerprints."""
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
-
+    from ._rich import Panel, Table
     from .erp_detect import detect_erp, detect_erp_batch
 
-    console = Console()
+    console = get_console()
     target = Path(file_or_dir)
 
     if target.is_file():
@@ -432,9 +590,10 @@ def erp_detect(file_or_dir, pattern, limit, all_scores):
             console.print(f"[red]Error: {result['error']}[/red]")
             raise SystemExit(1)
 
-        style = "green" if result["confidence"] >= 0.5 else (
-            "yellow" if result["confidence"] >= 0.2 else "red"
-        )
+        if _print_json(result):
+            return
+
+        style = _bucket_style(result["confidence"], (0.2, 0.5), _RED_TO_GREEN)
         console.print(Panel(
             f"[bold]ERP:[/bold] [{style}]{result['detected_erp']}[/{style}]  |  "
             f"Confidence: [{style}]{result['confidence']:.0%}[/{style}]  |  "
@@ -460,12 +619,17 @@ def erp_detect(file_or_dir, pattern, limit, all_scores):
             console.print(table)
     else:
         with console.status("Scanning directory..."):
-            result = detect_erp_batch(str(target), pattern=pattern, limit=limit)
+            result = detect_erp_batch(
+                str(target), pattern=pattern, limit=limit, workers=_batch_workers(workers)
+            )
 
         if result.get("error"):
             console.print(f"[red]Error: {result['error']}[/red]")
             raise SystemExit(1)
 
+        if _print_json(result):
+            return
+
         console.print(Panel(
             f"[bold]Scanned {result['total_files']} files[/bold]  |  "
             f"Errors: {result['errors']}",
@@ -478,7 +642,7 @@ def erp_detect(file_or_dir, pattern, limit, all_scores):
             table.add_column("Count", justify="right", style="bold")
             table.add_column("Avg Confidence", justify="right")
 
-            for erp, count in sorted(result["erp_distribution"].items(), key=lambda x: -x[1]):
+            for erp, count in _by_count(result["erp_distribution"]):
                 avg = result["avg_confidence"].get(erp, 0)
                 table.add_row(erp, str(count), f"{avg:.0%}")
 
@@ -489,15 +653,14 @@ def erp_detect(file_or_dir, pattern, limit, all_scores):
 @click.argument("file_or_dir", type=click.Path(exists=True))
 @click.option("--checks", "-c", default="", help="Comma-separated checks (default: all 6).")
 @click.option("--limit", "-n", default=0, help="Max files for batch mode (0 = unlimited).")
-def fraud_detect(file_or_dir, checks, limit):
+@click.option("--workers", "-w", default=None, type=int,
+              help="Worker processes for batch mode (default: half the CPUs).")
+def fraud_detect(file_or_dir, checks, limit, workers):
     """Scan transaction data for fraud indicators (6 pattern types)."""
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
-
+    from ._rich import Panel, Table
     from .fraud_detect import detect_fraud, detect_fraud_batch
 
-    console = Console()
+    console = get_console()
     target = Path(file_or_dir)
     check_list = [c.strip() for c in checks.split(",") if c.strip()] or None
 
@@ -509,8 +672,11 @@ def fraud_detect(file_or_dir, checks, limit):
             console.print(f"[red]Error: {result['error']}[/red]")
             raise SystemExit(1)
 
+        if _print_json(result):
+            return
+
         risk = result["risk_score"]
-        style = "red" if risk >= 50 else ("yellow" if risk >= 20 else "green")
+        style = _bucket_style(risk, (20, 50), _GREEN_TO_RED)
 
         console.print(Panel(
             f"[bold]File:[/bold] {result['file']}  |  "
@@ -527,11 +693,9 @@ def fraud_detect(file_or_dir, checks, limit):
             table.add_column("Evidence", overflow="fold")
 
             for f in result["findings"]:
-                sev = f.get("severity", "")
-                sev_style = "red" if sev == "CRITICAL" else ("yellow" if sev == "HIGH" else "dim")
                 table.add_row(
                     f.get("type", ""),
-                    f"[{sev_style}]{sev}[/{sev_style}]",
+                    _severity_cell(f.get("severity", "")),
                     f.get("evidence", ""),
                 )
 
@@ -540,12 +704,15 @@ def fraud_detect(file_or_dir, checks, limit):
             console.print("[green]No fraud indicators detected.[/green]")
     else:
         with console.status("Scanning directory..."):
-            result = detect_fraud_batch(str(target), limit=limit)
+            result = detect_fraud_batch(str(target), limit=limit, workers=_batch_workers(workers))
 
         if result.get("error"):
             console.print(f"[red]Error: {result['error']}[/red]")
             raise SystemExit(1)
 
+        if _print_json(result):
+            return
+
         console.print(Panel(
             f"[bold]Scanned {result['total_files']} files[/bold]  |  "
             f"Total findings: {result['total_findings']}  |  "
@@ -558,7 +725,7 @@ def fraud_detect(file_or_dir, checks, limit):
             table.add_column("Type", style="cyan")
             table.add_column("Count", justify="right", style="bold")
 
-            for ftype, count in sorted(result["by_type"].items(), key=lambda x: -x[1]):
+            for ftype, count in _by_count(result["by_type"]):
                 table.add_row(ftype, str(count))
 
             console.print(table)
@@ -578,15 +745,14 @@ def fraud_detect(file_or_dir, checks, limit):
 @cli.command("fx-validate")
 @click.argument("file_or_dir", type=click.Path(exists=True))
 @click.option("--limit", "-n", default=0, help="Max files for batch mode (0 = unlimited).")
-def fx_validate(file_or_dir, limit):
+@click.option("--workers", "-w", default=None, type=int,
+              help="Worker processes for batch mode (default: half the CPUs).")
+def fx_validate(file_or_dir, limit, workers):
     """Validate FX translation rates in multi-currency trial balances."""
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
-
+    from ._rich import Panel, Table
     from .fx_validate import validate_fx, validate_fx_batch
 
-    console = Console()
+    console = get_console()
     target = Path(file_or_dir)
 
     if target.is_file():
@@ -597,8 +763,11 @@ def fx_validate(file_or_dir, limit):
             console.print(f"[red]Error: {result['error']}[/red]")
             raise SystemExit(1)
 
+        if _print_json(result):
+            return
+
         risk = result.get("risk_score", 0)
-        style = "red" if risk >= 50 else ("yellow" if risk >= 20 else "green")
+        style = _bucket_style(risk, (20, 50), _GREEN_TO_RED)
 
         console.print(Panel(
             f"[bold]File:[/bold] {result['file']}  |  "
@@ -617,11 +786,9 @@ def fx_validate(file_or_dir, limit):
             table.add_column("Evidence", overflow="fold")
 
             for f in result["findings"]:
-                sev = f.get("severity", "")
-                sev_style = "red" if sev == "CRITICAL" else ("yellow" if sev == "HIGH" else "dim")
                 table.add_row(
                     f.get("type", ""),
-                    f"[{sev_style}]{sev}[/{sev_style}]",
+                    _severity_cell(f.get("severity", "")),
                     f.get("account", ""),
                     f.get("evidence", ""),
                 )
@@ -631,12 +798,15 @@ def fx_validate(file_or_dir, limit):
             console.print("[green]No FX issues detected.[/green]")
     else:
         with console.status("Scanning directory..."):
-            result = validate_fx_batch(str(target), limit=limit)
+            result = validate_fx_batch(str(target), limit=limit, workers=_batch_workers(workers))
 
         if result.get("error"):
             console.print(f"[red]Error: {result['error']}[/red]")
             raise SystemExit(1)
 
+        if _print_json(result):
+            return
+
         console.print(Panel(
             f"[bold]Scanned {result['total_files']} files[/bold]  |  "
             f"Files with issues: {result['files_with_issues']}  |  "
@@ -649,7 +819,7 @@ def fx_validate(file_or_dir, limit):
             table.add_column("Type", style="cyan")
             table.add_column("Count", justify="right", style="bold")
 
-            for ftype, count in sorted(result["by_type"].items(), key=lambda x: -x[1]):
+            for ftype, count in _by_count(result["by_type"]):
                 table.add_row(ftype, str(count))
 
             console.print(table)
@@ -670,18 +840,17 @@ def fx_validate(file_or_dir, limit):
 @cli.command("standards-check")
 @click.argument("file_or_dir", type=click.Path(exists=True))
 @click.option("--standard", "-s", default=None,
-              type=click.Choice(["US_GAAP", "IFRS", "JGAAP", "DUAL"], case_sensitive=False),
+              type=click.Choice(_STANDARDS, case_sensitive=False),
               help="Override standard (default: auto-detect).")
 @click.option("--limit", "-n", default=0, help="Max files for batch mode (0 = unlimited).")
-def standards_check(file_or_dir, standard, limit):
+@click.option("--workers", "-w", default=None, type=int,
+              help="Worker processes for batch mode (default: half the CPUs).")
+def standards_check(file_or_dir, standard, limit, workers):
     """Check COA files for GAAP/IFRS/J-GAAP compliance violations."""
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
-
+    from ._rich import Panel, Table
     from .standards_check import check_standards, check_standards_batch
 
-    console = Console()
+    console = get_console()
     target = Path(file_or_dir)
 
     if target.is_file():
@@ -692,8 +861,11 @@ def standards_check(file_or_dir, standard, limit):
             console.print(f"[red]Error: {result['error']}[/red]")
             raise SystemExit(1)
 
+        if _print_json(result):
+            return
+
         score = result.get("compliance_score", 0)
-        style = "green" if score >= 80 else ("yellow" if score >= 50 else "red")
+        style = _bucket_style(score, (50, 80), _RED_TO_GREEN)
 
         console.print(Panel(
             f"[bold]File:[/bold] {result['file']}  |  "
@@ -712,13 +884,9 @@ def standards_check(file_or_dir, standard, limit):
             table.add_column("Issue", overflow="fold")
 
             for f in result["findings"]:
-                sev = f.get("severity", "")
-                sev_style = "red" if sev == "CRITICAL" else (
-                    "yellow" if sev == "HIGH" else "dim"
-                )
                 table.add_row(
                     f.get("type", ""),
-                    f"[{sev_style}]{sev}[/{sev_style}]",
+                    _severity_cell(f.get("severity", "")),
                     f.get("account", ""),
                     f.get("issue", ""),
                 )
@@ -728,14 +896,19 @@ def standards_check(file_or_dir, standard, limit):
             console.print("[green]Fully compliant. No issues found.[/green]")
     else:
         with console.status("Scanning directory..."):
-            result = check_standards_batch(str(target), target_standard=standard, limit=limit)
+            result = check_standards_batch(
+                str(target), target_standard=standard, limit=limit, workers=_batch_workers(workers)
+            )
 
         if result.get("error"):
             console.print(f"[red]Error: {result['error']}[/red]")
             raise SystemExit(1)
 
+        if _print_json(result):
+            return
+
         avg = result.get("avg_compliance_score", 0)
-        style = "green" if avg >= 80 else ("yellow" if avg >= 50 else "red")
+        style = _bucket_style(avg, (50, 80), _RED_TO_GREEN)
 
         console.print(Panel(
             f"[bold]Scanned {result['total_files']} files[/bold]  |  "
@@ -750,7 +923,7 @@ def standards_check(file_or_dir, standard, limit):
             table.add_column("Standard", style="cyan")
             table.add_column("Count", justify="right", style="bold")
 
-            for std, count in sorted(result["by_standard"].items(), key=lambda x: -x[1]):
+            for std, count in _by_count(result["by_standard"]):
                 table.add_row(std, str(count))
 
             console.print(table)
@@ -777,13 +950,10 @@ def standards_check(file_or_dir, standard, limit):
 @click.option("--threshold", "-t", default=0.65, type=float, help="Link threshold (default 0.65)")
 def link_entities_cmd(logic_dna_dir, output, threshold):
     """Resolve entities across Logic DNA files."""
-    from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
-
+    from ._rich import Panel, Table
     from .linker import link_entities
 
-    console = Console()
+    console = get_console()
 
     with console.status("Linking entities..."):
         result = link_entities(logic_dna_dir, output_dir=output, threshold=threshold)
@@ -792,6 +962,9 @@ def link_entities_cmd(logic_dna_dir, output, threshold):
         console.print(f"[red]Error: {result['error']}[/red]")
         raise SystemExit(1)
 
+    if _print_json(result):
+        return
+
     summary = result.get("summary", {})
     console.print(Panel(
         f"[bold]Clusters: {summary.get('total_clusters', 0)}[/bold]  |  "
@@ -829,16 +1002,17 @@ def link_entities_cmd(logic_dna_dir, output, threshold):
 @click.option("--output", "-o", default="data/expectations", help="Output directory")
 def expect_cmd(file, name, output):
     """Generate data quality expectations from a file."""
-    from rich.console import Console
-    from rich.panel import Panel
-
+    from ._rich import Panel
     from .profiler import generate_expectation_suite
 
-    console = Console()
+    console = get_console()
 
     with console.status("Generating expectations..."):
         result = generate_expectation_suite(file, name=name, output_dir=output)
 
+    if _print_json(result):
+        return
+
     console.print(Panel(
         f"[bold]Suite: {result['suite_name']}[/bold]  |  "
         f"Expectations: {result['expectations_count']}  |  "
@@ -853,13 +1027,10 @@ def expect_cmd(file, name, output):
 @click.option("--suite-dir", default="data/expectations", help="Suite directory")
 def validate_cmd(file, suite, suite_dir):
     """Validate a data file against an expectation suite."""
-    from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
-
+    from ._rich import Panel, Table
     from .profiler import validate
 
-    console = Console()
+    console = get_console()
 
     suite_path = suite if suite.endswith(".json") else None
     suite_name = None if suite_path else suite
@@ -867,6 +1038,9 @@ def validate_cmd(file, suite, suite_dir):
     with console.status("Validating..."):
         result = validate(file, suite_path=suite_path, suite_name=suite_name, suite_dir=suite_dir)
 
+    if _print_json(result):
+        return
+
     status = result["status"]
     style = "green" if status == "passed" else "red"
 
@@ -902,12 +1076,9 @@ def validate_cmd(file, suite, suite_dir):
 @click.option("--limit", "-l", default=10, type=int, help="Max preview rows")
 def query_cmd(sql, register, limit):
     """Execute SQL against local files using DuckDB."""
-    from rich.console import Console
-    from rich.table import Table
-
     from .connectors import query_local
 
-    console = Console()
+    console = get_console()
 
     reg_files = {}
     for r in register:
@@ -918,18 +1089,13 @@ def query_cmd(sql, register, limit):
     with console.status("Querying..."):
         result = query_local(sql, register_files=reg_files or None, max_preview_rows=limit)
 
+    if _print_json(result):
+        return
+
     console.print(f"[bold]{result['rows_returned']} rows returned[/bold]")
 
     if result.get("preview"):
-        table = Table()
-        cols = result.get("columns", [])
-        for c in cols:
-            table.add_column(c)
-
-        for row in result["preview"]:
-            table.add_row(*[str(row.get(c, "")) for c in cols])
-
-        console.print(table)
+        console.print(_preview_table(result["preview"], result.get("columns", [])))
 
         if result.get("truncated"):
             console.print(f"[dim]... showing {limit} of {result['rows_returned']} rows[/dim]")
@@ -7,8 +7,11 @@ Install via: ``pip install databridge-core[duckdb]``
 from __future__ import annotations
 
 import os
+import queue
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import pandas as pd
 
@@ -18,56 +21,177 @@ try:
 except ImportError:
     DUCKDB_AVAILABLE = False
 
-# Module-level connection (lazy singleton)
-_conn: Optional["duckdb.DuckDBPyConnection"] = None
+# Statements whose result can be wrapped as a subquery for LIMIT/COUNT pushdown
+_QUERY_PREFIXES = ("SELECT", "WITH", "FROM", "VALUES")
 
+# Name of the window-count column added to wrapped queries (dropped by position)
+_TOTAL_COLUMN = "__databridge_total_rows"
 
-def _get_conn() -> "duckdb.DuckDBPyConnection":
-    """Get or create the module-level DuckDB connection."""
-    global _conn
+# Module-level in-memory database (lazy singleton)
+_db: Optional["duckdb.DuckDBPyConnection"] = None
+_db_lock = threading.Lock()
+
+# Idle cursors on _db. A DuckDB connection runs one query at a time, so each
+# call borrows its own cursor; all of them see the same tables and views.
+_POOL_SIZE = min(4, os.cpu_count() or 1)
+_idle: "queue.Queue[duckdb.DuckDBPyConnection]" = queue.Queue()
+
+# Whether DuckDB's excel extension (read_xlsx) could be loaded; None until tried
+_excel_loaded: Optional[bool] = None
+
+
+def _open_db() -> "duckdb.DuckDBPyConnection":
+    """Open the in-memory database and apply the session-wide settings."""
+    db = duckdb.connect(":memory:")
+    # Keep Parquet footers in memory between queries (DuckDB revalidates
+    # them against the file). 1.1+ calls this parquet_metadata_cache;
+    # older releases enable it through enable_object_cache.
+    for setting in ("parquet_metadata_cache", "enable_object_cache"):
+        try:
+            db.execute(f"SET GLOBAL {setting} = true")
+            break
+        except duckdb.Error:
+            continue
+    return db
+
+
+def _get_db() -> "duckdb.DuckDBPyConnection":
+    """Get or create the module-level in-memory DuckDB database.
+
+    Creation is locked so that threads racing on first use share a single
+    database rather than each registering views in their own.
+    """
+    global _db
     if not DUCKDB_AVAILABLE:
         raise ImportError(
             "DuckDB is not installed. Run: pip install duckdb  "
             "or: pip install databridge-core[duckdb]"
         )
-    if _conn is None:
-        _conn = duckdb.connect(":memory:")
-    return _conn
+    if _db is None:
+        with _db_lock:
+            if _db is None:
+                _db = _open_db()
+    return _db
+
+
+@contextmanager
+def _checkout_conn() -> Iterator["duckdb.DuckDBPyConnection"]:
+    """Borrow a cursor on the shared database for the duration of one call.
+
+    Concurrent callers get separate cursors, so their queries run in
+    parallel instead of queueing on one connection. Up to
+    :data:`_POOL_SIZE` cursors are kept for reuse; extras are closed.
+    """
+    db = _get_db()
+    try:
+        conn = _idle.get_nowait()
+    except queue.Empty:
+        conn = db.cursor()
+    try:
+        yield conn
+    finally:
+        if _idle.qsize() < _POOL_SIZE:
+            _idle.put(conn)
+        else:
+            conn.close()
+
+
+def _quote_ident(name: str) -> str:
+    """Quote ``name`` as a SQL identifier, doubling any embedded quotes."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _csv_scan(conn: "duckdb.DuckDBPyConnection", path_escaped: str) -> str:
+    """Return a SELECT over a CSV with its dialect and column types sniffed once.
+
+    A view over ``read_csv_auto`` re-sniffs the file every time a query binds
+    it. ``sniff_csv`` (DuckDB 0.10+) spells the detected options out as an
+    explicit ``read_csv`` call, so later queries skip detection. Falls back to
+    ``read_csv_auto`` when sniffing is unavailable.
+    """
+    scan = f"FROM read_csv('{path_escaped}',"
+    try:
+        row = conn.execute(f"SELECT Prompt FROM sniff_csv('{path_escaped}')").fetchone()
+    except duckdb.Error:
+        row = None
+    if row and row[0].startswith(scan):
+        return "SELECT * " + row[0].rstrip().rstrip(";")
+    return f"SELECT * FROM read_csv_auto('{path_escaped}')"
+
+
+def _load_excel_extension(conn: "duckdb.DuckDBPyConnection") -> bool:
+    """Install and load DuckDB's ``excel`` extension once per process.
+
+    Returns False when it cannot be loaded (older DuckDB, or offline without
+    a cached copy), in which case workbooks are read through pandas.
+    """
+    global _excel_loaded
+    if _excel_loaded is None:
+        try:
+            conn.execute("INSTALL excel; LOAD excel")
+            _excel_loaded = True
+        except duckdb.Error:
+            _excel_loaded = False
+    return _excel_loaded
 
 
 def _register_file(conn: "duckdb.DuckDBPyConnection", file_path: str, table_name: str) -> None:
-    """Register a file as a named view in DuckDB."""
+    """Register a file as a named view in DuckDB.
+
+    CSV schemas are detected at registration; register the file again after
+    its columns change.
+    """
     path = Path(file_path).resolve()
     ext = path.suffix.lower()
     path_escaped = str(path).replace("'", "''")
+    view = _quote_ident(table_name)
 
     if ext == ".csv":
         conn.execute(
-            f'CREATE OR REPLACE VIEW "{table_name}" AS '
-            f"SELECT * FROM read_csv_auto('{path_escaped}')"
+            f"CREATE OR REPLACE VIEW {view} AS {_csv_scan(conn, path_escaped)}"
         )
     elif ext == ".parquet":
         conn.execute(
-            f'CREATE OR REPLACE VIEW "{table_name}" AS '
+            f"CREATE OR REPLACE VIEW {view} AS "
             f"SELECT * FROM read_parquet('{path_escaped}')"
         )
     elif ext == ".json":
         conn.execute(
-            f'CREATE OR REPLACE VIEW "{table_name}" AS '
+            f"CREATE OR REPLACE VIEW {view} AS "
             f"SELECT * FROM read_json_auto('{path_escaped}')"
         )
     elif ext in (".xlsx", ".xls", ".xlsb"):
+        # read_xlsx parses the workbook natively. It types each column from
+        # the first data row, so the sheet is scanned once up front; .xls,
+        # .xlsb and sheets whose later rows break that typing go through pandas.
+        if ext == ".xlsx" and _load_excel_extension(conn):
+            try:
+                conn.execute(
+                    f"CREATE OR REPLACE VIEW {view} AS "
+                    f"SELECT * FROM read_xlsx('{path_escaped}')"
+                )
+                conn.execute(f"SELECT COUNT(*) FROM {view}").fetchone()
+                return
+            except duckdb.Error:
+                pass
         engine = "pyxlsb" if ext == ".xlsb" else None
         df = pd.read_excel(file_path, engine=engine)
         df.columns = [str(c) for c in df.columns]
         for col in df.columns:
             if df[col].dtype == object:
                 df[col] = df[col].astype(str).replace("nan", None)
+        # Registered frames are only visible to the cursor that registered
+        # them, so the rows are copied into a table every cursor can read.
         tmp = f"_tmp_{table_name}"
+        tmp_quoted = _quote_ident(tmp)
         conn.register(tmp, df)
-        conn.execute(
-            f'CREATE OR REPLACE VIEW "{table_name}" AS SELECT * FROM "{tmp}"'
-        )
+        try:
+            conn.execute(
+                f"CREATE OR REPLACE TABLE {tmp_quoted} AS SELECT * FROM {tmp_quoted}"
+            )
+        finally:
+            conn.unregister(tmp)
+        conn.execute(f"CREATE OR REPLACE VIEW {view} AS SELECT * FROM {tmp_quoted}")
     else:
         raise ValueError(f"Unsupported file format: {ext}")
 
@@ -87,22 +211,42 @@ def query_local(
 
     Returns:
         Dict with columns, dtypes, row count, and preview data.
-    """
-    conn = _get_conn()
 
-    if register_files:
-        for name, path in register_files.items():
-            _register_file(conn, path, name)
-
-    result_df = conn.execute(sql).fetchdf()
-    preview_rows = min(len(result_df), max_preview_rows)
+    Single queries (``SELECT``/``WITH``/``FROM``/``VALUES``) are run once as a
+    ``LIMIT``-ed preview carrying a ``COUNT(*) OVER ()`` of the full result,
+    so only the preview rows are converted to pandas; ``dtypes`` then
+    describe the preview frame. Other statements, and scripts of several
+    statements, are executed as given.
+    """
+    with _checkout_conn() as conn:
+        if register_files:
+            for name, path in register_files.items():
+                _register_file(conn, path, name)
+
+        body = sql.strip().rstrip(";")
+        if body.upper().startswith(_QUERY_PREFIXES) and ";" not in body:
+            # Only the preview rows reach pandas; the window counts the rest in
+            # the same pass, so the query runs once. Newlines keep a trailing
+            # -- comment from swallowing the parenthesis.
+            preview_df = conn.execute(
+                f"SELECT *, COUNT(*) OVER () AS {_TOTAL_COLUMN} FROM (\n{body}\n) "
+                f"LIMIT {int(max_preview_rows)}"
+            ).fetchdf()
+            total_rows = int(preview_df.iloc[0, -1]) if len(preview_df) else 0
+            preview_df = preview_df.iloc[:, :-1]
+        else:
+            # DDL, PRAGMA, DESCRIBE, multi-statement scripts, ... cannot be
+            # wrapped in a subquery
+            preview_df = conn.execute(sql).fetchdf()
+            total_rows = len(preview_df)
+            preview_df = preview_df.head(max_preview_rows)
 
     return {
-        "rows_returned": len(result_df),
-        "columns": list(result_df.columns),
-        "dtypes": {col: str(dtype) for col, dtype in result_df.dtypes.items()},
-        "preview": result_df.head(preview_rows).to_dict(orient="records"),
-        "truncated": len(result_df) > preview_rows,
+        "rows_returned": total_rows,
+        "columns": list(preview_df.columns),
+        "dtypes": {col: str(dtype) for col, dtype in preview_df.dtypes.items()},
+        "preview": preview_df.to_dict(orient="records"),
+        "truncated": total_rows > len(preview_df),
         "sql": sql,
     }
 
@@ -121,18 +265,19 @@ def register_table(file_path: str, table_name: str) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    conn = _get_conn()
-    _register_file(conn, file_path, table_name)
+    with _checkout_conn() as conn:
+        _register_file(conn, file_path, table_name)
 
-    # Get info
-    count_row = conn.execute(f'SELECT COUNT(*) FROM "{table_name}"').fetchone()
-    row_count = count_row[0] if count_row else 0
+        # Get info
+        view = _quote_ident(table_name)
+        count_row = conn.execute(f"SELECT COUNT(*) FROM {view}").fetchone()
+        row_count = count_row[0] if count_row else 0
 
-    schema_df = conn.execute(f'DESCRIBE "{table_name}"').fetchdf()
-    schema = [
-        {"column": r["column_name"], "type": r["column_type"]}
-        for _, r in schema_df.iterrows()
-    ]
+        # DESCRIBE rows start with (column_name, column_type, ...)
+        schema = [
+            {"column": row[0], "type": row[1]}
+            for row in conn.execute(f"DESCRIBE {view}").fetchall()
+        ]
 
     return {
         "table_name": table_name,
@@ -149,28 +294,26 @@ def list_tables() -> Dict[str, Any]:
     Returns:
         Dict with table_count and list of table info dicts.
     """
-    conn = _get_conn()
-
-    tables_df = conn.execute(
-        "SELECT table_name, table_type FROM information_schema.tables "
-        "WHERE table_schema = 'main'"
-    ).fetchdf()
-
-    tables = []
-    for _, row in tables_df.iterrows():
-        name = row["table_name"]
-        if name.startswith("_tmp_"):
-            continue
-        try:
-            count_row = conn.execute(f'SELECT COUNT(*) FROM "{name}"').fetchone()
-            row_count = count_row[0] if count_row else 0
-        except Exception:
-            row_count = -1
-        tables.append({
-            "table_name": name,
-            "table_type": row["table_type"],
-            "row_count": row_count,
-        })
+    with _checkout_conn() as conn:
+        table_rows = conn.execute(
+            "SELECT table_name, table_type FROM information_schema.tables "
+            "WHERE table_schema = 'main'"
+        ).fetchall()
+
+        tables = []
+        for name, table_type in table_rows:
+            if name.startswith("_tmp_"):
+                continue
+            try:
+                count_row = conn.execute(f"SELECT COUNT(*) FROM {_quote_ident(name)}").fetchone()
+                row_count = count_row[0] if count_row else 0
+            except Exception:
+                row_count = -1
+            tables.append({
+                "table_name": name,
+                "table_type": table_type,
+                "row_count": row_count,
+            })
 
     return {
         "table_count": len(tables),
@@ -188,22 +331,26 @@ def export_to_parquet(sql_or_table: str, output_path: str) -> Dict[str, Any]:
     Returns:
         Dict with output_path, row_count, and file_size_bytes.
     """
-    conn = _get_conn()
     out = Path(output_path)
     out.parent.mkdir(parents=True, exist_ok=True)
 
     # Determine if input is a table name or SQL
     sql = sql_or_table
     if not sql_or_table.strip().upper().startswith("SELECT"):
-        sql = f'SELECT * FROM "{sql_or_table}"'
+        sql = f"SELECT * FROM {_quote_ident(sql_or_table)}"
 
     path_escaped = str(out.resolve()).replace("'", "''")
-    conn.execute(f"COPY ({sql}) TO '{path_escaped}' (FORMAT PARQUET)")
+    with _checkout_conn() as conn:
+        # COPY reports how many rows it wrote; older DuckDB versions that do not
+        # are covered by the written file's footer, not by re-running the query.
+        count_row = conn.execute(f"COPY ({sql}) TO '{path_escaped}' (FORMAT PARQUET)").fetchone()
+        if not count_row:
+            count_row = conn.execute(
+                f"SELECT num_rows FROM parquet_file_metadata('{path_escaped}')"
+            ).fetchone()
+        row_count = count_row[0] if count_row else 0
 
     file_size = out.stat().st_size if out.exists() else 0
-    # Get row count
-    count_row = conn.execute(f"SELECT COUNT(*) FROM ({sql})").fetchone()
-    row_count = count_row[0] if count_row else 0
 
     return {
         "output_path": str(out),
@@ -8,14 +8,20 @@ from __future__ import annotations
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .._batch import list_files
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_COUNTEREXAMPLE_DIR = "data/detection/counterexamples"
 
+# Fixtures are small, so loading is dominated by open/read latency
+_LOAD_WORKERS = 8
+
 
 def capture_counterexample(
     file_path: str,
@@ -45,12 +51,14 @@ def capture_counterexample(
     out_dir = Path(output_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    # One clock reading, so the file name and captured_at always agree
+    now = datetime.now(timezone.utc)
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     stem = Path(file_path).stem if file_path else "unknown"
     out_file = out_dir / f"cx_{stem}_{timestamp}.json"
 
     counterexample = {
-        "captured_at": datetime.now(timezone.utc).isoformat(),
+        "captured_at": now.isoformat(),
         "source_file": file_path,
         "finding_count": len(findings),
         "warning_count": len(monitor_warnings),
@@ -61,7 +69,7 @@ def capture_counterexample(
 
     try:
         with open(out_file, "w", encoding="utf-8") as f:
-            json.dump(counterexample, f, indent=2, default=str)
+            json.dump(counterexample, f, indent=2, ensure_ascii=False, default=str)
         logger.info("Captured counterexample: %s", out_file)
         return str(out_file)
     except Exception as e:
@@ -86,16 +94,24 @@ def load_counterexamples(
     if not cx_dir.exists():
         return []
 
-    files = sorted(cx_dir.glob("cx_*.json"), reverse=True)[:limit]
-    results: List[Dict[str, Any]] = []
+    # Names embed the capture timestamp, so reverse name order is newest first
+    files = list_files(str(cx_dir), "cx_*.json")[::-1][:limit]
+    if len(files) < 2:
+        loaded = [_load_one(f) for f in files]
+    else:
+        with ThreadPoolExecutor(max_workers=min(_LOAD_WORKERS, len(files))) as pool:
+            loaded = list(pool.map(_load_one, files))
+
+    return [data for data in loaded if data is not None]
 
-    for f in files:
-        try:
-            with open(f, "r", encoding="utf-8") as fh:
-                data = json.load(fh)
-            data["_file"] = str(f)
-            results.append(data)
-        except Exception as e:
-            logger.warning("Failed to load counterexample %s: %s", f, e)
 
-    return results
+def _load_one(file_path: str) -> Optional[Dict[str, Any]]:
+    """Read one counterexample file, or return None if it cannot be loaded."""
+    try:
+        with open(file_path, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        data["_file"] = file_path
+        return data
+    except Exception as e:
+        logger.warning("Failed to load counterexample %s: %s", file_path, e)
+        return None
@@ -9,11 +9,17 @@ All feedback is persisted to a JSONL file for full auditability.
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
-from collections import defaultdict
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 from ._types import (
     FeedbackAction,
@@ -36,6 +42,9 @@ _DISMISS_PENALTY = 0.08  # -8% per dismissal
 _MIN_CONFIDENCE = 0.05
 _MAX_CONFIDENCE = 1.0
 
+# Raw "action" value of a confirmation, as stored in the JSONL records
+_CONFIRMED = FeedbackAction.CONFIRMED.value
+
 
 def record_feedback(
     finding_id: str,
@@ -79,9 +88,9 @@ def record_feedback(
     fb_path = Path(feedback_path)
     fb_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Append to JSONL
-    with open(fb_path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(record.model_dump(mode="json"), default=str) + "\n")
+    # Append to JSONL in a single write, serialized by pydantic's encoder
+    with open(fb_path, "ab") as f:
+        f.write(record.model_dump_json().encode() + b"\n")
 
     logger.info(
         "Recorded %s feedback for finding %s (rule=%s)",
@@ -132,6 +141,28 @@ def _thompson_should_suppress(
     return theta < min_trust, theta
 
 
+def _feedback_decision(
+    confirmed: int,
+    dismissed: int,
+    strategy: str,
+    min_trust: float,
+    seed: Optional[int],
+) -> Optional[float]:
+    """Return None if a rule pattern is suppressed, else its confidence adjustment."""
+    if strategy == "thompson":
+        suppress, _theta = _thompson_should_suppress(
+            confirmed, dismissed, min_trust=min_trust, seed=seed
+        )
+    else:
+        # Legacy threshold strategy
+        suppress = dismissed > _SUPPRESS_THRESHOLD and confirmed == 0
+    if suppress:
+        return None
+
+    net = confirmed - dismissed
+    return net * _CONFIRM_BOOST if net >= 0 else net * _DISMISS_PENALTY
+
+
 def apply_feedback_filter(
     findings: List[GroundedFinding],
     feedback_path: str = DEFAULT_FEEDBACK_PATH,
@@ -147,7 +178,8 @@ def apply_feedback_filter(
        combination is deemed unreliable are removed. The suppression
        strategy is controlled by the *strategy* parameter:
        - ``"thompson"`` (default): Beta distribution sampling; suppresses
-         when sampled theta < *min_trust*. Allows concept drift recovery.
+         when sampled theta < *min_trust*, drawing once per pattern per
+         call. Allows concept drift recovery.
        - ``"threshold"`` (legacy): Hard cutoff at >3 dismissals with 0
          confirmations.
     2. **Confidence adjustment** -- For non-suppressed findings, the
@@ -165,39 +197,34 @@ def apply_feedback_filter(
     Returns:
         Filtered and confidence-adjusted list of findings.
     """
-    feedback_records = _load_feedback(feedback_path)
-    if not feedback_records:
+    total, _confirmed, tallies = _feedback_summary(feedback_path)
+    if not total:
         return findings
 
-    # Build per-rule feedback tallies: (rule_id, finding_type) -> counts
-    tallies = _build_tallies(feedback_records)
-
     filtered: List[GroundedFinding] = []
     suppressed_count = 0
+    # Per (rule_id, finding_type): None to suppress, else the confidence
+    # adjustment. Each pattern is decided once per call, so findings of the
+    # same rule are kept or suppressed together.
+    decisions: Dict[tuple, Optional[float]] = {}
 
     for finding in findings:
         key = (finding.rule_id, finding.finding_type.value)
-        tally = tallies.get(key)
-
-        if tally is None:
-            # No feedback for this rule pattern -- keep as-is
-            filtered.append(finding)
-            continue
-
-        confirmed = tally["confirmed"]
-        dismissed = tally["dismissed"]
-
-        # Suppression check
-        if strategy == "thompson":
-            suppress, _theta = _thompson_should_suppress(
-                confirmed, dismissed, min_trust=min_trust, seed=seed
-            )
+        if key in decisions:
+            adjustment = decisions[key]
         else:
-            # Legacy threshold strategy
-            suppress = dismissed > _SUPPRESS_THRESHOLD and confirmed == 0
+            tally = tallies.get(key)
+            if tally is None:
+                # No feedback for this rule pattern -- keep as-is
+                filtered.append(finding)
+                continue
+            adjustment = decisions[key] = _feedback_decision(
+                tally["confirmed"], tally["dismissed"], strategy, min_trust, seed
+            )
 
-        if suppress:
+        if adjustment is None:
             suppressed_count += 1
+            tally = tallies[key]
             logger.debug(
                 "Suppressed finding %s (rule=%s, type=%s, strategy=%s): "
                 "%d confirmed, %d dismissed",
@@ -205,14 +232,11 @@ def apply_feedback_filter(
                 finding.rule_id,
                 finding.finding_type.value,
                 strategy,
-                confirmed,
-                dismissed,
+                tally["confirmed"],
+                tally["dismissed"],
             )
             continue
 
-        # Confidence adjustment
-        net = confirmed - dismissed
-        adjustment = net * _CONFIRM_BOOST if net >= 0 else net * _DISMISS_PENALTY
         new_confidence = max(
             _MIN_CONFIDENCE,
             min(_MAX_CONFIDENCE, finding.confidence + adjustment),
@@ -246,9 +270,9 @@ def get_detection_stats(
     Returns:
         Dict with performance and learning statistics.
     """
-    feedback_records = _load_feedback(feedback_path)
+    total, confirmed_total, tallies = _feedback_summary(feedback_path)
 
-    if not feedback_records:
+    if not total:
         return {
             "total_feedback": 0,
             "confirmed": 0,
@@ -260,14 +284,8 @@ def get_detection_stats(
             "message": "No feedback recorded yet",
         }
 
-    total = len(feedback_records)
-    confirmed_total = sum(
-        1 for r in feedback_records if r.get("action") == FeedbackAction.CONFIRMED.value
-    )
     dismissed_total = total - confirmed_total
 
-    tallies = _build_tallies(feedback_records)
-
     suppressed = 0
     active = 0
     for key, tally in tallies.items():
@@ -324,58 +342,136 @@ def get_detection_stats(
 # -- Internal helpers ---------------------------------------------------------
 
 
-def _load_feedback(feedback_path: str) -> List[Dict[str, Any]]:
-    """Load all feedback records from the JSONL file.
+_Summary = Tuple[int, int, Dict[tuple, Dict[str, int]]]
 
-    Returns an empty list if the file does not exist or is empty.
-    """
-    fb_path = Path(feedback_path)
-    if not fb_path.exists():
-        return []
+# Feedback files read so far: real path -> (inode, mtime_ns, bytes tallied,
+# fingerprint of those bytes, summary). The JSONL is append-only, so later
+# reads only parse what was appended.
+_summaries: Dict[str, Tuple[int, int, int, bytes, _Summary]] = {}
 
-    records: List[Dict[str, Any]] = []
-    try:
-        with open(fb_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    records.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-    except OSError as exc:
-        logger.warning("Failed to read feedback file %s: %s", fb_path, exc)
+# Bytes hashed from each end of the tallied prefix to detect rewrites
+_FINGERPRINT_BYTES = 4096
 
-    return records
 
+def _prefix_fingerprint(f: IO[bytes], end: int) -> bytes:
+    """Hash the first and last few KiB of the first ``end`` bytes of ``f``."""
+    digest = hashlib.blake2b(digest_size=16)
+    f.seek(0)
+    digest.update(f.read(min(end, _FINGERPRINT_BYTES)))
+    start = max(0, end - _FINGERPRINT_BYTES)
+    f.seek(start)
+    digest.update(f.read(end - start))
+    return digest.digest()
 
-def _build_tallies(
-    records: List[Dict[str, Any]],
-) -> Dict[tuple, Dict[str, int]]:
-    """Build per-rule feedback tallies from raw records.
 
-    Returns a dict keyed by ``(rule_id, finding_type)`` with counts of
-    confirmed, dismissed, and total reviews.
+def _parse_lines(lines: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+    """Decode JSONL lines as they arrive, skipping blank and malformed ones.
+
+    Uses orjson's C decoder when it is installed, else :func:`json.loads`.
     """
-    tallies: Dict[tuple, Dict[str, int]] = defaultdict(
-        lambda: {"confirmed": 0, "dismissed": 0, "total": 0}
-    )
+    for line in lines:
+        if not line or line.isspace():
+            continue
+        try:
+            yield _json_loads(line)
+        except ValueError:
+            continue
+
+
+def _add_records(
+    summary: _Summary,
+    records: Iterable[Dict[str, Any]],
+) -> _Summary:
+    """Return ``summary`` with ``records`` counted in, leaving ``summary`` intact.
+
+    The per-rule tallies are keyed by ``(rule_id, finding_type)`` with
+    counts of confirmed, dismissed, and total reviews. Records are consumed
+    in one pass, so a generator is never materialized; records without a
+    ``rule_id`` count towards the totals only.
+    """
+    total, confirmed, base = summary
+    tallies: Optional[Dict[tuple, Dict[str, int]]] = None
 
     for record in records:
-        rule_id = record.get("rule_id", "")
-        finding_type = record.get("finding_type", "")
-        action = record.get("action", "")
+        if tallies is None:
+            tallies = {key: dict(counts) for key, counts in base.items()}
+        total += 1
+        is_confirmed = record.get("action", "") == _CONFIRMED
+        confirmed += is_confirmed
 
-        # Skip records without a rule_id (cannot be aggregated)
+        rule_id = record.get("rule_id", "")
         if not rule_id:
             continue
 
-        key = (rule_id, finding_type)
-        tallies[key]["total"] += 1
-        if action == FeedbackAction.CONFIRMED.value:
-            tallies[key]["confirmed"] += 1
+        key = (rule_id, record.get("finding_type", ""))
+        tally = tallies.get(key)
+        if tally is None:
+            tally = tallies[key] = {"confirmed": 0, "dismissed": 0, "total": 0}
+        tally["total"] += 1
+        if is_confirmed:
+            tally["confirmed"] += 1
         else:
-            tallies[key]["dismissed"] += 1
+            tally["dismissed"] += 1
+
+    if tallies is None:
+        return summary
+    return total, confirmed, tallies
+
+
+def _feedback_summary(
+    feedback_path: str,
+) -> _Summary:
+    """Return (record count, confirmed count, per-rule tallies) for a feedback file.
+
+    Returns zero counts if the file does not exist. The summary is kept per
+    file and extended with only the bytes appended since the last call, so
+    detection runs do not re-parse the history; a replaced or truncated file
+    is re-read from the start. The tallies are shared between callers and
+    must not be modified.
+    """
+    try:
+        st = os.stat(feedback_path)
+    except OSError:
+        return 0, 0, {}
+
+    real_path = os.path.realpath(feedback_path)
+    empty: _Summary = (0, 0, {})
+    inode, mtime_ns, offset, fingerprint, summary = _summaries.get(
+        real_path, (-1, 0, 0, b"", empty)
+    )
+    if inode != st.st_ino or st.st_size < offset:
+        offset, summary = 0, empty
+    elif st.st_size == offset and st.st_mtime_ns == mtime_ns:
+        return summary
+
+    # Lines are decoded and tallied as they are read, so memory stays
+    # bounded by the number of rules rather than the size of the history.
+    # A line still being written is counted now but re-read next time.
+    partial = b""
+    consumed = 0
+
+    def complete_lines(f: IO[bytes]) -> Iterator[bytes]:
+        nonlocal partial, consumed
+        for line in f:
+            if line.endswith(b"\n"):
+                consumed += len(line)
+                yield line
+            else:
+                partial = line
+
+    try:
+        with open(real_path, "rb") as f:
+            # A file rewritten in place (or truncated and refilled past the
+            # old offset) no longer starts with the bytes already tallied.
+            if offset and _prefix_fingerprint(f, offset) != fingerprint:
+                offset, summary = 0, empty
+            f.seek(offset)
+            summary = _add_records(summary, _parse_lines(complete_lines(f)))
+            offset += consumed
+            fingerprint = _prefix_fingerprint(f, offset)
+    except OSError as exc:
+        logger.warning("Failed to read feedback file %s: %s", real_path, exc)
+        return summary
 
-    return dict(tallies)
+    _summaries[real_path] = (st.st_ino, st.st_mtime_ns, offset, fingerprint, summary)
+    return _add_records(summary, _parse_lines([partial]))
@@ -16,6 +16,8 @@ import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ._batch import list_files, map_files
+
 # ---------------------------------------------------------------------------
 # ERP Fingerprint Definitions
 # ---------------------------------------------------------------------------
@@ -272,6 +274,7 @@ def detect_erp_batch(
     directory: str = "data/COA_Training",
     pattern: str = "*.csv",
     limit: int = 0,
+    workers: int = 1,
 ) -> Dict[str, Any]:
     """Detect ERP systems for all files in a directory.
 
@@ -279,6 +282,7 @@ def detect_erp_batch(
         directory: Path to directory containing COA files.
         pattern: Glob pattern for files to scan.
         limit: Max files to process (0 = unlimited).
+        workers: Worker processes for batches of 8+ files (default 1: in-process).
 
     Returns:
         Dict with summary stats and per-ERP counts.
@@ -288,9 +292,9 @@ def detect_erp_batch(
         return {"error": f"Directory not found: {directory}"}
 
     # Collect both CSV and TXT files
-    files = sorted(dir_path.glob(pattern))
+    files = list_files(directory, pattern)
     if pattern == "*.csv":
-        files.extend(sorted(dir_path.glob("*.txt")))
+        files.extend(list_files(directory, "*.txt"))
 
     if limit:
         files = files[:limit]
@@ -300,8 +304,7 @@ def detect_erp_batch(
     confidence_sum: Dict[str, float] = {}
     errors = 0
 
-    for f in files:
-        det = detect_erp(str(f))
+    for det in map_files(detect_erp, files, workers):
         erp = det["detected_erp"]
         erp_counts[erp] = erp_counts.get(erp, 0) + 1
         confidence_sum[erp] = confidence_sum.get(erp, 0) + det.get("confidence", 0)
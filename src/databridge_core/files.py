@@ -1,9 +1,15 @@
 """File discovery and staging utilities."""
 
+import os
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+from ._batch import name_matcher
+
+# Matches nested deeper than this many path components are skipped.
+_MAX_PARTS = 15
 
 
 def _get_search_paths() -> List[Path]:
@@ -25,6 +31,37 @@ def _get_search_paths() -> List[Path]:
     return [p for p in paths if p.exists()]
 
 
+def _walk_matches(root: str, pattern: str) -> Iterator[os.DirEntry]:
+    """Yield entries under ``root`` whose names match ``pattern``.
+
+    Visits directories in the same pre-order as :meth:`pathlib.Path.rglob`
+    but reads each one with a single :func:`os.scandir` call, does not
+    follow directory symlinks, and stops descending once matches could no
+    longer be shallow enough to report.
+    """
+    match = name_matcher(pattern)
+    normcase = os.path.normcase
+    stack = [(root, len(Path(root).parts))]
+    while stack:
+        directory, depth = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            if match(normcase(entry.name)):
+                yield entry
+            if depth < _MAX_PARTS:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append((entry.path, depth + 1))
+                except OSError:
+                    pass
+        stack.extend(reversed(subdirs))
+
+
 def find_files(
     pattern: str = "*.csv",
     search_name: str = "",
@@ -45,30 +82,36 @@ def find_files(
     seen_paths: set = set()
 
     for search_dir in search_paths:
+        if "/" in pattern or os.sep in pattern:
+            matches = search_dir.rglob(pattern)
+        else:
+            matches = _walk_matches(str(search_dir), pattern)
         try:
-            for file_path in search_dir.rglob(pattern):
+            for entry in matches:
                 if len(found_files) >= max_results:
                     break
 
-                abs_path = str(file_path.resolve())
+                abs_path = os.path.realpath(entry)
                 if abs_path in seen_paths:
                     continue
                 seen_paths.add(abs_path)
 
-                if search_name and search_name.lower() not in file_path.name.lower():
+                name = entry.name
+                if search_name and search_name.lower() not in name.lower():
                     continue
 
-                if len(file_path.parts) > 15:
+                path = os.fspath(entry)
+                if len(Path(path).parts) > _MAX_PARTS:
                     continue
 
                 try:
-                    stat = file_path.stat()
+                    stat = entry.stat()
                     found_files.append({
-                        "path": str(file_path),
-                        "name": file_path.name,
+                        "path": path,
+                        "name": name,
                         "size_kb": round(stat.st_size / 1024, 2),
                         "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        "directory": str(file_path.parent),
+                        "directory": os.path.dirname(path),
                     })
                 except (OSError, PermissionError):
                     continue
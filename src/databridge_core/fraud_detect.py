@@ -21,6 +21,8 @@ from collections import Counter, defaultdict
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ._batch import list_files, map_files
+
 # ---------------------------------------------------------------------------
 # Offshore / Shell entity indicators
 # ---------------------------------------------------------------------------
@@ -448,12 +450,14 @@ def detect_fraud(
 def detect_fraud_batch(
     directory: str = "data/COA_Training/fraud_scenarios",
     limit: int = 0,
+    workers: int = 1,
 ) -> Dict[str, Any]:
     """Scan all CSV files in a directory for fraud indicators.
 
     Args:
         directory: Path to directory with transaction files.
         limit: Max files to process (0 = unlimited).
+        workers: Worker processes for batches of 8+ files (default 1: in-process).
 
     Returns:
         Dict with summary across all files.
@@ -462,7 +466,7 @@ def detect_fraud_batch(
     if not dir_path.exists():
         return {"error": f"Directory not found: {directory}"}
 
-    files = sorted(dir_path.glob("*.csv"))
+    files = list_files(directory, "*.csv")
     if limit:
         files = files[:limit]
 
@@ -471,8 +475,7 @@ def detect_fraud_batch(
     by_severity = Counter()
     high_risk_files = []
 
-    for f in files:
-        result = detect_fraud(str(f))
+    for result in map_files(detect_fraud, files, workers):
         n = result.get("findings_count", 0)
         total_findings += n
         for finding in result.get("findings", []):
@@ -16,6 +16,8 @@ from collections import Counter
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ._batch import list_files, map_files
+
 # ---------------------------------------------------------------------------
 # FX Rate reference data (approximate market rates for validation)
 # ---------------------------------------------------------------------------
@@ -295,12 +297,14 @@ def validate_fx(
 def validate_fx_batch(
     directory: str = "data/COA_Training/multicurrency",
     limit: int = 0,
+    workers: int = 1,
 ) -> Dict[str, Any]:
     """Validate FX translations for all files in a directory.
 
     Args:
         directory: Path to directory with multi-currency TB files.
         limit: Max files to process (0 = unlimited).
+        workers: Worker processes for batches of 8+ files (default 1: in-process).
 
     Returns:
         Dict with summary across all files.
@@ -309,9 +313,9 @@ def validate_fx_batch(
     if not dir_path.exists():
         return {"error": f"Directory not found: {directory}"}
 
-    files = sorted(dir_path.glob("MULTICCY_*.csv"))
+    files = list_files(directory, "MULTICCY_*.csv")
     if not files:
-        files = sorted(dir_path.glob("*.csv"))
+        files = list_files(directory, "*.csv")
     if limit:
         files = files[:limit]
 
@@ -320,8 +324,7 @@ def validate_fx_batch(
     by_severity = Counter()
     problem_files = []
 
-    for f in files:
-        result = validate_fx(str(f))
+    for result in map_files(validate_fx, files, workers):
         n = result.get("findings_count", 0)
         total_findings += n
         for finding in result.get("findings", []):
@@ -1,16 +1,17 @@
 """CSV and JSON loading utilities."""
 
+import csv
+import itertools
 import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import pandas as pd
-
 
 def load_csv(
     file_path: str,
     preview_rows: int = 5,
     max_preview_rows: int = 10,
+    preview_only: bool = False,
 ) -> Dict[str, Any]:
     """Load a CSV file and return a preview with schema information.
 
@@ -18,6 +19,9 @@ def load_csv(
         file_path: Path to the CSV file.
         preview_rows: Number of rows to preview.
         max_preview_rows: Hard limit on preview rows.
+        preview_only: Read only the header and the first ``preview_rows``
+            rows instead of parsing the whole file. The result then has
+            no ``dtypes`` or ``null_counts``, and preview values are strings.
 
     Returns:
         Dict with file info, schema, preview, and null counts.
@@ -34,8 +38,13 @@ def load_csv(
         else:
             raise FileNotFoundError(f"File not found: {file_path}")
 
-    df = pd.read_csv(file_path)
     preview_rows = min(preview_rows, max_preview_rows)
+    if preview_only:
+        return _preview_csv(file_path, preview_rows)
+
+    from .._io import read_csv
+
+    df = read_csv(file_path)
 
     return {
         "file": file_path,
@@ -47,6 +56,28 @@ def load_csv(
     }
 
 
+def _preview_csv(file_path: str, preview_rows: int) -> Dict[str, Any]:
+    """Stream the header and first rows of a CSV with the stdlib reader.
+
+    Pandas is never imported on this path; the file is read only as far as
+    the buffered block holding the last previewed row. Cells beyond the
+    header's width are dropped.
+    """
+    with open(file_path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        columns = list(reader.fieldnames or [])
+        preview = list(itertools.islice(reader, preview_rows))
+    for row in preview:
+        # DictReader files surplus cells under a None key
+        row.pop(None, None)
+
+    return {
+        "file": file_path,
+        "columns": columns,
+        "preview": preview,
+    }
+
+
 def load_json(
     file_path: str,
     preview_rows: int = 5,
@@ -62,6 +93,8 @@ def load_json(
     Returns:
         Dict with file info, columns, and preview data.
     """
+    import pandas as pd
+
     with open(file_path, "r") as f:
         data = json.load(f)
 
@@ -116,6 +149,8 @@ def query_database(
     if not query.strip().upper().startswith("SELECT"):
         raise ValueError("Only SELECT queries are allowed")
 
+    import pandas as pd
+
     engine = create_engine(connection_string)
     df = pd.read_sql(query, engine)
     preview_rows = min(preview_rows, max_preview_rows)
@@ -22,7 +22,7 @@ def parse_table_from_text(
     Raises:
         ValueError: If no text content to parse.
     """
-    lines = [line.strip() for line in text.strip().split("\n") if line.strip()]
+    lines = [line for line in map(str.strip, text.split("\n")) if line]
 
     if not lines:
         raise ValueError("No text content to parse")
@@ -45,22 +45,23 @@ def parse_table_from_text(
     elif delimiter == "pipe":
         delimiter = "|"
 
-    # Parse rows
-    rows: List[List[str]] = []
-    for line in lines:
-        if delimiter in ["\t", "|"]:
-            cells = [c.strip() for c in line.split(delimiter)]
-        else:
-            cells = [c.strip() for c in re.split(delimiter, line)]
-        rows.append(cells)
+    # Only the header and preview rows are displayed, so only they are split
+    if delimiter in ("\t", "|"):
+        def split(line: str) -> List[str]:
+            return line.split(delimiter)
+    else:
+        split = re.compile(delimiter).split
+    rows: List[List[str]] = [
+        [c.strip() for c in split(line)] for line in lines[:max_preview_rows + 1]
+    ]
 
     # Assume first row is header
-    if len(rows) > 1:
+    if len(lines) > 1:
         headers = rows[0]
         data = rows[1:]
 
         records = []
-        for row in data[:max_preview_rows]:
+        for row in data:
             record = {}
             for i, val in enumerate(row):
                 col_name = headers[i] if i < len(headers) else f"col_{i}"
@@ -69,7 +70,7 @@ def parse_table_from_text(
 
         return {
             "columns": headers,
-            "row_count": len(data),
+            "row_count": len(lines) - 1,
             "preview": records,
         }
     else:
@@ -93,15 +93,12 @@ def link_entities(
 
     # Main entity map
     map_file = out_dir / "entity_map.json"
-    map_data = entity_map.model_dump(mode="json")
-    with open(map_file, "w", encoding="utf-8") as f:
-        json.dump(map_data, f, indent=2, default=str)
+    map_file.write_text(entity_map.model_dump_json(indent=2), encoding="utf-8")
 
     # Per-cluster JSONL for large-scale querying
     clusters_file = out_dir / "entity_clusters.jsonl"
     with open(clusters_file, "w", encoding="utf-8") as f:
-        for cluster in entity_map.clusters:
-            f.write(json.dumps(cluster.model_dump(mode="json"), default=str) + "\n")
+        f.writelines(cluster.model_dump_json() + "\n" for cluster in entity_map.clusters)
 
     # 4. Build summary
     domain_counts: Dict[str, int] = {}
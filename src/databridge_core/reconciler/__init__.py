@@ -2,9 +2,13 @@
 
 Public API:
     compare_hashes       -- Row-level hash comparison between two CSVs
+    compare_hashes_df    -- Same, on already-loaded DataFrames
     get_orphan_details   -- Retrieve orphan records
+    get_orphan_details_df -- Same, on already-loaded DataFrames
     get_conflict_details -- Retrieve conflicting records with diff analysis
+    get_conflict_details_df -- Same, on already-loaded DataFrames
     fuzzy_match_columns  -- RapidFuzz matching between two columns
+    fuzzy_match_columns_df -- Same, on already-loaded DataFrames
     fuzzy_deduplicate    -- Find duplicate values within a column
     merge_sources        -- Merge two CSVs on key columns
     diff_lists / diff_dicts -- Text and data comparison
@@ -40,12 +44,16 @@ from .differ import (
 
 from .hasher import (
     compare_hashes,
+    compare_hashes_df,
     get_orphan_details,
+    get_orphan_details_df,
     get_conflict_details,
+    get_conflict_details_df,
 )
 
 from .fuzzy import (
     fuzzy_match_columns,
+    fuzzy_match_columns_df,
     fuzzy_deduplicate,
 )
 
@@ -59,8 +67,11 @@ find_similar_strings = find_close_matches
 __all__ = [
     # Hasher
     "compare_hashes",
+    "compare_hashes_df",
     "get_orphan_details",
+    "get_orphan_details_df",
     "get_conflict_details",
+    "get_conflict_details_df",
     # Differ
     "compute_similarity",
     "get_matching_blocks",
@@ -78,6 +89,7 @@ __all__ = [
     "real_quick_ratio",
     # Fuzzy
     "fuzzy_match_columns",
+    "fuzzy_match_columns_df",
     "fuzzy_deduplicate",
     # Merge
     "merge_sources",
@@ -3,11 +3,17 @@
 Requires rapidfuzz as an optional dependency.
 """
 
+import heapq
+from operator import itemgetter
 from typing import Any, Dict, List
 
+import numpy as np
 import pandas as pd
 
-from .._io import read_csv
+from .._io import read_csv, read_csvs
+
+# Size of each fuzzy_deduplicate score block (rows x column float64 scores)
+_DEDUP_BLOCK_BYTES = 32 << 20
 
 
 def fuzzy_match_columns(
@@ -17,6 +23,7 @@ def fuzzy_match_columns(
     column_b: str,
     threshold: int = 80,
     limit: int = 10,
+    preprocess: bool = False,
 ) -> Dict[str, Any]:
     """Find fuzzy matches between two columns using RapidFuzz.
 
@@ -27,6 +34,45 @@ def fuzzy_match_columns(
         column_b: Column name in source B.
         threshold: Minimum similarity score (0-100).
         limit: Maximum matches to return.
+        preprocess: Compare values case-insensitively with punctuation and
+            surrounding whitespace stripped. Reported values are unchanged.
+
+    Returns:
+        Dict with match results and similarity scores.
+
+    Raises:
+        ImportError: If rapidfuzz is not installed.
+    """
+    df_a, df_b = read_csvs(source_a_path, source_b_path)
+    return fuzzy_match_columns_df(
+        df_a, df_b, column_a, column_b, threshold, limit, preprocess=preprocess
+    )
+
+
+def fuzzy_match_columns_df(
+    df_a: pd.DataFrame,
+    df_b: pd.DataFrame,
+    column_a: str,
+    column_b: str,
+    threshold: int = 80,
+    limit: int = 10,
+    preprocess: bool = False,
+) -> Dict[str, Any]:
+    """Find fuzzy matches between two columns of already-loaded DataFrames.
+
+    Same as :func:`fuzzy_match_columns`, for callers that already hold the
+    data in memory and want to skip re-reading the CSVs.
+
+    Args:
+        df_a: First DataFrame.
+        df_b: Second DataFrame.
+        column_a: Column name in ``df_a``.
+        column_b: Column name in ``df_b``.
+        threshold: Minimum similarity score (0-100).
+        limit: Maximum matches to return.
+        preprocess: Normalize values with ``rapidfuzz.utils.default_process``
+            before scoring. Each distinct value is normalized once rather
+            than once per comparison.
 
     Returns:
         Dict with match results and similarity scores.
@@ -36,14 +82,12 @@ def fuzzy_match_columns(
     """
     try:
         from rapidfuzz import fuzz, process
+        from rapidfuzz.utils import default_process
     except ImportError:
         raise ImportError(
             "rapidfuzz not installed. Run: pip install 'databridge-core[fuzzy]'"
         )
 
-    df_a = read_csv(source_a_path)
-    df_b = read_csv(source_b_path)
-
     values_a = df_a[column_a].astype(str).unique().tolist()
     values_b = df_b[column_b].astype(str).unique().tolist()
 
@@ -54,38 +98,73 @@ def fuzzy_match_columns(
     except ImportError:
         diff_available = False
 
+    sources = values_a[:50]  # Limit source values to prevent timeout
+
+    # Normalize once up front; the scorer itself then runs without a processor.
+    if preprocess:
+        queries = [default_process(v) for v in sources]
+        choices = [default_process(v) for v in values_b]
+    else:
+        queries, choices = sources, values_b
+
+    # Exact hits score 100 by definition; only the rest go through the scorer.
+    first_b: Dict[str, int] = {}
+    for idx, choice in enumerate(choices):
+        first_b.setdefault(choice, idx)
+    best: Dict[str, tuple] = {}
+    residual = []
+    for val_a, query in zip(sources, queries):
+        idx = first_b.get(query)
+        if idx is not None:
+            best[val_a] = (values_b[idx], 100.0)
+        else:
+            residual.append((val_a, query))
+    if residual and values_b:
+        scores = process.cdist(
+            [query for _, query in residual], choices,
+            scorer=fuzz.ratio, dtype=np.float64, workers=-1,
+        )
+        # argmax keeps the first best choice, as extractOne does
+        best_idx = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(residual)), best_idx]
+        for (val_a, _), idx, score in zip(residual, best_idx.tolist(), best_scores.tolist()):
+            best[val_a] = (values_b[idx], score)
+
     matches = []
-    for val_a in values_a[:50]:  # Limit source values to prevent timeout
-        result = process.extractOne(val_a, values_b, scorer=fuzz.ratio)
+    for val_a in sources:
+        result = best.get(val_a)
         if result and result[1] >= threshold:
-            match_entry: Dict[str, Any] = {
+            matches.append({
                 "value_a": val_a,
                 "value_b": result[0],
                 "similarity": result[1],
-            }
-
-            if diff_available and result[1] < 100:
-                matching_blocks = get_matching_blocks(val_a, result[0])
-                opcodes = get_opcodes(val_a, result[0])
-                match_entry["matching_blocks"] = [
-                    {"content": b.content, "size": b.size}
-                    for b in matching_blocks if b.size > 1
-                ]
-                match_entry["alignment"] = [
-                    {"op": op.operation, "a": op.a_content, "b": op.b_content}
-                    for op in opcodes if op.operation != "equal"
-                ]
+            })
 
-            matches.append(match_entry)
+    # Stable top-N, same order as a full descending sort
+    top_matches = heapq.nlargest(limit, matches, key=itemgetter("similarity"))
 
-    matches.sort(key=lambda x: x["similarity"], reverse=True)
+    if diff_available:
+        for match_entry in top_matches:
+            val_a, val_b = match_entry["value_a"], match_entry["value_b"]
+            if val_a == val_b:
+                continue
+            matching_blocks = get_matching_blocks(val_a, val_b)
+            opcodes = get_opcodes(val_a, val_b)
+            match_entry["matching_blocks"] = [
+                {"content": b.content, "size": b.size}
+                for b in matching_blocks if b.size > 1
+            ]
+            match_entry["alignment"] = [
+                {"op": op.operation, "a": op.a_content, "b": op.b_content}
+                for op in opcodes if op.operation != "equal"
+            ]
 
     return {
         "column_a": column_a,
         "column_b": column_b,
         "threshold": threshold,
         "total_matches": len(matches),
-        "top_matches": matches[:limit],
+        "top_matches": top_matches,
     }
 
 
@@ -110,7 +189,7 @@ def fuzzy_deduplicate(
         ImportError: If rapidfuzz is not installed.
     """
     try:
-        from rapidfuzz import fuzz
+        from rapidfuzz import fuzz, process
     except ImportError:
         raise ImportError(
             "rapidfuzz not installed. Run: pip install 'databridge-core[fuzzy]'"
@@ -118,28 +197,42 @@ def fuzzy_deduplicate(
 
     df = read_csv(source_path)
     values = df[column].astype(str).unique().tolist()
-    processed: set = set()
+    processed = np.zeros(len(values), dtype=bool)
     duplicate_groups = []
 
-    for i, val in enumerate(values):
-        if val in processed:
+    # Score rows in blocks against the whole column, sized so each block's
+    # score matrix stays within _DEDUP_BLOCK_BYTES (one row at minimum);
+    # the greedy grouping below still walks values in their original order.
+    block_size = max(1, _DEDUP_BLOCK_BYTES // (8 * max(1, len(values))))
+    for block_start in range(0, len(values), block_size):
+        rows = [
+            i for i in range(block_start, min(block_start + block_size, len(values)))
+            if not processed[i]
+        ]
+        if not rows:
             continue
+        scores = process.cdist(
+            [values[i] for i in rows], values, scorer=fuzz.ratio,
+            dtype=np.float64, score_cutoff=threshold, workers=-1,
+        )
 
-        similar = []
-        for other_val in values[i + 1:]:
-            if other_val in processed:
+        for row_scores, i in zip(scores, rows):
+            if processed[i]:
                 continue
-            score = fuzz.ratio(val, other_val)
-            if score >= threshold:
-                similar.append({"value": other_val, "similarity": score})
-                processed.add(other_val)
-
-        if similar:
-            duplicate_groups.append({
-                "primary": val,
-                "similar_values": similar,
-            })
-            processed.add(val)
+
+            tail = row_scores[i + 1:]
+            hits = np.flatnonzero((tail >= threshold) & ~processed[i + 1:]) + i + 1
+            if len(hits):
+                similar = [
+                    {"value": values[j], "similarity": float(row_scores[j])}
+                    for j in hits.tolist()
+                ]
+                processed[hits] = True
+                duplicate_groups.append({
+                    "primary": values[i],
+                    "similar_values": similar,
+                })
+                processed[i] = True
 
     return {
         "column": column,
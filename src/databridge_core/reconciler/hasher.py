@@ -3,23 +3,172 @@
 Compare two CSV sources by hashing rows to identify orphans and conflicts.
 """
 
-import hashlib
-from typing import Any, Dict, List, Optional
+import os
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
-from .._io import read_csv
+from .._io import map_concurrent, read_csv, read_csvs
 
 
-def _compute_row_hash(row: pd.Series, columns: list) -> str:
-    """Compute a deterministic SHA-256 hash for a row (truncated to 16 chars)."""
-    values = "|".join(str(row[col]) for col in columns)
-    return hashlib.sha256(values.encode()).hexdigest()[:16]
+def _compute_hashes(df: pd.DataFrame, columns: list, categorize: bool = True) -> pd.Series:
+    """Compute a 64-bit hash per row over ``columns`` (vectorized).
 
+    Values are hashed by their string form, so ``1`` in an integer column and
+    ``"1"`` in a text column compare equal, as they do in the detail views.
+    Missing cells are hashed as the string ``"nan"``: pandas' string dtype
+    keeps them missing through ``astype(str)``, and missing values would
+    otherwise hash differently with and without ``categorize``.
+    ``categorize`` factorizes each column before hashing, which pays off for
+    repetitive values but is a wasted pass over near-unique ones such as
+    keys; the hashes are the same either way.
+    """
+    return pd.util.hash_pandas_object(
+        df[columns].astype(str).fillna("nan"), index=False, categorize=categorize
+    )
+
+
+def _composite_keys(df: pd.DataFrame, keys: list) -> pd.Series:
+    """Join ``keys`` into one '|'-separated string per row."""
+    return df[keys].astype(str).agg("|".join, axis=1)
 
-def _compute_hashes(df: pd.DataFrame, columns: list) -> pd.Series:
-    """Compute row hashes using apply."""
-    return df.apply(lambda row: _compute_row_hash(row, columns), axis=1)
+
+def _unique_last(key_h: np.ndarray, val_h: np.ndarray):
+    """Sort key hashes and drop duplicates, keeping the last row seen per key.
+
+    A stable argsort keeps equal keys in file order, so the last entry of each
+    run is the last occurrence. Unique keys (the common case) skip the
+    dedup mask entirely.
+    """
+    order = np.argsort(key_h, kind="stable")
+    key_h = key_h[order]
+    val_h = val_h[order]
+    if len(key_h) < 2:
+        return key_h, val_h
+    last = np.empty(len(key_h), dtype=bool)
+    np.not_equal(key_h[1:], key_h[:-1], out=last[:-1])
+    last[-1] = True
+    if last.all():
+        return key_h, val_h
+    return key_h[last], val_h[last]
+
+
+def _build_index(
+    df: pd.DataFrame, keys: tuple, compare_cols: tuple, raw_int_key: bool = True
+) -> Tuple[int, np.ndarray, np.ndarray, bool]:
+    """Build the (row count, sorted keys, value hashes, raw flag) index of a frame."""
+    key_series = df[keys[0]]
+    is_raw = raw_int_key and len(keys) == 1 and key_series.dtype.kind in "iu"
+    if is_raw:
+        # Integer ids are their own perfect hash; skip hashing the key.
+        key_h = key_series.to_numpy().astype(np.int64, copy=False)
+    else:
+        key_h = _compute_hashes(df, list(keys), categorize=False).to_numpy()
+    key_h, val_h = _unique_last(key_h, _compute_hashes(df, list(compare_cols)).to_numpy())
+    key_h.setflags(write=False)
+    val_h.setflags(write=False)
+    return len(df), key_h, val_h, is_raw
+
+
+@lru_cache(maxsize=16)
+def _hash_index_cached(
+    real_path: str,
+    mtime_ns: int,
+    size: int,
+    keys: tuple,
+    compare_cols: tuple,
+    usecols: Optional[tuple],
+    raw_int_key: bool,
+) -> Tuple[int, np.ndarray, np.ndarray, bool]:
+    """Build the sorted key/value-hash index for one file fingerprint."""
+    df = read_csv(real_path, usecols=usecols) if usecols else read_csv(real_path)
+    return _build_index(df, keys, compare_cols, raw_int_key)
+
+
+def _hash_index(
+    path: str,
+    keys: tuple,
+    compare_cols: tuple,
+    usecols: Optional[tuple],
+    raw_int_key: bool = True,
+) -> Tuple[int, np.ndarray, np.ndarray, bool]:
+    """Return (row count, sorted unique keys, value hashes, raw flag) for a CSV.
+
+    A single integer key column is indexed by its raw values rather than a
+    hash (flag True). Indexes are memoized on (real path, mtime, size,
+    columns), so repeated comparisons against an unchanged file skip both
+    parsing and hashing.
+    """
+    st = os.stat(path)
+    return _hash_index_cached(
+        os.path.realpath(path),
+        st.st_mtime_ns,
+        st.st_size,
+        keys,
+        compare_cols,
+        usecols,
+        raw_int_key,
+    )
+
+
+def _probe_sorted(
+    keys_a: np.ndarray, vals_a: np.ndarray, keys_b: np.ndarray, vals_b: np.ndarray
+):
+    """Locate each B key in sorted, unique A keys.
+
+    Returns:
+        Tuple of (mask over B of keys present in A, mask over those of equal values).
+    """
+    if len(keys_a) == 0:
+        return np.zeros(len(keys_b), dtype=bool), np.zeros(0, dtype=bool)
+    pos = np.searchsorted(keys_a, keys_b)
+    np.minimum(pos, len(keys_a) - 1, out=pos)
+    found = keys_a[pos] == keys_b
+    same = vals_a[pos[found]] == vals_b[found]
+    return found, same
+
+
+def _parse_columns(key_columns: str, compare_columns: str, columns_a: list):
+    """Split key/compare column specs; compare defaults to all non-key columns of A."""
+    keys = [k.strip() for k in key_columns.split(",")]
+    if compare_columns:
+        compare_cols = [c.strip() for c in compare_columns.split(",")]
+    else:
+        compare_cols = [c for c in columns_a if c not in keys]
+    return keys, compare_cols
+
+
+def _validate_columns(columns: list, columns_a, columns_b) -> None:
+    """Raise ValueError naming the first column missing from either source."""
+    for col in columns:
+        if col not in columns_a:
+            raise ValueError(f"Column '{col}' not found in source A")
+        if col not in columns_b:
+            raise ValueError(f"Column '{col}' not found in source B")
+
+
+def _compare_statistics(index_a: tuple, index_b: tuple) -> Dict[str, Any]:
+    """Probe two indexes built in the same key mode and summarise the result."""
+    _, keys_a, vals_a, _ = index_a
+    _, keys_b, vals_b, _ = index_b
+
+    found, same = _probe_sorted(keys_a, vals_a, keys_b, vals_b)
+    common = int(found.sum())
+    matches = int(same.sum())
+    conflicts = common - matches
+    orphans_in_a = len(keys_a) - common
+    orphans_in_b = len(keys_b) - common
+
+    return {
+        "orphans_only_in_source_a": orphans_in_a,
+        "orphans_only_in_source_b": orphans_in_b,
+        "total_orphans": orphans_in_a + orphans_in_b,
+        "conflicts": conflicts,
+        "exact_matches": matches,
+        "match_rate_percent": round(matches / max(common, 1) * 100, 2),
+    }
 
 
 def compare_hashes(
@@ -39,56 +188,74 @@ def compare_hashes(
     Returns:
         Dict with source info, key/compare columns, and statistics.
     """
-    df_a = read_csv(source_a_path)
-    df_b = read_csv(source_b_path)
-
-    keys = [k.strip() for k in key_columns.split(",")]
-    if compare_columns:
-        compare_cols = [c.strip() for c in compare_columns.split(",")]
-    else:
-        compare_cols = [c for c in df_a.columns if c not in keys]
+    # Validate against the headers before parsing any data rows
+    header_a, header_b = (
+        list(df.columns) for df in read_csvs(source_a_path, source_b_path, nrows=0)
+    )
+
+    keys, compare_cols = _parse_columns(key_columns, compare_columns, header_a)
+    _validate_columns(keys + compare_cols, header_a, header_b)
+
+    # Only parse the columns we hash; full reads stay shareable via the frame cache
+    needed = tuple(dict.fromkeys(keys + compare_cols))
+    usecols = needed if len(needed) < max(len(header_a), len(header_b)) else None
+
+    index_a, index_b = map_concurrent(
+        lambda p: _hash_index(p, tuple(keys), tuple(compare_cols), usecols),
+        (source_a_path, source_b_path),
+    )
+    if index_a[3] != index_b[3]:
+        # Only one side has an integer key; compare both on key hashes.
+        index_a, index_b = (
+            _hash_index(p, tuple(keys), tuple(compare_cols), usecols, raw_int_key=False)
+            for p in (source_a_path, source_b_path)
+        )
 
-    # Validate columns
-    for col in keys + compare_cols:
-        if col not in df_a.columns:
-            raise ValueError(f"Column '{col}' not found in source A")
-        if col not in df_b.columns:
-            raise ValueError(f"Column '{col}' not found in source B")
+    return {
+        "source_a": {"path": source_a_path, "total_rows": index_a[0]},
+        "source_b": {"path": source_b_path, "total_rows": index_b[0]},
+        "key_columns": keys,
+        "compare_columns": compare_cols,
+        "statistics": _compare_statistics(index_a, index_b),
+    }
 
-    # Composite keys
-    df_a["_composite_key"] = df_a[keys].astype(str).agg("|".join, axis=1)
-    df_b["_composite_key"] = df_b[keys].astype(str).agg("|".join, axis=1)
 
-    # Value hashes
-    df_a["_value_hash"] = _compute_hashes(df_a, compare_cols)
-    df_b["_value_hash"] = _compute_hashes(df_b, compare_cols)
+def compare_hashes_df(
+    df_a: pd.DataFrame,
+    df_b: pd.DataFrame,
+    key_columns: str,
+    compare_columns: str = "",
+) -> Dict[str, Any]:
+    """Compare two already-loaded DataFrames by hashing rows.
 
-    keys_a = set(df_a["_composite_key"])
-    keys_b = set(df_b["_composite_key"])
+    Same as :func:`compare_hashes`, for callers that already hold both
+    sources in memory. The ``source_a``/``source_b`` entries carry only
+    ``total_rows``.
 
-    orphans_in_a = keys_a - keys_b
-    orphans_in_b = keys_b - keys_a
-    common_keys = keys_a & keys_b
+    Args:
+        df_a: First DataFrame (source of truth).
+        df_b: Second DataFrame (target).
+        key_columns: Comma-separated column names that uniquely identify a row.
+        compare_columns: Optional comma-separated columns to compare. Defaults to all non-key.
 
-    hash_map_a = df_a.set_index("_composite_key")["_value_hash"].to_dict()
-    hash_map_b = df_b.set_index("_composite_key")["_value_hash"].to_dict()
+    Returns:
+        Dict with source info, key/compare columns, and statistics.
+    """
+    keys, compare_cols = _parse_columns(key_columns, compare_columns, list(df_a.columns))
+    _validate_columns(keys + compare_cols, df_a.columns, df_b.columns)
 
-    conflicts = [k for k in common_keys if hash_map_a[k] != hash_map_b[k]]
-    matches = [k for k in common_keys if hash_map_a[k] == hash_map_b[k]]
+    index_a = _build_index(df_a, tuple(keys), tuple(compare_cols))
+    index_b = _build_index(df_b, tuple(keys), tuple(compare_cols))
+    if index_a[3] != index_b[3]:
+        index_a = _build_index(df_a, tuple(keys), tuple(compare_cols), raw_int_key=False)
+        index_b = _build_index(df_b, tuple(keys), tuple(compare_cols), raw_int_key=False)
 
     return {
-        "source_a": {"path": source_a_path, "total_rows": len(df_a)},
-        "source_b": {"path": source_b_path, "total_rows": len(df_b)},
+        "source_a": {"total_rows": index_a[0]},
+        "source_b": {"total_rows": index_b[0]},
         "key_columns": keys,
         "compare_columns": compare_cols,
-        "statistics": {
-            "orphans_only_in_source_a": len(orphans_in_a),
-            "orphans_only_in_source_b": len(orphans_in_b),
-            "total_orphans": len(orphans_in_a) + len(orphans_in_b),
-            "conflicts": len(conflicts),
-            "exact_matches": len(matches),
-            "match_rate_percent": round(len(matches) / max(len(common_keys), 1) * 100, 2),
-        },
+        "statistics": _compare_statistics(index_a, index_b),
     }
 
 
@@ -111,29 +278,50 @@ def get_orphan_details(
     Returns:
         Dict with orphan records and counts.
     """
-    df_a = read_csv(source_a_path)
-    df_b = read_csv(source_b_path)
+    df_a, df_b = read_csvs(source_a_path, source_b_path)
+    return get_orphan_details_df(df_a, df_b, key_columns, orphan_source, limit)
+
+
+def get_orphan_details_df(
+    df_a: pd.DataFrame,
+    df_b: pd.DataFrame,
+    key_columns: str,
+    orphan_source: str = "both",
+    limit: int = 10,
+) -> Dict[str, Any]:
+    """Retrieve details of orphan records from already-loaded DataFrames.
+
+    Same as :func:`get_orphan_details`; the input frames are not modified.
+
+    Args:
+        df_a: First DataFrame.
+        df_b: Second DataFrame.
+        key_columns: Comma-separated key column names.
+        orphan_source: Which orphans to return: 'a', 'b', or 'both'.
+        limit: Maximum orphans per source.
+
+    Returns:
+        Dict with orphan records and counts.
+    """
     keys = [k.strip() for k in key_columns.split(",")]
 
-    df_a["_composite_key"] = df_a[keys].astype(str).agg("|".join, axis=1)
-    df_b["_composite_key"] = df_b[keys].astype(str).agg("|".join, axis=1)
+    composite_a = _composite_keys(df_a, keys)
+    composite_b = _composite_keys(df_b, keys)
 
-    keys_a = set(df_a["_composite_key"])
-    keys_b = set(df_b["_composite_key"])
+    keys_a = set(composite_a)
+    keys_b = set(composite_b)
 
     result: Dict[str, Any] = {"orphan_source": orphan_source}
 
     if orphan_source in ["a", "both"]:
-        orphans_a = df_a[df_a["_composite_key"].isin(keys_a - keys_b)]
-        orphans_a = orphans_a.drop(columns=["_composite_key"])
+        orphans_a = df_a[composite_a.isin(keys_a - keys_b)]
         result["orphans_in_a"] = {
             "total": len(orphans_a),
             "sample": orphans_a.head(limit).to_dict(orient="records"),
         }
 
     if orphan_source in ["b", "both"]:
-        orphans_b = df_b[df_b["_composite_key"].isin(keys_b - keys_a)]
-        orphans_b = orphans_b.drop(columns=["_composite_key"])
+        orphans_b = df_b[composite_b.isin(keys_b - keys_a)]
         result["orphans_in_b"] = {
             "total": len(orphans_b),
             "sample": orphans_b.head(limit).to_dict(orient="records"),
@@ -158,13 +346,36 @@ def get_conflict_details(
         compare_columns: Optional comma-separated columns to compare.
         limit: Maximum conflicts to return.
 
+    Returns:
+        Dict with conflict details including per-column diffs.
+    """
+    df_a, df_b = read_csvs(source_a_path, source_b_path)
+    return get_conflict_details_df(df_a, df_b, key_columns, compare_columns, limit)
+
+
+def get_conflict_details_df(
+    df_a: pd.DataFrame,
+    df_b: pd.DataFrame,
+    key_columns: str,
+    compare_columns: str = "",
+    limit: int = 10,
+) -> Dict[str, Any]:
+    """Retrieve conflicting records from already-loaded DataFrames.
+
+    Same as :func:`get_conflict_details`; the input frames are not modified.
+
+    Args:
+        df_a: First DataFrame.
+        df_b: Second DataFrame.
+        key_columns: Comma-separated key column names.
+        compare_columns: Optional comma-separated columns to compare.
+        limit: Maximum conflicts to return.
+
     Returns:
         Dict with conflict details including per-column diffs.
     """
     from .differ import compute_similarity, get_opcodes, explain_diff
 
-    df_a = read_csv(source_a_path)
-    df_b = read_csv(source_b_path)
     keys = [k.strip() for k in key_columns.split(",")]
 
     if compare_columns:
@@ -172,22 +383,19 @@ def get_conflict_details(
     else:
         compare_cols = [c for c in df_a.columns if c not in keys]
 
-    df_a["_composite_key"] = df_a[keys].astype(str).agg("|".join, axis=1)
-    df_b["_composite_key"] = df_b[keys].astype(str).agg("|".join, axis=1)
-
-    df_a["_value_hash"] = _compute_hashes(df_a, compare_cols)
-    df_b["_value_hash"] = _compute_hashes(df_b, compare_cols)
+    composite_a = _composite_keys(df_a, keys)
+    composite_b = _composite_keys(df_b, keys)
 
-    hash_map_a = df_a.set_index("_composite_key")["_value_hash"].to_dict()
-    hash_map_b = df_b.set_index("_composite_key")["_value_hash"].to_dict()
+    hash_map_a = dict(zip(composite_a, _compute_hashes(df_a, compare_cols)))
+    hash_map_b = dict(zip(composite_b, _compute_hashes(df_b, compare_cols)))
 
-    common_keys = set(df_a["_composite_key"]) & set(df_b["_composite_key"])
+    common_keys = set(composite_a) & set(composite_b)
     conflict_keys = [k for k in common_keys if hash_map_a.get(k) != hash_map_b.get(k)]
 
     conflicts = []
     for key in list(conflict_keys)[:limit]:
-        row_a = df_a[df_a["_composite_key"] == key].iloc[0]
-        row_b = df_b[df_b["_composite_key"] == key].iloc[0]
+        row_a = df_a[composite_a == key].iloc[0]
+        row_b = df_b[composite_b == key].iloc[0]
 
         diff_cols = []
         for col in compare_cols:
@@ -4,6 +4,8 @@ from typing import Any, Dict, List
 
 import pandas as pd
 
+from .._io import read_csvs
+
 
 def merge_sources(
     source_a_path: str,
@@ -26,8 +28,7 @@ def merge_sources(
     Returns:
         Dict with merge statistics and preview.
     """
-    df_a = pd.read_csv(source_a_path)
-    df_b = pd.read_csv(source_b_path)
+    df_a, df_b = read_csvs(source_a_path, source_b_path)
     keys = [k.strip() for k in key_columns.split(",")]
 
     merged = pd.merge(df_a, df_b, on=keys, how=merge_type, suffixes=("_a", "_b"))
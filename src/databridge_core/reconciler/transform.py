@@ -5,7 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-import pandas as pd
+from .._io import read_csv
 
 
 _OPERATIONS = {"upper", "lower", "strip", "trim_spaces", "remove_special"}
@@ -32,7 +32,7 @@ def transform_column(
     Raises:
         ValueError: If column is missing or operation is unknown.
     """
-    df = pd.read_csv(Path(source_path))
+    df = read_csv(str(source_path))
 
     if column not in df.columns:
         raise ValueError(f"Column '{column}' not found")
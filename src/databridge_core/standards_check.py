@@ -18,9 +18,12 @@ __all__ = ["check_standards", "check_standards_batch"]
 import csv
 import re
 from collections import Counter
+from functools import partial
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ._batch import list_files, map_files
+
 # ---------------------------------------------------------------------------
 # Standards rules
 # ---------------------------------------------------------------------------
@@ -392,6 +395,7 @@ def check_standards_batch(
     directory: str = "data/COA_Training/accounting_standards",
     target_standard: Optional[str] = None,
     limit: int = 0,
+    workers: int = 1,
 ) -> Dict[str, Any]:
     """Check all COA files in a directory for standards compliance.
 
@@ -399,6 +403,7 @@ def check_standards_batch(
         directory: Path to directory with COA files.
         target_standard: Override standard for all files (auto-detect if None).
         limit: Max files to process (0 = unlimited).
+        workers: Worker processes for batches of 8+ files (default 1: in-process).
 
     Returns:
         Dict with summary across all files.
@@ -407,9 +412,9 @@ def check_standards_batch(
     if not dir_path.exists():
         return {"error": f"Directory not found: {directory}"}
 
-    files = sorted(dir_path.glob("STANDARDS_*.csv"))
+    files = list_files(directory, "STANDARDS_*.csv")
     if not files:
-        files = sorted(dir_path.glob("*.csv"))
+        files = list_files(directory, "*.csv")
     if limit:
         files = files[:limit]
 
@@ -419,8 +424,8 @@ def check_standards_batch(
     non_compliant = []
     total_score = 0
 
-    for f in files:
-        result = check_standards(str(f), target_standard=target_standard)
+    check = partial(check_standards, target_standard=target_standard)
+    for result in map_files(check, files, workers):
         n = result.get("findings_count", 0)
         total_findings += n
         total_score += result.get("compliance_score", 100)
@@ -43,15 +43,19 @@ def scan_and_classify(
     max_workers: int = 4,
     deep_scan: bool = False,
     progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    use_processes: bool = False,
 ) -> Dict[str, Any]:
     """Scan all Excel files in *directory*, classify by archetype, write reports.
 
     Args:
         directory: Path to directory containing Excel files.
         output_dir: Where to write triage_report.jsonl and triage_summary.json.
-        max_workers: Thread pool size for concurrent scanning.
+        max_workers: Number of worker threads (or processes) for concurrent scanning.
         deep_scan: If True, also run full BLCE ExcelLogicExtractor per file.
         progress_callback: Optional ``callback(completed, total, filename)`` for progress.
+        use_processes: Scan batches of 8+ files on worker processes instead of
+            threads. Scripts must guard their entry point with
+            ``if __name__ == "__main__"``.
 
     Returns:
         Dict with ``summary`` (aggregate stats) and ``sample_results`` (first 10 files).
@@ -59,7 +63,9 @@ def scan_and_classify(
     t0 = time.time()
 
     # 1. Scan
-    scanner = BatchExcelScanner(max_workers=max_workers, deep_scan=deep_scan)
+    scanner = BatchExcelScanner(
+        max_workers=max_workers, deep_scan=deep_scan, use_processes=use_processes
+    )
     results = scanner.scan_directory(directory, progress_callback=progress_callback)
 
     # 2. Classify
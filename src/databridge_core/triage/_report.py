@@ -126,11 +126,13 @@ class ReportGenerator:
     # ------------------------------------------------------------------
 
     def _write_jsonl(self, results: List[FileTriageResult], path: Path) -> None:
-        """Write one JSON object per line."""
+        """Write one JSON object per line.
+
+        Lines come straight from Pydantic's compiled serializer, skipping the
+        intermediate dict and the pure-Python ``json`` encoder.
+        """
         with open(path, "w", encoding="utf-8") as f:
-            for r in results:
-                line = r.model_dump(mode="json")
-                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+            f.writelines(r.model_dump_json() + "\n" for r in results)
 
     def _write_summary(self, report: BatchTriageReport, path: Path) -> None:
         """Write the full report (without per-file results) as pretty JSON."""
@@ -2,7 +2,9 @@
 
 Scans Excel files for structural metadata (sheet counts, formula counts,
 named ranges, macros) without full formula decomposition. Uses
-read_only=True for streaming speed and ThreadPoolExecutor for concurrency.
+read_only=True for streaming speed and threads for concurrency; callers whose
+entry point is import-safe can opt in to a process pool, which parallelises
+openpyxl's GIL-bound XML parsing.
 """
 from __future__ import annotations
 
@@ -11,9 +13,11 @@ import os
 import re
 from collections import Counter
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from .._batch import PROCESS_MIN_FILES, map_files
 from ._types import (
     Archetype,
     FileTriageResult,
@@ -42,21 +46,49 @@ _MAX_ANCHOR_ROWS = 20
 _MAX_ANCHOR_COLS = 20
 
 
+def _error_result(file_path: Path, message: str) -> FileTriageResult:
+    return FileTriageResult(
+        file_path=str(file_path),
+        file_name=file_path.name,
+        file_extension=file_path.suffix.lower(),
+        scan_status=ScanStatus.ERROR,
+        error_message=message,
+    )
+
+
+def _scan_one(file_path: str, deep_scan: bool) -> FileTriageResult:
+    """Scan one file in a worker process (module level so it can be pickled)."""
+    try:
+        return BatchExcelScanner(max_workers=1, deep_scan=deep_scan).scan_file(file_path)
+    except Exception as exc:
+        return _error_result(Path(file_path), f"Unexpected worker error: {exc}")
+
+
 class BatchExcelScanner:
     """Scan Excel files for triage metadata.
 
     Parameters
     ----------
     max_workers : int
-        Number of threads for concurrent scanning (default 4).
+        Number of worker threads for concurrent scanning (default 4).
     deep_scan : bool
         If True, deep scan fields are populated (no-op in databridge-core;
         BLCE ExcelLogicExtractor is only available in the full DataBridge).
+    use_processes : bool
+        If True, batches of 8 or more files are scanned on ``max_workers``
+        worker processes instead of threads. Scripts must then guard their
+        entry point with ``if __name__ == "__main__"`` (default False).
     """
 
-    def __init__(self, max_workers: int = 4, deep_scan: bool = False) -> None:
+    def __init__(
+        self,
+        max_workers: int = 4,
+        deep_scan: bool = False,
+        use_processes: bool = False,
+    ) -> None:
         self.max_workers = max_workers
         self.deep_scan = deep_scan
+        self.use_processes = use_processes
 
     # ------------------------------------------------------------------
     # Public API
@@ -91,6 +123,9 @@ class BatchExcelScanner:
         if total == 0:
             return results
 
+        if self.use_processes and self.max_workers > 1 and total >= PROCESS_MIN_FILES:
+            return self._scan_in_processes(files, progress_callback)
+
         with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
             futures = {pool.submit(self.scan_file, str(f)): f for f in files}
             for idx, future in enumerate(as_completed(futures), 1):
@@ -98,19 +133,36 @@ class BatchExcelScanner:
                 try:
                     result = future.result()
                 except Exception as exc:
-                    result = FileTriageResult(
-                        file_path=str(file_path),
-                        file_name=file_path.name,
-                        file_extension=file_path.suffix.lower(),
-                        scan_status=ScanStatus.ERROR,
-                        error_message=f"Unexpected thread error: {exc}",
-                    )
+                    result = _error_result(file_path, f"Unexpected thread error: {exc}")
                 results.append(result)
                 if progress_callback:
                     progress_callback(idx, total, file_path.name)
 
         return results
 
+    def _scan_in_processes(
+        self,
+        files: List[Path],
+        progress_callback: Optional[Callable[[int, int, str], None]],
+    ) -> List[FileTriageResult]:
+        """Scan *files* on a process pool via :func:`map_files`, in order.
+
+        Files the pool cannot handle (no worker processes on this platform,
+        or a pool that breaks mid-run) are scanned in-process instead.
+        """
+        total = len(files)
+        progress = None
+        if progress_callback:
+            def progress(done: int, path: str) -> None:
+                progress_callback(done, total, Path(path).name)
+
+        return map_files(
+            partial(_scan_one, deep_scan=self.deep_scan),
+            [str(f) for f in files],
+            workers=self.max_workers,
+            progress=progress,
+        )
+
     def scan_file(self, file_path: str) -> FileTriageResult:
         """Scan a single Excel file and return its triage metadata."""
         path = Path(file_path)
@@ -1,5 +1,7 @@
 """Tests for the CLI module."""
 
+import sys
+
 from click.testing import CliRunner
 
 from databridge_core.cli import cli
@@ -41,6 +43,17 @@ class TestCli:
         assert "Comparison" in result.output
         assert "Match rate" in result.output
 
+    def test_compare_json(self, customers_a, customers_b):
+        import json
+
+        result = self.runner.invoke(cli, [
+            "--json", "compare", customers_a, customers_b, "--keys", "id"
+        ])
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["key_columns"] == ["id"]
+        assert "match_rate_percent" in data["statistics"]
+
     def test_drift_no_drift(self, customers_a, customers_b):
         result = self.runner.invoke(cli, ["drift", customers_a, customers_b])
         assert result.exit_code == 0
@@ -65,7 +78,54 @@ class TestCli:
         assert result.exit_code == 0
         assert "Found" in result.output
 
+    def test_find_nested(self, tmp_path, monkeypatch):
+        from databridge_core.files import find_files
+
+        (tmp_path / "data" / "2024").mkdir(parents=True)
+        (tmp_path / "data" / "2024" / "Ledger_Q1.csv").write_text("a\n1\n")
+        (tmp_path / "notes.txt").write_text("x")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("HOME", str(tmp_path / "data"))
+        result = find_files("*.csv", "ledger")
+        assert result["files_found"] == 1
+        found = result["files"][0]
+        assert found["name"] == "Ledger_Q1.csv"
+        assert found["directory"] == str(tmp_path / "data" / "2024")
+
     def test_parse(self):
         result = self.runner.invoke(cli, ["parse", "Name\tAge\nAlice\t30"])
         assert result.exit_code == 0
         assert "Parsed" in result.output
+
+    def test_diff_ignores_line_endings(self, tmp_path):
+        lf = tmp_path / "lf.txt"
+        crlf = tmp_path / "crlf.txt"
+        lf.write_bytes(b"a\nb\n")
+        crlf.write_bytes(b"a\r\nb\r\n")
+        result = self.runner.invoke(cli, ["diff", str(lf), str(crlf)])
+        assert result.exit_code == 0
+        assert "identical" in result.output
+
+    def test_diff_large_files_via_mmap(self, tmp_path, monkeypatch):
+        from databridge_core import cli as cli_module
+
+        monkeypatch.setattr(cli_module, "_MMAP_MIN_BYTES", 1)
+        a = tmp_path / "a.txt"
+        b = tmp_path / "b.txt"
+        a.write_bytes("id,name\r\n1,caf\u00e9\r\n".encode())
+        b.write_bytes("id,name\n1,cafe\n".encode())
+        result = self.runner.invoke(cli, ["diff", str(a), str(b)])
+        assert result.exit_code == 0
+        assert "-1,caf\u00e9" in result.output
+        assert "+1,cafe" in result.output
+
+    def test_triage_requires_openpyxl(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(sys.modules, "openpyxl", None)
+        result = self.runner.invoke(cli, ["triage", str(tmp_path)])
+        assert result.exit_code == 1
+        assert "pip install 'databridge-core[triage]'" in result.output
+
+    def test_parse_ragged_rows(self):
+        result = self.runner.invoke(cli, ["parse", "a|b|c\n1|2\n3|4|5", "-d", "pipe"])
+        assert result.exit_code == 0
+        assert "Parsed 2 rows" in result.output
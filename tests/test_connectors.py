@@ -0,0 +1,90 @@
+"""Tests for the local DuckDB connector."""
+
+import pytest
+
+pytest.importorskip("duckdb")
+
+from databridge_core.connectors import export_to_parquet, query_local  # noqa: E402
+
+
+class TestQueryLocal:
+    def test_preview_and_count(self, customers_a):
+        result = query_local("SELECT * FROM src ORDER BY id;", {"src": customers_a},
+                             max_preview_rows=2)
+        assert result["rows_returned"] == 10
+        assert len(result["preview"]) == 2
+        assert result["truncated"] is True
+        assert result["columns"][0] == "id"
+
+    def test_trailing_comment(self):
+        result = query_local("SELECT 42 AS answer -- the answer")
+        assert result["preview"] == [{"answer": 42}]
+        assert result["truncated"] is False
+
+    def test_statement_not_wrapped(self):
+        query_local("CREATE OR REPLACE TABLE t AS SELECT * FROM range(3)")
+        result = query_local("DESCRIBE t")
+        assert result["rows_returned"] == 1
+
+    def test_multiple_statements_return_last_result(self):
+        result = query_local("SELECT 1; SELECT * FROM range(5) t(x);", max_preview_rows=2)
+        assert result["rows_returned"] == 5
+        assert result["columns"] == ["x"]
+        assert result["truncated"] is True
+
+    def test_empty_result(self):
+        result = query_local("SELECT * FROM range(5) t(x) WHERE x > 10")
+        assert result["rows_returned"] == 0
+        assert result["columns"] == ["x"]
+        assert result["preview"] == []
+
+
+class TestExportToParquet:
+    def test_row_count_from_copy(self, tmp_path):
+        out = tmp_path / "out" / "range.parquet"
+        result = export_to_parquet("SELECT * FROM range(1234)", str(out))
+        assert result["row_count"] == 1234
+        assert out.exists()
+
+
+class TestConnectionPool:
+    def test_views_shared_across_threads(self, customers_a):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from databridge_core.connectors import register_table
+
+        register_table(customers_a, "pooled")
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(
+                lambda _: query_local("SELECT COUNT(*) AS n FROM pooled"), range(8)
+            ))
+        assert all(r["preview"] == [{"n": 10}] for r in results)
+
+    def test_first_use_from_threads_shares_one_database(self, monkeypatch):
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from databridge_core.connectors import duckdb_local
+
+        monkeypatch.setattr(duckdb_local, "_db", None)
+        monkeypatch.setattr(duckdb_local, "_idle", duckdb_local.queue.Queue())
+        start = threading.Barrier(8)
+
+        def first_use(_):
+            start.wait()
+            return duckdb_local._get_db()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            dbs = list(pool.map(first_use, range(8)))
+        assert all(db is dbs[0] for db in dbs)
+
+
+class TestRegisterTable:
+    def test_table_name_with_quote(self, customers_a):
+        from databridge_core.connectors import list_tables, register_table
+
+        result = register_table(customers_a, 'cust"omers')
+        assert result["row_count"] == 10
+        names = [t["table_name"] for t in list_tables()["tables"]]
+        assert 'cust"omers' in names
+
@@ -128,6 +128,20 @@ class TestErpDetect:
         assert result["total_files"] == 3
         assert "erp_distribution" in result
 
+    def test_detect_erp_batch_workers_match_sequential(self, tmp_path):
+        from databridge_core.erp_detect import detect_erp_batch
+
+        for i in range(10):
+            path = tmp_path / f"file_{i}.csv"
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["BUKRS", "SAKNR", "TXT50"] if i % 2 else ["foo", "bar"])
+                writer.writerow(["1000", "400000", "Revenue"] if i % 2 else ["1", "2"])
+
+        parallel = detect_erp_batch(str(tmp_path), workers=2)
+        assert parallel == detect_erp_batch(str(tmp_path), workers=1)
+        assert parallel["total_files"] == 10
+
     def test_detect_erp_batch_nonexistent(self):
         from databridge_core.erp_detect import detect_erp_batch
 
@@ -551,6 +565,24 @@ class TestStandardsCheck:
         assert result["total_files"] == 3
         assert "avg_compliance_score" in result
 
+    def test_check_standards_batch_workers(self, tmp_path):
+        from databridge_core.standards_check import check_standards_batch
+
+        fieldnames = ["Account_ID", "Account_Name", "Account_Type", "Standard_Reference"]
+        for i in range(8):
+            path = tmp_path / f"coa_{i}.csv"
+            rows = [{
+                "Account_ID": f"{i}000",
+                "Account_Name": "Cash",
+                "Account_Type": "Asset",
+                "Standard_Reference": "",
+            }]
+            self._write_csv(path, rows, fieldnames)
+
+        result = check_standards_batch(str(tmp_path), target_standard="IFRS", workers=2)
+        assert result == check_standards_batch(str(tmp_path), target_standard="IFRS", workers=1)
+        assert result["total_files"] == 8
+
     def test_check_standards_batch_nonexistent(self):
         from databridge_core.standards_check import check_standards_batch
 
@@ -590,6 +622,127 @@ class TestStandardsCheck:
 # ============================================================================
 
 
+class TestDetectionFeedback:
+    def test_stats_follow_appended_feedback(self, tmp_path):
+        from databridge_core.detection._feedback import get_detection_stats, record_feedback
+
+        path = str(tmp_path / "feedback.jsonl")
+        meta = {"rule_id": "rule_1", "finding_type": "custom"}
+        record_feedback("f1", confirmed=True, feedback_path=path, finding_metadata=meta)
+        stats = get_detection_stats(path)
+        assert stats["total_feedback"] == 1
+        assert stats["confirmed"] == 1
+
+        record_feedback("f2", confirmed=False, feedback_path=path, finding_metadata=meta)
+        stats = get_detection_stats(path)
+        assert stats["total_feedback"] == 2
+        assert stats["dismissed"] == 1
+        assert stats["top_rules"][0]["total"] == 2
+
+    def test_summary_reads_only_appended_lines(self, tmp_path):
+        from databridge_core.detection._feedback import _feedback_summary
+
+        path = tmp_path / "feedback.jsonl"
+        line = b'{"rule_id": "r1", "finding_type": "t", "action": "confirmed"}\n'
+        path.write_bytes(line + line[:20])
+        assert _feedback_summary(str(path))[:2] == (1, 1)
+        with open(path, "ab") as f:
+            f.write(line[20:] + line)
+        total, confirmed, tallies = _feedback_summary(str(path))
+        assert (total, confirmed) == (3, 3)
+        assert tallies[("r1", "t")]["total"] == 3
+
+        path.write_bytes(line)
+        assert _feedback_summary(str(path))[:2] == (1, 1)
+
+    def test_filter_suppresses_and_adjusts_per_rule(self, tmp_path):
+        from databridge_core.detection._feedback import (
+            apply_feedback_filter,
+            record_feedback,
+        )
+        from databridge_core.detection._types import GroundedFinding
+
+        path = str(tmp_path / "feedback.jsonl")
+        for i in range(4):
+            record_feedback(f"d{i}", confirmed=False, feedback_path=path,
+                            finding_metadata={"rule_id": "noisy", "finding_type": "custom"})
+        record_feedback("c1", confirmed=True, feedback_path=path,
+                        finding_metadata={"rule_id": "good", "finding_type": "custom"})
+        findings = [
+            GroundedFinding(finding_id=f"f{i}", rule_id=rule, confidence=0.5)
+            for i, rule in enumerate(["noisy", "good", "good", "new"])
+        ]
+        kept = apply_feedback_filter(findings, path, strategy="threshold")
+        assert [f.finding_id for f in kept] == ["f1", "f2", "f3"]
+        assert [f.confidence for f in kept] == [0.55, 0.55, 0.5]
+
+    def test_summary_rereads_file_rewritten_in_place(self, tmp_path):
+        import os
+
+        from databridge_core.detection._feedback import _feedback_summary
+
+        path = tmp_path / "feedback.jsonl"
+        r9 = b'{"rule_id": "R9", "finding_type": "t", "action": "confirmed"}\n'
+        r5 = b'{"rule_id": "R5", "finding_type": "t", "action": "dismissed"}\n'
+        path.write_bytes(r9)
+        assert _feedback_summary(str(path))[0] == 1
+        with open(path, "r+b") as f:
+            f.write(r5 * 3)
+        total, confirmed, tallies = _feedback_summary(str(path))
+        assert (total, confirmed) == (3, 0)
+        assert {key[0]: t["total"] for key, t in tallies.items()} == {"R5": 3}
+
+        # Same size, rewritten in place
+        path.write_bytes(r9 * 3)
+        os.utime(path, ns=(0, 10**9))
+        assert _feedback_summary(str(path))[:2] == (3, 3)
+
+    def test_missing_feedback_file(self, tmp_path):
+        from databridge_core.detection._feedback import get_detection_stats
+
+        stats = get_detection_stats(str(tmp_path / "none.jsonl"))
+        assert stats["total_feedback"] == 0
+
+
+class TestCounterexamples:
+    def test_load_newest_first_skipping_bad_files(self, tmp_path):
+        from databridge_core.detection._counterexamples import load_counterexamples
+
+        for i in range(12):
+            (tmp_path / f"cx_file_{i:02d}.json").write_text(f'{{"n": {i}}}')
+        (tmp_path / "cx_file_99.json").write_text("{")
+        results = load_counterexamples(str(tmp_path), limit=5)
+        assert [r["n"] for r in results] == [11, 10, 9, 8]
+        assert results[0]["_file"] == str(tmp_path / "cx_file_11.json")
+
+
+def _exit_in_worker(path):
+    """Kill any worker process it runs in; return the path in the parent."""
+    import multiprocessing
+    import os
+
+    if multiprocessing.parent_process() is not None:
+        os._exit(1)
+    return path
+
+
+class TestBatchDriver:
+    def test_broken_pool_falls_back_in_process(self):
+        from databridge_core._batch import map_files
+
+        paths = [f"file_{i}.csv" for i in range(10)]
+        done = []
+        results = map_files(_exit_in_worker, paths, workers=2,
+                            progress=lambda n, path: done.append(n))
+        assert results == paths
+        assert done == list(range(1, 11))
+
+    def test_default_runs_in_process(self):
+        from databridge_core._batch import map_files
+
+        assert map_files(_exit_in_worker, ["a"] * 10) == ["a"] * 10
+
+
 class TestImports:
     """Test that all detection functions are accessible from the top-level package."""
 
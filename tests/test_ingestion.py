@@ -1,9 +1,11 @@
 """Tests for the ingestion module."""
 
 import json
+import os
 
 import pytest
 
+from databridge_core._io import read_csv
 from databridge_core.ingestion import load_csv, load_json, parse_table_from_text
 
 
@@ -31,6 +33,126 @@ class TestLoadCsv:
         with pytest.raises(FileNotFoundError):
             load_csv("/nonexistent/path/to/file.csv")
 
+    def test_preview_only(self, customers_a):
+        result = load_csv(customers_a, preview_rows=3, preview_only=True)
+        assert result["columns"] == ["id", "name", "email", "city", "balance"]
+        assert len(result["preview"]) == 3
+        assert result["preview"][0]["name"] == "Alice Johnson"
+        assert "null_counts" not in result
+
+
+    def test_preview_only_drops_surplus_cells(self, tmp_dir):
+        path = tmp_dir / "ragged.csv"
+        path.write_text("a,b\n1,2,3\n4\n")
+        result = load_csv(str(path), preview_only=True)
+        assert result["preview"] == [{"a": "1", "b": "2"}, {"a": "4", "b": None}]
+
+class TestReadCsvCache:
+    def test_returns_independent_copies(self, customers_a):
+        first = read_csv(customers_a)
+        first["extra"] = 1
+        assert "extra" not in read_csv(customers_a).columns
+
+    def test_invalidated_on_change(self, tmp_dir):
+        path = tmp_dir / "data.csv"
+        path.write_text("a,b\n1,2\n")
+        assert len(read_csv(str(path))) == 1
+        path.write_text("a,b\n1,2\n3,4\n")
+        os.utime(path, ns=(0, 10**9))
+        assert len(read_csv(str(path))) == 2
+
+    def test_large_files_not_memoized(self, tmp_dir, monkeypatch):
+        from databridge_core import _io
+
+        path = tmp_dir / "data.csv"
+        path.write_text("a,b\n1,2\n")
+        monkeypatch.setattr(_io, "MEMO_MAX_BYTES", 4)
+        _io._read_csv_cached.cache_clear()
+        assert len(read_csv(str(path))) == 1
+        assert _io._read_csv_cached.cache_info().currsize == 0
+
+    def test_arrow_reader_matches_pandas(self, tmp_dir, monkeypatch):
+        pytest.importorskip("pyarrow")
+        import pandas as pd
+
+        from databridge_core import _io
+
+        path = tmp_dir / "mixed.csv"
+        path.write_text("id,day,amount,name,empty\n1,2024-01-05,1.5,a,\n2,2024-02-01,,,\n")
+        monkeypatch.setattr(_io, "ARROW_MIN_BYTES", 0)
+        pd.testing.assert_frame_equal(read_csv(str(path)), pd.read_csv(path))
+
+    def test_same_values_above_and_below_arrow_threshold(self, tmp_dir):
+        pytest.importorskip("pyarrow")
+        import pandas as pd
+
+        from databridge_core import _io
+
+        header = "id,ts,day,note,flag\n"
+        block = "".join(
+            f"{i},2024-01-{i % 28 + 1:02d}T10:00:00,2024-02-{i % 28 + 1:02d},"
+            f"{('None', 'NA', '<NA>', 'text')[i % 4]},{('True', 'false')[i % 2]}\n"
+            for i in range(100)
+        )
+        small = tmp_dir / "small.csv"
+        small.write_text(header + block)
+        large = tmp_dir / "large.csv"
+        copies = _io.ARROW_MIN_BYTES // len(block) + 1
+        large.write_text(header + block * copies)
+        assert small.stat().st_size < _io.ARROW_MIN_BYTES <= large.stat().st_size
+
+        expected = read_csv(str(small))
+        assert expected["note"].isna().sum() == 75
+        pd.testing.assert_frame_equal(read_csv(str(large)).head(len(expected)), expected)
+
+    def test_duplicate_and_blank_headers_above_arrow_threshold(self, tmp_dir):
+        pytest.importorskip("pyarrow")
+        import pandas as pd
+
+        from databridge_core import _io
+
+        path = tmp_dir / "dupes.csv"
+        path.write_text("id,a,a,\n" + "".join(f"{i},x,y,z\n" for i in range(120000)))
+        assert path.stat().st_size >= _io.ARROW_MIN_BYTES
+        df = read_csv(str(path))
+        assert list(df.columns) == ["id", "a", "a.1", "Unnamed: 3"]
+        pd.testing.assert_frame_equal(df, pd.read_csv(path))
+
+    def test_feather_sidecar(self, tmp_dir, monkeypatch):
+        pytest.importorskip("pyarrow")
+        import pandas as pd
+
+        from databridge_core import _io
+
+        path = tmp_dir / "data.csv"
+        path.write_text("id,name,amount\n1,a,1.5\n2,,\n")
+        monkeypatch.setenv(_io.CACHE_ENV_VAR, "1")
+        _io._read_csv_cached.cache_clear()
+        first = read_csv(str(path))
+        assert (tmp_dir / "data.csv.feather").exists()
+        _io._read_csv_cached.cache_clear()
+        pd.testing.assert_frame_equal(read_csv(str(path)), first)
+        pd.testing.assert_frame_equal(first, pd.read_csv(path))
+
+
+    def test_feather_sidecar_ignored_for_older_replacement(self, tmp_dir, monkeypatch):
+        pytest.importorskip("pyarrow")
+        from databridge_core import _io
+
+        path = tmp_dir / "data.csv"
+        path.write_text("a,b\n1,2\n")
+        os.utime(path, ns=(0, 2 * 10**9))
+        monkeypatch.setenv(_io.CACHE_ENV_VAR, "1")
+        _io._read_csv_cached.cache_clear()
+        read_csv(str(path))
+        assert (tmp_dir / "data.csv.feather").exists()
+
+        # Replaced by a copy carrying an older mtime, as cp -p or rsync -t do
+        path.write_text("a,b\n9,9\n")
+        os.utime(path, ns=(0, 10**9))
+        _io._read_csv_cached.cache_clear()
+        assert read_csv(str(path)).values.tolist() == [[9, 9]]
+        _io._read_csv_cached.cache_clear()
 
 class TestLoadJson:
     def test_array_json(self, tmp_path):
@@ -90,3 +212,9 @@ class TestParseTableFromText:
     def test_empty_text(self):
         with pytest.raises(ValueError, match="No text content"):
             parse_table_from_text("")
+
+    def test_row_count_beyond_preview(self):
+        text = "a  b\n" + "\n".join(f"{i}  x" for i in range(50)) + "\n\n"
+        result = parse_table_from_text(text, max_preview_rows=3)
+        assert result["row_count"] == 50
+        assert result["preview"] == [{"a": str(i), "b": "x"} for i in range(3)]
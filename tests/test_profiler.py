@@ -28,6 +28,19 @@ class TestProfileData:
         assert dq["duplicate_rows"] == 0
         assert dq["duplicate_percentage"] == 0.0
 
+    def test_quick_profile(self, customers_a):
+        result = profile_data(customers_a, quick=True)
+        assert result["rows"] == 10
+        assert result["columns"] == 5
+        assert result["column_names"][0] == "id"
+        assert result["structure_type"] == "Dimension/Reference"
+        assert "potential_key_columns" not in result
+
+    def test_quick_profile_no_trailing_newline(self, tmp_path):
+        path = tmp_path / "t.csv"
+        path.write_text("a,b\n1,2\n3,4")
+        assert profile_data(str(path), quick=True)["rows"] == 2
+
 
 class TestDetectSchemaDrift:
     def test_no_drift(self, customers_a, customers_b):
@@ -4,8 +4,14 @@ import pytest
 
 from databridge_core.reconciler import (
     compare_hashes,
+    compare_hashes_df,
+    fuzzy_deduplicate,
+    fuzzy_match_columns,
+    fuzzy_match_columns_df,
     get_orphan_details,
+    get_orphan_details_df,
     get_conflict_details,
+    get_conflict_details_df,
     merge_sources,
     transform_column,
 )
@@ -33,6 +39,65 @@ class TestCompareHashes:
         with pytest.raises(ValueError, match="not found"):
             compare_hashes(customers_a, customers_b, "nonexistent_col")
 
+    def test_duplicate_keys_last_row_wins(self, tmp_dir):
+        a = tmp_dir / "a.csv"
+        b = tmp_dir / "b.csv"
+        a.write_text("id,name\n1,Old\n1,New\n2,Bob\n")
+        b.write_text("id,name\n1,New\n2,Rob\n")
+        stats = compare_hashes(str(a), str(b), "id")["statistics"]
+        assert stats["exact_matches"] == 1
+        assert stats["conflicts"] == 1
+        assert stats["total_orphans"] == 0
+
+    def test_int_key_against_non_int_key(self, tmp_dir):
+        a = tmp_dir / "a.csv"
+        b = tmp_dir / "b.csv"
+        a.write_text("id,name\n1,Ann\n2,Bob\n")
+        b.write_text("id,name\n1,Ann\nx2,Bob\n")
+        stats = compare_hashes(str(a), str(b), "id")["statistics"]
+        assert stats["exact_matches"] == 1
+        assert stats["orphans_only_in_source_a"] == 1
+        assert stats["orphans_only_in_source_b"] == 1
+
+    def test_missing_cells_hash_alike_with_and_without_categorize(self, tmp_dir):
+        import numpy as np
+        import pandas as pd
+
+        from databridge_core.reconciler.hasher import _compute_hashes
+
+        df = pd.DataFrame({"name": ["Ann", np.nan, None, "Bob"], "amount": [1.5, np.nan, 2.0, 3.0]})
+        cols = ["name", "amount"]
+        assert (_compute_hashes(df, cols) == _compute_hashes(df, cols, categorize=False)).all()
+
+        a = tmp_dir / "a.csv"
+        a.write_text("name,city\nAnn,\n,Oslo\nBob,Rome\n")
+        stats = compare_hashes(str(a), str(a), "name")["statistics"]
+        assert stats["exact_matches"] == 3
+
+    def test_empty_source(self, tmp_dir, customers_b):
+        empty = tmp_dir / "empty.csv"
+        empty.write_text("id,name,email,city,balance\n")
+        stats = compare_hashes(str(empty), customers_b, "id")["statistics"]
+        assert stats["orphans_only_in_source_a"] == 0
+        assert stats["orphans_only_in_source_b"] == 9
+        assert stats["match_rate_percent"] == 0
+
+
+class TestCompareHashesDf:
+    def test_matches_path_variant(self, customers_a, customers_b):
+        import pandas as pd
+
+        by_path = compare_hashes(customers_a, customers_b, "id")
+        by_df = compare_hashes_df(pd.read_csv(customers_a), pd.read_csv(customers_b), "id")
+        assert by_df["statistics"] == by_path["statistics"]
+        assert by_df["source_b"] == {"total_rows": 9}
+
+    def test_invalid_column(self, customers_a, customers_b):
+        import pandas as pd
+
+        with pytest.raises(ValueError, match="not found"):
+            compare_hashes_df(pd.read_csv(customers_a), pd.read_csv(customers_b), "nope")
+
 
 class TestOrphanDetails:
     def test_both_orphans(self, customers_a, customers_b):
@@ -52,6 +117,15 @@ class TestOrphanDetails:
         assert "orphans_in_b" in result
         assert "orphans_in_a" not in result
 
+    def test_df_matches_path_variant(self, customers_a, customers_b):
+        import pandas as pd
+
+        df_a, df_b = pd.read_csv(customers_a), pd.read_csv(customers_b)
+        columns = list(df_a.columns)
+        result = get_orphan_details_df(df_a, df_b, "id")
+        assert result == get_orphan_details(customers_a, customers_b, "id")
+        assert list(df_a.columns) == columns
+
 
 class TestConflictDetails:
     def test_basic_conflicts(self, customers_a, customers_b):
@@ -68,11 +142,73 @@ class TestConflictDetails:
                 assert "value_b" in diff
                 assert "similarity" in diff
 
+    def test_df_matches_path_variant(self, customers_a, customers_b):
+        import pandas as pd
+
+        df_a, df_b = pd.read_csv(customers_a), pd.read_csv(customers_b)
+        columns = list(df_a.columns)
+        result = get_conflict_details_df(df_a, df_b, "id")
+        assert result == get_conflict_details(customers_a, customers_b, "id")
+        assert list(df_a.columns) == columns
+
     def test_conflict_limit(self, customers_a, customers_b):
         result = get_conflict_details(customers_a, customers_b, "id", limit=1)
         assert len(result["conflicts"]) <= 1
 
 
+class TestFuzzyMatch:
+    def test_df_matches_path_variant(self, customers_a, customers_b):
+        pytest.importorskip("rapidfuzz")
+        import pandas as pd
+
+        by_path = fuzzy_match_columns(customers_a, customers_b, "name", "name", threshold=70)
+        by_df = fuzzy_match_columns_df(
+            pd.read_csv(customers_a), pd.read_csv(customers_b), "name", "name", threshold=70
+        )
+        assert by_df == by_path
+        assert by_df["total_matches"] > 0
+
+    def test_preprocess_ignores_case_and_punctuation(self):
+        pytest.importorskip("rapidfuzz")
+        import pandas as pd
+
+        df_a = pd.DataFrame({"name": ["ACME CORP.", "Globex"]})
+        df_b = pd.DataFrame({"name": ["acme corp", "Initech"]})
+        plain = fuzzy_match_columns_df(df_a, df_b, "name", "name", threshold=90)
+        assert plain["total_matches"] == 0
+
+        result = fuzzy_match_columns_df(
+            df_a, df_b, "name", "name", threshold=90, preprocess=True
+        )
+        assert result["total_matches"] == 1
+        match = result["top_matches"][0]
+        assert (match["value_a"], match["value_b"]) == ("ACME CORP.", "acme corp")
+        assert match["similarity"] == 100.0
+
+    def test_deduplicate_groups(self, tmp_dir):
+        pytest.importorskip("rapidfuzz")
+        path = tmp_dir / "vendors.csv"
+        path.write_text("name\nAcme Corp\nAcme Corp.\nGlobex\nAcme Corpp\nInitech\n")
+        result = fuzzy_deduplicate(str(path), "name", threshold=90)
+        assert result["total_groups"] == 1
+        group = result["duplicate_groups"][0]
+        assert group["primary"] == "Acme Corp"
+        assert [v["value"] for v in group["similar_values"]] == ["Acme Corp.", "Acme Corpp"]
+
+    def test_deduplicate_groups_across_blocks(self, tmp_dir, monkeypatch):
+        pytest.importorskip("rapidfuzz")
+        from databridge_core.reconciler import fuzzy
+
+        # A 16-byte budget scores the 5 values in blocks of one row
+        monkeypatch.setattr(fuzzy, "_DEDUP_BLOCK_BYTES", 16)
+        path = tmp_dir / "vendors.csv"
+        path.write_text("name\nAcme Corp\nAcme Corp.\nGlobex\nAcme Corpp\nInitech\n")
+        result = fuzzy_deduplicate(str(path), "name", threshold=90)
+        assert result["total_groups"] == 1
+        group = result["duplicate_groups"][0]
+        assert [v["value"] for v in group["similar_values"]] == ["Acme Corp.", "Acme Corpp"]
+
+
 class TestMergeSources:
     def test_inner_merge(self, customers_a, customers_b):
         result = merge_sources(customers_a, customers_b, "id", "inner")
@@ -92,6 +228,22 @@ class TestMergeSources:
         df = pd.read_csv(output)
         assert len(df) == result["merged_rows"]
 
+    def test_merge_on_timestamp_key_across_reader_threshold(self, tmp_dir):
+        from datetime import datetime, timedelta
+
+        from databridge_core import _io
+
+        start = datetime(2024, 1, 1)
+        stamps = [(start + timedelta(minutes=i)).isoformat() for i in range(60000)]
+        large = tmp_dir / "large.csv"
+        large.write_text("ts,amount\n" + "".join(f"{ts},{i}\n" for i, ts in enumerate(stamps)))
+        small = tmp_dir / "small.csv"
+        small.write_text("ts,note\n" + "".join(f"{ts},n{i}\n" for i, ts in enumerate(stamps[:50])))
+        assert small.stat().st_size < _io.ARROW_MIN_BYTES <= large.stat().st_size
+
+        result = merge_sources(str(small), str(large), "ts", "inner")
+        assert result["merged_rows"] == 50
+
 
 class TestTransformColumn:
     def test_upper(self, customers_a):
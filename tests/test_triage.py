@@ -299,6 +299,33 @@ class TestBatchExcelScanner:
         assert progress_calls[0][0] == 1  # completed
         assert progress_calls[0][1] == 1  # total
 
+    def test_scan_many_files_on_process_pool(self, tmp_path):
+        from databridge_core.triage import BatchExcelScanner
+
+        names = [f"book_{i:02d}.xlsx" for i in range(10)]
+        for name in names:
+            self._create_xlsx(tmp_path / name, {"Sheet": [["A", "B"], [1, 2]]})
+
+        scanner = BatchExcelScanner(max_workers=2, use_processes=True)
+        results = scanner.scan_directory(str(tmp_path))
+
+        assert sorted(r.file_name for r in results) == names
+        assert all(r.scan_status.value == "ok" for r in results)
+
+    def test_scan_many_files_defaults_to_threads(self, tmp_path, monkeypatch):
+        from databridge_core.triage import BatchExcelScanner, _scanner
+
+        for i in range(10):
+            self._create_xlsx(tmp_path / f"book_{i:02d}.xlsx", {"Sheet": [["A"], [1]]})
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool used without opting in")
+
+        monkeypatch.setattr(_scanner, "map_files", no_pool)
+        results = BatchExcelScanner(max_workers=2).scan_directory(str(tmp_path))
+
+        assert len(results) == 10
+
 
 class TestScanAndClassify:
     """Test the high-level scan_and_classify function."""